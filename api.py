@@ -1,19 +1,43 @@
+import asyncio
 import base64
 import io
 import logging
-from datetime import timedelta
-from typing import Annotated, Any
+from collections.abc import AsyncIterator
+from datetime import date, timedelta
+from typing import Annotated, Any, Literal
 
 import jwt
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from pydantic import ValidationError
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from core.conditional import Validator, conditional_response
 from core.config import settings
-from core.security import ALGORITHM, create_access_token, get_password_hash, verify_password
-from db.database import get_db
-from models import User
+from core.pagination import decode_cursor, next_cursor
+from core.ratelimit import load_shedder, rate_limiter
+from core.security import (
+    ALGORITHM,
+    create_access_token,
+    get_password_hash_async,
+    password_needs_rehash,
+    verify_password_async,
+)
+from core.serialization import FastJSONResponse, json_response
+from db.database import get_db, get_read_db, get_session_factory
 from schemas import (
     Application,
     ApplicationCreate,
@@ -21,30 +45,96 @@ from schemas import (
     Job,
     JobCreate,
     JobUpdate,
+    MatchBatchRequest,
+    MatchBatchResult,
     MatchRequest,
     MatchResponse,
     Resume,
     ResumeUpload,
     SkillsGapRequest,
     SkillsGapResponse,
+    SkillTrends,
     Token,
     TokenPayload,
     UserCreate,
 )
 from schemas import User as UserSchema
-from services import job_service, matching_service, resume_service, user_service
+from services import (
+    CollectionVersion,
+    Principal,
+    job_service,
+    matching_service,
+    recommendation_service,
+    resume_artifact_service,
+    resume_service,
+    trend_service,
+    user_service,
+)
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix=settings.API_V1_STR)
+router = APIRouter(prefix=settings.API_V1_STR, default_response_class=FastJSONResponse)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login", auto_error=False)
 
+PageLimit = Annotated[int, Query(ge=1, le=100)]
+
+
+def _validate_cursor(cursor: str | None) -> None:
+    if cursor is None:
+        return
+    try:
+        decode_cursor(cursor)
+    except ValueError as err:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        ) from err
+
+
+def _set_next_page(request: Request, response: Response, rows: list[Any], limit: int) -> None:
+    """Advertise the next page via ``X-Next-Cursor`` and an RFC 8288 ``Link`` header."""
+    cursor = next_cursor(rows, limit)
+    if cursor is None:
+        return
+    response.headers["X-Next-Cursor"] = cursor
+    response.headers["Link"] = f'<{request.url.include_query_params(cursor=cursor)}>; rel="next"'
+
+
+def _entity_validator(request: Request, kind: str, row: Any) -> Validator:
+    modified = row.updated_at or row.created_at
+    parts = (
+        request.url.path,
+        tuple(sorted(request.query_params.multi_items())),
+        kind,
+        row.id,
+        modified,
+    )
+    return Validator.build(parts, modified)
+
+
+def _collection_validator(
+    request: Request, principal: Principal, version: CollectionVersion
+) -> Validator:
+    """Validator for one page of a list; any write to the listed rows changes every page.
+
+    The latest row timestamp does not move when a row is deleted, so it only feeds the
+    ETag; a list carries no ``Last-Modified`` and ``If-Modified-Since`` is never honoured.
+    """
+    parts = (
+        request.url.path,
+        tuple(sorted(request.query_params.multi_items())),
+        principal.id,
+        version.count,
+        version.max_id,
+        version.last_modified,
+    )
+    return Validator.build(parts, None)
+
 
 async def get_current_user(
     request: Request,
     db: Annotated[AsyncSession, Depends(get_db)],
     token: Annotated[str | None, Depends(oauth2_scheme)],
-) -> User:
+) -> Principal:
     raw_cookie_token = request.cookies.get(settings.AUTH_COOKIE_NAME)
     selected_token = token or raw_cookie_token
 
@@ -79,12 +169,17 @@ async def get_current_user(
             detail="Could not validate credentials",
         ) from err
 
-    user = await user_service.get_user_by_id(db, user_id)
+    user = await user_service.get_principal(db, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
+    if not user.issued(token_data.ver):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Could not validate credentials",
+        )
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -93,13 +188,49 @@ async def get_current_user(
     return user
 
 
+async def admit_expensive_request(
+    request: Request,
+    current_user: Annotated[Principal, Depends(get_current_user)],
+) -> None:
+    """Admission control for routes that start AI provider work.
+
+    Sheds them with 503 while the worker is overloaded, and rate-limits each user and
+    client IP with 429. Both carry ``Retry-After``.
+    """
+    await _admit(request, current_user)
+
+
+async def _admit(request: Request, current_user: Principal, cost: int = 1) -> None:
+    """``admit_expensive_request`` for a request worth ``cost`` rate-limit tokens."""
+    if settings.LOAD_SHEDDING and (retry_after := load_shedder.retry_after()):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is busy, please retry later",
+            headers={"Retry-After": str(retry_after)},
+        )
+    if settings.RATE_LIMITING:
+        client_ip = request.client.host if request.client else None
+        if cost > (capacity := rate_limiter.capacity(client_ip)):
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"This request needs {cost} rate-limit tokens; at most {capacity} fit",
+            )
+        retry_after = await rate_limiter.retry_after(current_user.id, client_ip, cost)
+        if retry_after:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many requests",
+                headers={"Retry-After": str(retry_after)},
+            )
+
+
 @router.post("/auth/login", response_model=Token)
 async def login_access_token(
     db: Annotated[AsyncSession, Depends(get_db)],
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
 ) -> Any:
     user = await user_service.get_user_by_email(db, form_data.username)
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await verify_password_async(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -111,10 +242,15 @@ async def login_access_token(
             detail="Inactive user",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    if password_needs_rehash(user.hashed_password):
+        hashed_password = await get_password_hash_async(form_data.password)
+        await user_service.update_password_hash(db, user.id, hashed_password)
 
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     return {
-        "access_token": create_access_token(user.id, expires_delta=access_token_expires),
+        "access_token": create_access_token(
+            user.id, expires_delta=access_token_expires, version=user.auth_version
+        ),
         "token_type": "bearer",
     }
 
@@ -129,23 +265,26 @@ async def register_user(user_in: UserCreate, db: Annotated[AsyncSession, Depends
         )
 
     user_data = user_in.model_dump()
-    hashed_password = get_password_hash(user_in.password)
+    hashed_password = await get_password_hash_async(user_in.password)
     user = await user_service.create_user(db, user_data, hashed_password)
     return user
 
 
 @router.get("/auth/me", response_model=UserSchema)
 async def get_current_user_profile(
-    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
 ) -> Any:
     """Return the profile of the currently authenticated user."""
-    return current_user
+    return await user_service.get_user_by_id(db, current_user.id)
 
 
-@router.post("/resumes", response_model=Resume)
+@router.post("/resumes", response_model=Resume, dependencies=[Depends(admit_expensive_request)])
 async def create_resume(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    background_tasks: BackgroundTasks,
+    session_factory: Annotated[async_sessionmaker[AsyncSession], Depends(get_session_factory)],
     file: UploadFile | None = File(None),
     resume_data: Annotated[str | None, Form()] = None,
 ) -> Any:
@@ -161,14 +300,20 @@ async def create_resume(
         result = await resume_service.process_resume_text(resume_data)
 
     resume = await resume_service.create_resume(db, current_user.id, result)
+    background_tasks.add_task(recommendation_service.rebuild_resume, session_factory, resume.id)
+    background_tasks.add_task(resume_artifact_service.refresh, session_factory, resume.id)
     return resume
 
 
-@router.post("/resumes/upload-base64", response_model=Resume)
+@router.post(
+    "/resumes/upload-base64", response_model=Resume, dependencies=[Depends(admit_expensive_request)]
+)
 async def create_resume_base64(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
     resume_upload: ResumeUpload,
+    background_tasks: BackgroundTasks,
+    session_factory: Annotated[async_sessionmaker[AsyncSession], Depends(get_session_factory)],
 ) -> Any:
     if not resume_upload.file_content:
         raise HTTPException(
@@ -187,82 +332,129 @@ async def create_resume_base64(
     file = UploadFile(filename=resume_upload.file_name, file=io.BytesIO(file_content))
     result = await resume_service.process_resume_file(file)
     resume = await resume_service.create_resume(db, current_user.id, result)
+    background_tasks.add_task(recommendation_service.rebuild_resume, session_factory, resume.id)
+    background_tasks.add_task(resume_artifact_service.refresh, session_factory, resume.id)
     return resume
 
 
 @router.get("/resumes", response_model=list[Resume])
 async def read_resumes(
+    request: Request,
+    response: Response,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
-    skip: int = 0,
-    limit: int = 100,
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    cursor: str | None = None,
+    limit: PageLimit = 100,
 ) -> Any:
-    return await resume_service.get_resumes(
-        db, current_user.id, current_user.is_recruiter, skip, limit
+    _validate_cursor(cursor)
+    version = await resume_service.get_resumes_version(
+        db, current_user.id, current_user.is_recruiter
     )
+    validator = _collection_validator(request, current_user, version)
+    if not_modified := conditional_response(request, response, validator):
+        return not_modified
+    resumes = await resume_service.get_resumes(
+        db, current_user.id, current_user.is_recruiter, cursor, limit
+    )
+    _set_next_page(request, response, resumes, limit)
+    return json_response(resumes, list[Resume], headers=response.headers)
 
 
 @router.get("/resumes/{id}", response_model=Resume)
 async def read_resume(
     id: int,
+    request: Request,
+    response: Response,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
 ) -> Any:
     resume = await resume_service.get_resume(db, id)
     if not resume:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume not found")
     if not current_user.is_recruiter and resume.user_id != current_user.id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions")
-    return resume
+    validator = _entity_validator(request, "resume", resume)
+    if not_modified := conditional_response(request, response, validator):
+        return not_modified
+    return json_response(resume, Resume, headers=response.headers)
 
 
 @router.delete("/resumes/{id}")
 async def delete_resume(
     id: int,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
 ) -> Any:
-    resume = await resume_service.get_resume(db, id)
-    if not resume:
+    owner_id = None if current_user.is_recruiter else current_user.id
+    if await resume_service.delete_resume(db, id, owner_id):
+        return None
+    if not await resume_service.get_resume(db, id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume not found")
-    if not current_user.is_recruiter and resume.user_id != current_user.id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions")
-    await resume_service.delete_resume(db, id)
-    return None
+    raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions")
 
 
 @router.post("/jobs", response_model=Job)
 async def create_job(
     job_in: JobCreate,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    background_tasks: BackgroundTasks,
+    session_factory: Annotated[async_sessionmaker[AsyncSession], Depends(get_session_factory)],
 ) -> Any:
     if not current_user.is_recruiter:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions")
     result = await job_service.process_job_description(job_in.description_text)
     job = await job_service.create_job(db, current_user.id, result, job_in.model_dump())
+    background_tasks.add_task(recommendation_service.refresh_job, session_factory, job.id)
     return job
 
 
 @router.get("/jobs", response_model=list[Job])
 async def read_jobs(
+    request: Request,
+    response: Response,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
-    skip: int = 0,
-    limit: int = 100,
+    read_db: Annotated[AsyncSession, Depends(get_read_db)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    cursor: str | None = None,
+    limit: PageLimit = 100,
+    skill: Annotated[list[str] | None, Query(max_length=10)] = None,
 ) -> Any:
-    return await job_service.get_jobs(db, current_user.id, current_user.is_recruiter, skip, limit)
+    _validate_cursor(cursor)
+    # Recruiters list their own postings, so they read from the primary.
+    source = db if current_user.is_recruiter else read_db
+    version = await job_service.get_jobs_version(
+        source, current_user.id, current_user.is_recruiter, required_skills=skill or ()
+    )
+    validator = _collection_validator(request, current_user, version)
+    if not_modified := conditional_response(request, response, validator):
+        return not_modified
+    jobs = await job_service.get_jobs(
+        source,
+        current_user.id,
+        current_user.is_recruiter,
+        cursor,
+        limit,
+        required_skills=skill or (),
+    )
+    _set_next_page(request, response, jobs, limit)
+    return json_response(jobs, list[Job], headers=response.headers)
 
 
 @router.get("/jobs/{id}", response_model=Job)
 async def read_job(
     id: int,
+    request: Request,
+    response: Response,
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> Any:
     job = await job_service.get_job(db, id)
     if not job:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
-    return job
+    validator = _entity_validator(request, "job", job)
+    if not_modified := conditional_response(request, response, validator):
+        return not_modified
+    return json_response(job, Job, headers=response.headers)
 
 
 @router.put("/jobs/{id}", response_model=Job)
@@ -270,7 +462,9 @@ async def update_job(
     id: int,
     job_in: JobUpdate,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    background_tasks: BackgroundTasks,
+    session_factory: Annotated[async_sessionmaker[AsyncSession], Depends(get_session_factory)],
 ) -> Any:
     job = await job_service.get_job(db, id)
     if not job:
@@ -294,6 +488,8 @@ async def update_job(
         job_data["qualifications"] = result["parsed_data"].get("qualifications", job.qualifications)
 
     updated_job = await job_service.update_job(db, id, job_data)
+    if {"required_skills", "preferred_skills"} & job_data.keys():
+        background_tasks.add_task(recommendation_service.refresh_job, session_factory, id)
     return updated_job
 
 
@@ -301,22 +497,28 @@ async def update_job(
 async def delete_job(
     id: int,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    background_tasks: BackgroundTasks,
+    session_factory: Annotated[async_sessionmaker[AsyncSession], Depends(get_session_factory)],
 ) -> Any:
-    job = await job_service.get_job(db, id)
-    if not job:
+    listed_in = await job_service.delete_job(db, id, current_user.id)
+    if listed_in is not None:
+        background_tasks.add_task(
+            recommendation_service.rebuild_resumes, session_factory, listed_in
+        )
+        return None
+    if not await job_service.get_job(db, id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
-    if job.company_id != current_user.id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions")
-    await job_service.delete_job(db, id)
-    return None
+    raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions")
 
 
 @router.post("/applications", response_model=Application)
 async def create_application(
     application_in: ApplicationCreate,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    background_tasks: BackgroundTasks,
+    session_factory: Annotated[async_sessionmaker[AsyncSession], Depends(get_session_factory)],
 ) -> Any:
     if current_user.is_recruiter:
         raise HTTPException(
@@ -335,42 +537,44 @@ async def create_application(
             detail="Resume not found or doesn't belong to you",
         )
 
-    score, match_details, feedback = await matching_service.match_resume_to_job(
-        resume.parsed_sections,
-        {
-            "title": job.title,
-            "required_skills": job.required_skills,
-            "preferred_skills": job.preferred_skills,
-            "responsibilities": job.responsibilities,
-            "qualifications": job.qualifications,
-        },
-    )
-
-    application = await matching_service.create_application(
-        db, application_in.model_dump(), score, match_details, feedback
-    )
+    application = await matching_service.apply(db, application_in.model_dump(), resume, job)
+    if application.scoring_status == "pending":
+        background_tasks.add_task(
+            matching_service.score_application, session_factory, application.id
+        )
     return application
 
 
 @router.get("/applications", response_model=list[Application])
 async def read_applications(
+    request: Request,
+    response: Response,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
-    skip: int = 0,
-    limit: int = 100,
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    cursor: str | None = None,
+    limit: PageLimit = 100,
     job_id: int | None = None,
     status_filter: str | None = None,
 ) -> Any:
-    return await matching_service.get_applications(
-        db, current_user.id, current_user.is_recruiter, job_id, status_filter, skip, limit
+    _validate_cursor(cursor)
+    version = await matching_service.get_applications_version(
+        db, current_user.id, current_user.is_recruiter, job_id, status_filter
     )
+    validator = _collection_validator(request, current_user, version)
+    if not_modified := conditional_response(request, response, validator):
+        return not_modified
+    applications = await matching_service.get_applications(
+        db, current_user.id, current_user.is_recruiter, job_id, status_filter, cursor, limit
+    )
+    _set_next_page(request, response, applications, limit)
+    return json_response(applications, list[Application], headers=response.headers)
 
 
 @router.get("/applications/{id}", response_model=ApplicationWithDetails)
 async def read_application(
     id: int,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
 ) -> Any:
     application_data = await matching_service.get_application(db, id)
     if not application_data:
@@ -386,7 +590,7 @@ async def read_application(
     result = ApplicationWithDetails.model_validate(application)
     result.job = Job.model_validate(job)
     result.resume = Resume.model_validate(resume)
-    return result
+    return json_response(result, ApplicationWithDetails)
 
 
 @router.patch("/applications/{id}/status", response_model=Application)
@@ -394,7 +598,7 @@ async def update_application_status(
     id: int,
     status_value: str,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
 ) -> Any:
     if not current_user.is_recruiter:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions")
@@ -406,23 +610,23 @@ async def update_application_status(
             detail=f"Invalid status. Must be one of: {', '.join(valid_statuses)}",
         )
 
-    application_data = await matching_service.get_application(db, id)
-    if not application_data:
+    updated = await matching_service.update_application_status(
+        db, id, status_value, company_id=current_user.id
+    )
+    if updated:
+        return updated
+    if not await matching_service.get_application(db, id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Application not found")
+    raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions")
 
-    application, job, _ = application_data
-    if job.company_id != current_user.id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions")
-
-    updated = await matching_service.update_application_status(db, id, status_value)
-    return updated
 
-
-@router.post("/match", response_model=MatchResponse)
+@router.post(
+    "/match", response_model=MatchResponse, dependencies=[Depends(admit_expensive_request)]
+)
 async def match_resume_to_job(
     match_request: MatchRequest,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
 ) -> Any:
     job = await job_service.get_job(db, match_request.job_id)
     if not job:
@@ -439,14 +643,7 @@ async def match_resume_to_job(
         )
 
     score, match_details, feedback = await matching_service.match_resume_to_job(
-        resume.parsed_sections,
-        {
-            "title": job.title,
-            "required_skills": job.required_skills,
-            "preferred_skills": job.preferred_skills,
-            "responsibilities": job.responsibilities,
-            "qualifications": job.qualifications,
-        },
+        resume.parsed_sections, matching_service.job_match_data(job)
     )
 
     return {
@@ -458,67 +655,174 @@ async def match_resume_to_job(
     }
 
 
+@router.post(
+    "/match/batch",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+async def match_batch(
+    request: Request,
+    batch: MatchBatchRequest,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
+) -> StreamingResponse:
+    """Score many (resume, job) pairs, streaming one NDJSON line per pair as it finishes."""
+    pairs = list(dict.fromkeys((pair.resume_id, pair.job_id) for pair in batch.pairs))
+    # One token per provider call, like single-pair matches; a batch larger than the
+    # caller's bucket is refused outright.
+    await _admit(request, current_user, max(1, len(pairs)))
+    resumes = await resume_service.get_resumes_by_ids(db, (resume_id for resume_id, _ in pairs))
+    jobs = await job_service.get_jobs_by_ids(db, (job_id for _, job_id in pairs))
+
+    async def _score(resume_id: int, job_id: int) -> MatchBatchResult:
+        resume = resumes.get(resume_id)
+        job = jobs.get(job_id)
+        if not resume:
+            return MatchBatchResult(resume_id=resume_id, job_id=job_id, error="Resume not found")
+        if not job:
+            return MatchBatchResult(resume_id=resume_id, job_id=job_id, error="Job not found")
+        if not current_user.is_recruiter and resume.user_id != current_user.id:
+            return MatchBatchResult(
+                resume_id=resume_id,
+                job_id=job_id,
+                error="Not enough permissions to access this resume",
+            )
+
+        try:
+            score, match_details, feedback = await matching_service.match_resume_to_job(
+                resume.parsed_sections, matching_service.job_match_data(job)
+            )
+        except Exception:
+            logger.exception("Batch match failed for resume %s and job %s", resume_id, job_id)
+            return MatchBatchResult(resume_id=resume_id, job_id=job_id, error="Matching failed")
+        return MatchBatchResult(
+            resume_id=resume_id,
+            job_id=job_id,
+            match_score=score,
+            match_details=match_details,
+            feedback=feedback,
+        )
+
+    async def _stream() -> AsyncIterator[str]:
+        # Provider concurrency is bounded by the AI service limiter, not here.
+        tasks = [asyncio.create_task(_score(resume_id, job_id)) for resume_id, job_id in pairs]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                result = await finished
+                yield result.model_dump_json(exclude_none=True) + "\n"
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(_stream(), media_type="application/x-ndjson")
+
+
 @router.get("/recommendations/{resume_id}", response_model=list[Job])
 async def get_job_recommendations(
     resume_id: int,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
-    limit: int = 5,
+    read_db: Annotated[AsyncSession, Depends(get_read_db)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    # Only the top K jobs per resume are stored, so a larger limit could never be filled.
+    limit: Annotated[int, Query(ge=1, le=settings.RECOMMENDATIONS_TOP_K)] = 5,
 ) -> Any:
     resume = await resume_service.get_resume(db, resume_id)
     if not resume:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume not found")
     if resume.user_id != current_user.id and not current_user.is_recruiter:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions")
-    return await job_service.get_recommendations(resume_id, db, current_user, limit)
+    company_id = current_user.id if current_user.is_recruiter else None
+    jobs = await recommendation_service.get_recommendations(read_db, resume_id, limit, company_id)
+    return json_response(jobs, list[Job])
 
 
-@router.get("/resumes/{id}/improve", response_model=dict[str, Any])
+@router.get(
+    "/resumes/{id}/improve",
+    response_model=dict[str, Any],
+    dependencies=[Depends(admit_expensive_request)],
+)
 async def get_resume_improvement(
     id: int,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
 ) -> Any:
     resume = await resume_service.get_resume(db, id)
     if not resume:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume not found")
     if resume.user_id != current_user.id and not current_user.is_recruiter:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions")
-    return await job_service.get_resume_improvement(id, db, current_user)
+    return json_response(await job_service.get_resume_improvement(id, db, current_user))
 
 
 @router.get("/market-analysis", response_model=dict[str, Any])
 async def get_job_market_analysis(
-    db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
 ) -> Any:
     if not current_user.is_recruiter:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only recruiters can access market analysis",
         )
-    return await job_service.get_market_analysis(db, current_user)
+    return json_response(await job_service.get_market_analysis(db, current_user))
+
+
+@router.get("/market-trends", response_model=SkillTrends)
+async def get_market_trends(
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
+    skills: Annotated[list[str], Query(min_length=1, max_length=10)],
+    grain: Literal["day", "week"] = "week",
+    kind: Literal["required", "preferred"] = "required",
+    start: date | None = None,
+    end: date | None = None,
+    location: str | None = None,
+    remote: bool | None = None,
+    experience_level: str | None = None,
+) -> Any:
+    if not current_user.is_recruiter:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only recruiters can access market analysis",
+        )
+    if start and end and start > end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="start must not be after end"
+        )
+    return await trend_service.get_trends(
+        db,
+        skills,
+        grain=grain,
+        kind=kind,
+        start=start,
+        end=end,
+        location=location,
+        is_remote=remote,
+        experience_level=experience_level,
+    )
 
 
 @router.get("/resumes/{id}/quality-score", response_model=dict[str, Any])
 async def get_resume_quality_score(
     id: int,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
 ) -> Any:
     resume = await resume_service.get_resume(db, id)
     if not resume:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume not found")
     if resume.user_id != current_user.id and not current_user.is_recruiter:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions")
-    return await job_service.get_resume_quality_score(id, db, current_user)
+    return json_response(await job_service.get_resume_quality_score(id, db, current_user))
 
 
-@router.post("/skills-gap", response_model=SkillsGapResponse)
+@router.post(
+    "/skills-gap", response_model=SkillsGapResponse, dependencies=[Depends(admit_expensive_request)]
+)
 async def analyze_skills_gap(
     request: SkillsGapRequest,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[Principal, Depends(get_current_user)],
 ) -> Any:
     resume = await resume_service.get_resume(db, request.resume_id)
     if not resume:
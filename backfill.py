@@ -0,0 +1,31 @@
+"""Regenerate derived data that is missing or was computed by an older algorithm.
+
+Run ``python -m backfill artifacts`` after changing ``ResumeArtifactService.VERSION`` or
+the ``improve_resume`` prompt, or to fill in resumes that predate the artifact store.
+"""
+
+import argparse
+import asyncio
+import logging
+
+from db.database import async_session_factory, engine
+from services import resume_artifact_service
+
+
+async def _main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m backfill")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("artifacts", help="recompute missing and stale resume artifacts")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "artifacts":
+            processed = await resume_artifact_service.backfill(async_session_factory)
+            print(f"Recomputed artifacts for {processed} resumes")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s [%(name)s] %(message)s")
+    asyncio.run(_main())
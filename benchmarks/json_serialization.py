@@ -0,0 +1,102 @@
+"""Encoding a page of large resumes: FastAPI's response_model path vs ``json_response``.
+
+The response_model path validates the ORM rows, dumps them to Python primitives and
+encodes those with the stdlib ``json`` module, as FastAPI does for a route returning ORM
+objects. ``json_response`` validates once and lets pydantic-core write the bytes.
+
+Usage: python -m benchmarks.json_serialization [--resumes 100] [--rounds 50]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from core.serialization import dump_json
+from models import Resume as ResumeModel
+from schemas import Resume
+
+
+def _resume(rng: random.Random, resume_id: int) -> ResumeModel:
+    skills = [
+        {"name": f"skill-{rng.randrange(400)}", "proficiency": "Advanced", "context": "x" * 60}
+        for _ in range(40)
+    ]
+    experience = [
+        {
+            "title": f"Engineer {i}",
+            "company": f"Company {i}",
+            "start_date": "2015",
+            "end_date": "2019",
+            "achievements": [f"Improved throughput by {rng.randrange(100)}%" for _ in range(8)],
+        }
+        for i in range(8)
+    ]
+    return ResumeModel(
+        id=resume_id,
+        user_id=1,
+        full_text="lorem ipsum " * 800,
+        parsed_sections={
+            "contact": {"name": f"Candidate {resume_id}", "email": "c@example.com"},
+            "summary": "summary " * 100,
+            "skills": skills,
+            "experience": experience,
+        },
+        skills=skills,
+        experience=experience,
+        education=[{"degree": "BSc", "institution": "University", "year": "2014"}],
+        projects=[{"name": f"Project {i}", "description": "d" * 300} for i in range(5)],
+        certifications=[],
+        achievements=["a" * 100 for _ in range(5)],
+        created_at=datetime.now(UTC),
+    )
+
+
+def _response_model_path(rows: list[ResumeModel]) -> bytes:
+    adapter = TypeAdapter(list[Resume])
+    content = adapter.dump_python(adapter.validate_python(rows, from_attributes=True), mode="json")
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_response_path(rows: list[ResumeModel]) -> bytes:
+    return dump_json(rows, list[Resume])
+
+
+def _measure(
+    call: Callable[[list[ResumeModel]], Any], rows: list[ResumeModel], rounds: int
+) -> tuple[float, int]:
+    call(rows)  # warm up adapters
+    started = time.perf_counter()
+    for _ in range(rounds):
+        body = call(rows)
+    return (time.perf_counter() - started) / rounds, len(body)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    rows = [_resume(rng, i) for i in range(1, args.resumes + 1)]
+    assert json.loads(_response_model_path(rows)) == json.loads(_json_response_path(rows))
+
+    print(f"{'path':<16} {'ms/page':>10} {'KiB':>8}")
+    for name, call in (
+        ("response_model", _response_model_path),
+        ("json_response", _json_response_path),
+    ):
+        elapsed, size = _measure(call, rows, args.rounds)
+        print(f"{name:<16} {elapsed * 1000:>10.2f} {size / 1024:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Login throughput and the latency of other requests during a login storm.
+
+Compares checking passwords inline on the event loop with the bounded hashing pool.
+
+Usage: python -m benchmarks.password_hashing [--logins 64] [--rounds 12]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections.abc import AsyncIterator
+from contextlib import nullcontext
+from unittest.mock import patch
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from core.config import settings
+from core.security import create_access_token, get_password_hash, verify_password
+from db.database import Base, get_db
+from main import app
+from models import User
+
+PASSWORD = "benchmark-password"
+
+
+async def _inline_verify(plain_password: str, hashed_password: str) -> bool:
+    return verify_password(plain_password, hashed_password)
+
+
+async def _storm(client: AsyncClient, logins: int) -> tuple[float, list[float]]:
+    """Run ``logins`` concurrent logins while probing ``/auth/me``; return (elapsed, probes)."""
+    probes: list[float] = []
+    done = asyncio.Event()
+    headers = {"Authorization": f"Bearer {create_access_token(1, version=0)}"}
+
+    async def _probe() -> None:
+        while not done.is_set():
+            started = time.perf_counter()
+            (await client.get("/api/v1/auth/me", headers=headers)).raise_for_status()
+            probes.append(time.perf_counter() - started)
+            await asyncio.sleep(0.005)
+
+    async def _login(i: int) -> None:
+        resp = await client.post(
+            "/api/v1/auth/login", data={"username": f"u{i}@example.com", "password": PASSWORD}
+        )
+        resp.raise_for_status()
+
+    prober = asyncio.create_task(_probe())
+    started = time.perf_counter()
+    await asyncio.gather(*(_login(i) for i in range(logins)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await prober
+    return elapsed, probes
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--rounds", type=int, default=12)
+    args = parser.parse_args()
+    settings.BCRYPT_ROUNDS = args.rounds
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    hashed = get_password_hash(PASSWORD)
+    async with factory() as db:
+        db.add_all(
+            User(email=f"u{i}@example.com", hashed_password=hashed) for i in range(args.logins)
+        )
+        await db.commit()
+
+    async def _db() -> AsyncIterator[AsyncSession]:
+        async with factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = _db
+    print(f"{'mode':<8} {'logins/s':>9} {'probe p50 ms':>13} {'probe max ms':>13}")
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        # ``api`` checks passwords in the pool already; inline swaps in a plain bcrypt check.
+        for mode, verify in (
+            ("inline", patch("api.verify_password_async", _inline_verify)),
+            ("pool", nullcontext()),
+        ):
+            with verify:
+                elapsed, probes = await _storm(client, args.logins)
+            print(
+                f"{mode:<8} {args.logins / elapsed:>9.1f} "
+                f"{statistics.median(probes) * 1000:>13.1f} {max(probes) * 1000:>13.1f}"
+            )
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
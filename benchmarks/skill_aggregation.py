@@ -0,0 +1,111 @@
+"""Skill counting in Python over streamed rows vs SQL-side JSON aggregation.
+
+Usage: python -m benchmarks.skill_aggregation [--jobs 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from db.database import Base, configure_sqlite
+from models import Job, User
+from services import AIService, job_service
+
+SKILLS = [f"skill-{i}" for i in range(400)]
+
+
+async def _seed(db: AsyncSession, jobs: int) -> None:
+    rng = random.Random(7)
+    db.add(User(id=1, email="bench@example.com", hashed_password="x", is_recruiter=True))
+    await db.flush()
+    rows = [
+        {
+            "company_id": 1,
+            "title": f"job {i}",
+            "is_remote": False,
+            "required_skills": [{"name": name} for name in rng.sample(SKILLS, 6)],
+            "preferred_skills": [{"name": name} for name in rng.sample(SKILLS, 3)],
+        }
+        for i in range(jobs)
+    ]
+    for start in range(0, len(rows), 5000):
+        await db.execute(insert(Job), rows[start : start + 5000])
+    await db.commit()
+
+
+async def _python_top(db: AsyncSession) -> list[tuple[str, int]]:
+    counts: Counter[str] = Counter()
+    stream = await db.stream(select(Job.required_skills))
+    async for (skills,) in stream:
+        counts.update(set(AIService._extract_skill_names(skills)))
+    return counts.most_common(10)
+
+
+async def _python_rebuild(db: AsyncSession) -> None:
+    """The previous rebuild: every job's skill lists are decoded and counted in Python."""
+    counts: Counter[tuple[str, str, str]] = Counter()
+    stream = await db.stream(select(Job.company_id, Job.required_skills, Job.preferred_skills))
+    async for job in stream:
+        for kind, skills in job_service._skill_sets(job).items():
+            for scope in job_service._skill_scopes(job.company_id):
+                for skill in skills:
+                    counts[(scope, kind, skill)] += 1
+
+
+async def _sql_top(db: AsyncSession) -> list[dict[str, Any]]:
+    return await job_service.count_skills(db, "required")
+
+
+async def _measure(
+    factory: async_sessionmaker[AsyncSession], call: Callable[[AsyncSession], Awaitable[Any]]
+) -> tuple[float, int]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    async with factory() as db:
+        await call(db)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}")
+        configure_sqlite(engine)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with factory() as db:
+            await _seed(db, args.jobs)
+
+        print(f"{'operation':<22} {'ms':>10} {'peak KiB':>10}")
+        for name, call in (
+            ("top-10 python", _python_top),
+            ("top-10 sql", _sql_top),
+            ("rebuild python", _python_rebuild),
+            ("rebuild sql", job_service.rebuild_skill_demand),
+        ):
+            elapsed, peak = await _measure(factory, call)
+            print(f"{name:<22} {elapsed * 1000:>10.1f} {peak / 1024:>10.0f}")
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
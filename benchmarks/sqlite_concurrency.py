@@ -0,0 +1,84 @@
+"""Concurrent read/write throughput of SQLite with and without the tuning profile.
+
+Usage: python -m benchmarks.sqlite_concurrency [--seconds 5] [--writers 4] [--readers 8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from db.database import configure_sqlite
+
+
+async def _writer(engine: AsyncEngine, deadline: float, counts: dict[str, int]) -> None:
+    while time.perf_counter() < deadline:
+        try:
+            async with engine.begin() as conn:
+                await conn.execute(
+                    text("INSERT INTO events (payload) VALUES (:payload)"), {"payload": "x" * 200}
+                )
+            counts["writes"] += 1
+        except OperationalError:
+            counts["errors"] += 1
+
+
+async def _reader(engine: AsyncEngine, deadline: float, counts: dict[str, int]) -> None:
+    while time.perf_counter() < deadline:
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT id, payload FROM events ORDER BY id DESC LIMIT 20"))
+            counts["reads"] += 1
+        except OperationalError:
+            counts["errors"] += 1
+
+
+async def run(tuned: bool, seconds: float, writers: int, readers: int) -> dict[str, int]:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}", pool_size=writers + readers
+        )
+        if tuned:
+            configure_sqlite(engine)
+        async with engine.begin() as conn:
+            await conn.execute(
+                text("CREATE TABLE events (id INTEGER PRIMARY KEY, payload TEXT NOT NULL)")
+            )
+
+        counts = {"writes": 0, "reads": 0, "errors": 0}
+        deadline = time.perf_counter() + seconds
+        await asyncio.gather(
+            *(_writer(engine, deadline, counts) for _ in range(writers)),
+            *(_reader(engine, deadline, counts) for _ in range(readers)),
+        )
+        await engine.dispose()
+        return counts
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=8)
+    args = parser.parse_args()
+
+    print(f"{'profile':<8} {'writes/s':>10} {'reads/s':>10} {'errors':>8}")
+    for tuned in (False, True):
+        counts = await run(tuned, args.seconds, args.writers, args.readers)
+        print(
+            f"{'tuned' if tuned else 'stock':<8} "
+            f"{counts['writes'] / args.seconds:>10.0f} "
+            f"{counts['reads'] / args.seconds:>10.0f} "
+            f"{counts['errors']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,78 @@
+"""Bursty insert throughput with per-request commits vs the write coordinator.
+
+Usage: python -m benchmarks.write_batching [--writes 2000] [--concurrency 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from db.database import configure_sqlite
+from db.writer import WriteCoordinator
+
+
+async def _insert(session: AsyncSession) -> None:
+    await session.execute(text("INSERT INTO events (payload) VALUES (:payload)"), {"payload": "x"})
+
+
+async def _burst(
+    engine: AsyncEngine, batched: bool, writes: int, concurrency: int
+) -> tuple[float, int]:
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    writer = WriteCoordinator(factory)
+    if batched:
+        writer.start()
+    limit = asyncio.Semaphore(concurrency)
+
+    async def _one() -> None:
+        async with limit, factory() as session:
+            await writer.execute(session, _insert)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(_one() for _ in range(writes)), return_exceptions=True)
+    elapsed = time.perf_counter() - started
+    await writer.stop()
+    return elapsed, sum(isinstance(result, Exception) for result in results)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--writes", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'mode':<14} {'writes/s':>10} {'errors':>8}")
+    for synchronous in ("NORMAL", "FULL"):
+        for batched in (False, True):
+            with tempfile.TemporaryDirectory() as tmp:
+                engine = create_async_engine(
+                    f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}",
+                    pool_size=20,
+                    max_overflow=args.concurrency,
+                )
+                configure_sqlite(engine)
+                async with engine.begin() as conn:
+                    await conn.execute(text(f"PRAGMA synchronous={synchronous}"))
+                    await conn.execute(
+                        text("CREATE TABLE events (id INTEGER PRIMARY KEY, payload TEXT NOT NULL)")
+                    )
+                elapsed, errors = await _burst(engine, batched, args.writes, args.concurrency)
+                await engine.dispose()
+            mode = f"{'batched' if batched else 'direct'}/{synchronous.lower()}"
+            print(f"{mode:<14} {(args.writes - errors) / elapsed:>10.0f} {errors:>8}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
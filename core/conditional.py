@@ -0,0 +1,81 @@
+"""HTTP conditional requests (RFC 9110 §13) for API reads.
+
+Validators are derived from row timestamps rather than from the response body, so a
+route can answer ``304 Not Modified`` before it serializes anything. Single resources use
+their id and ``updated_at`` (falling back to ``created_at``); collections use the row
+count, highest id and latest modification of everything the list could return, which one
+aggregate query supplies. ETags are weak because they name a data version, not a byte
+sequence. Collections send no ``Last-Modified``: a delete changes the list without
+changing any remaining row's timestamp, so only the ETag (whose row count does change)
+can validate them.
+"""
+
+import hashlib
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response, status
+
+# Responses depend on who is asking, so shared caches must not reuse them and private
+# caches must revalidate before every reuse.
+_CACHE_HEADERS = {"Cache-Control": "private, no-cache", "Vary": "Authorization, Cookie"}
+
+
+@dataclass(slots=True, frozen=True)
+class Validator:
+    etag: str
+    last_modified: datetime | None
+
+    @classmethod
+    def build(cls, parts: Iterable[Hashable], last_modified: datetime | None) -> "Validator":
+        digest = hashlib.blake2b(repr(tuple(parts)).encode(), digest_size=12).hexdigest()
+        if last_modified is not None and last_modified.tzinfo is None:
+            # SQLite hands back naive datetimes; every timestamp is stored in UTC.
+            last_modified = last_modified.replace(tzinfo=UTC)
+        return cls(etag=f'W/"{digest}"', last_modified=last_modified)
+
+    def headers(self) -> dict[str, str]:
+        headers = {"ETag": self.etag, **_CACHE_HEADERS}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(self.last_modified, usegmt=True)
+        return headers
+
+
+def _opaque(etag: str) -> str:
+    return etag.removeprefix("W/")
+
+
+def is_not_modified(request: Request, validator: Validator) -> bool:
+    """Whether the client's cached copy is current, per ``If-None-Match``/``-Modified-Since``."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match uses the weak comparison and, when present, overrides the date.
+        if if_none_match.strip() == "*":
+            return True
+        current = _opaque(validator.etag)
+        return any(_opaque(tag.strip()) == current for tag in if_none_match.split(","))
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or validator.last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=UTC)
+    # HTTP dates have whole-second resolution.
+    return validator.last_modified.replace(microsecond=0) <= since
+
+
+def conditional_response(
+    request: Request, response: Response, validator: Validator
+) -> Response | None:
+    """A bodiless 304 when the client is current; otherwise tag ``response`` and return None."""
+    headers = validator.headers()
+    if is_not_modified(request, validator):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
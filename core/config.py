@@ -18,10 +18,28 @@ class Settings(BaseSettings):
     AUTH_COOKIE_NAME: str = "access_token"
     COOKIE_SECURE: bool = False
     COOKIE_SAMESITE: str = "lax"
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 4
+    AUTH_CACHE_TTL_SECONDS: float = 60
+    AUTH_CACHE_MAX_SIZE: int = 10_000
 
     CORS_ORIGINS: list[str] = ["http://localhost:8000", "http://127.0.0.1:8000"]
 
     DATABASE_URL: str = "sqlite+aiosqlite:///./job_matcher.db"
+    DATABASE_READ_URL: str | None = None
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_READ_POOL_SIZE: int = 10
+    DB_READ_MAX_OVERFLOW: int = 20
+    AUTO_MIGRATE: bool = True
+    SQLITE_TUNING: bool = True
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_CACHE_SIZE_KIB: int = 64 * 1024
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    SQLITE_MAINTENANCE_INTERVAL_SECONDS: int = 600
+    WRITE_BATCHING: bool = False
+    WRITE_BATCH_MAX_SIZE: int = 64
+    WRITE_BATCH_WINDOW_MS: float = 0
 
     AI_PRIMARY_PROVIDER: str = "google"
     AI_FALLBACK_PROVIDER: str = "openrouter"
@@ -31,13 +49,39 @@ class Settings(BaseSettings):
     GOOGLE_THINKING_BUDGET: int = 8192
     OPENROUTER_API_KEY: str | None = None
     OPENROUTER_MODEL: str = "google/gemini-2.5-flash"
+    AI_MAX_CONCURRENCY: int = 8
+
+    RATE_LIMITING: bool = True
+    RATE_LIMIT_USER_PER_MINUTE: float = 20
+    RATE_LIMIT_USER_BURST: int = 10
+    RATE_LIMIT_IP_PER_MINUTE: float = 60
+    RATE_LIMIT_IP_BURST: int = 30
+    LOAD_SHEDDING: bool = True
+    LOAD_SHED_LOOP_LAG_MS: float = 250
+    LOAD_SHED_PROVIDER_WAIT_MS: float = 10_000
+    LOAD_SHED_RETRY_AFTER_SECONDS: int = 5
 
     UPLOAD_DIR: str = "./uploads"
     MAX_UPLOAD_SIZE: int = 10 * 1024 * 1024
 
     PROMPTS_DIR: str = str(BASE_DIR / "prompts")
 
+    RECOMMENDATIONS_TOP_K: int = 20
+    RESUME_IMPROVEMENT_TIMEOUT_SECONDS: float = 20
+    MATCH_BATCH_MAX_PAIRS: int = 5000
+    DEFER_APPLICATION_SCORING: bool = False
+    SCORING_CLAIM_TIMEOUT_SECONDS: int = 300
+    TREND_ROLLUP_INTERVAL_SECONDS: int = 300
+    TREND_ROLLUP_LAG_SECONDS: int = 60
+
+    # Anonymous pages (home, login, register) are served from a rendered-page cache.
+    # BUILD_ID identifies a deploy; changing it, or editing a template, empties the cache.
+    PAGE_CACHE_TTL_SECONDS: int = 300
+    PAGE_CACHE_MAX_SIZE: int = 256
+    BUILD_ID: str = ""
+
     DEFAULT_LOCALE: str = "en"
+    I18N_CATALOG_DIR: str = str(BASE_DIR / "build" / "i18n")
     SUPPORTED_LOCALES: list[str] = [
         "en",
         "hi",
@@ -0,0 +1,61 @@
+"""Request-scoped batch loading.
+
+``BatchLoader.load`` does not query right away. Keys requested during the same event-loop
+tick are collected and handed to the batch function together, so code that looks up rows
+one id at a time still issues one ``WHERE id IN (...)`` query. Results stay cached for the
+loader's lifetime, so repeated lookups of the same key are free.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Mapping
+
+
+class BatchLoader[K: Hashable, V]:
+    def __init__(self, batch_fn: Callable[[list[K]], Awaitable[Mapping[K, V]]]):
+        self._batch_fn = batch_fn
+        self._cache: dict[K, asyncio.Future[V | None]] = {}
+        self._pending: list[K] = []
+        self._dispatch: asyncio.Task[None] | None = None
+
+    def load(self, key: K) -> "asyncio.Future[V | None]":
+        """Return a future for ``key``'s value, or None if the batch did not return it."""
+        future = self._cache.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._cache[key] = loop.create_future()
+            self._pending.append(key)
+            if len(self._pending) == 1:
+                loop.call_soon(self._schedule)
+        return future
+
+    async def load_many(self, keys: Iterable[K]) -> list[V | None]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: K, value: V) -> None:
+        """Cache a value the caller already loaded some other way."""
+        if key not in self._cache:
+            future = self._cache[key] = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+
+    def clear(self) -> None:
+        """Forget cached values; keys already queued still resolve."""
+        self._cache = {key: self._cache[key] for key in self._pending}
+
+    def _schedule(self) -> None:
+        keys, self._pending = self._pending, []
+        futures = [self._cache[key] for key in keys]
+        self._dispatch = asyncio.create_task(self._run(keys, futures))
+
+    async def _run(self, keys: list[K], futures: list["asyncio.Future[V | None]"]) -> None:
+        try:
+            values = await self._batch_fn(keys)
+        except Exception as exc:
+            for key, future in zip(keys, futures, strict=True):
+                if self._cache.get(key) is future:
+                    del self._cache[key]
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for key, future in zip(keys, futures, strict=True):
+            if not future.done():
+                future.set_result(values.get(key))
@@ -0,0 +1,2060 @@
+"""Translation sources: the English strings and each locale's overrides.
+
+Edit strings here, then run ``python -m core.i18n compile`` (the app also recompiles a
+catalog whose source is newer on first use). Runtime lookups go through the compiled
+catalogs in ``core.i18n`` and never import this module.
+"""
+
+EN_TRANSLATIONS: dict[str, str] = {
+    "app.name": "Samarth AI Resume Platform",
+    "nav.home": "Home",
+    "nav.dashboard": "Dashboard",
+    "nav.resumes": "Resumes",
+    "nav.jobs": "Jobs",
+    "nav.applications": "Applications",
+    "nav.analysis": "Market Analysis",
+    "nav.login": "Login",
+    "nav.register": "Register",
+    "nav.logout": "Logout",
+    "common.submit": "Submit",
+    "common.cancel": "Cancel",
+    "common.view": "View",
+    "common.view_all": "View All",
+    "common.create": "Create",
+    "common.update": "Update",
+    "common.delete": "Delete",
+    "common.language": "Language",
+    "common.back": "Back",
+    "common.more": "more",
+    "common.load_more": "Load more",
+    "common.loading": "Loading…",
+    "resumes.panel_unavailable": "This section is not available right now. Reload the page to try again.",
+    "common.close": "Close",
+    "common.skip_to_content": "Skip to content",
+    "common.open_navigation": "Open navigation",
+    "common.to": "to",
+    "common.yes": "Yes",
+    "common.no": "No",
+    "common.name": "Name",
+    "common.email": "Email",
+    "common.phone": "Phone",
+    "common.date": "Date",
+    "common.status": "Status",
+    "home.hero.title": "AI-Powered Resume and Job Matching",
+    "home.hero.subtitle": "Build better resumes, discover relevant roles, and improve your applications with AI.",
+    "home.how_it_works": "How It Works",
+    "home.step1.title": "Upload Your Resume",
+    "home.step1.desc": "Our AI analyzes your resume, extracting skills, experience, and qualifications automatically.",
+    "home.step2.title": "Find Matching Jobs",
+    "home.step2.desc": "Get personalized job recommendations based on your skills and experience profile.",
+    "home.step3.title": "Improve Your Match",
+    "home.step3.desc": "Receive actionable feedback to enhance your resume and increase your match scores.",
+    "home.features": "Features",
+    "home.feature": "Feature",
+    "home.jobseekers": "Job Seekers",
+    "home.recruiters": "Recruiters",
+    "home.feature.ai_resume_analysis": "AI Resume Analysis",
+    "home.feature.job_matching": "Job Matching",
+    "home.feature.resume_improvement": "Resume Improvement",
+    "home.feature.application_tracking": "Application Tracking",
+    "home.feature.market_analysis": "Market Analysis",
+    "auth.login.title": "Login",
+    "auth.register.title": "Create Account",
+    "auth.email": "Email",
+    "auth.password": "Password",
+    "auth.full_name": "Full Name",
+    "auth.recruiter": "I am a recruiter",
+    "auth.register.success": "Registration successful! Please login.",
+    "auth.no_account": "Don't have an account?",
+    "auth.register_here": "Register here",
+    "auth.have_account": "Already have an account?",
+    "auth.login_here": "Login here",
+    "auth.placeholder.email": "your@email.com",
+    "auth.placeholder.password": "Password",
+    "auth.placeholder.full_name": "John Doe",
+    "dashboard.recruiter": "Recruiter Dashboard",
+    "dashboard.jobseeker": "Job Seeker Dashboard",
+    "dashboard.active_jobs": "Active Jobs",
+    "dashboard.your_job_postings": "Your job postings",
+    "dashboard.new_applications": "New Applications",
+    "dashboard.pending_review": "Pending review",
+    "dashboard.shortlisted": "Shortlisted",
+    "dashboard.pipeline": "Candidates in pipeline",
+    "dashboard.resumes": "Resumes",
+    "dashboard.resumes_desc": "Your uploaded resumes",
+    "dashboard.applications": "Applications",
+    "dashboard.applications_desc": "Total job applications",
+    "dashboard.pending": "Pending",
+    "dashboard.pending_desc": "Applications awaiting review",
+    "dashboard.recent_applications": "Recent Applications",
+    "dashboard.you_applied_none": "You haven't applied to any jobs yet.",
+    "dashboard.received_none": "No applications received yet.",
+    "dashboard.your_resumes": "Your Resumes",
+    "dashboard.resume_none": "You haven't uploaded any resumes yet.",
+    "dashboard.recommended_jobs": "Recommended Jobs",
+    "dashboard.job_postings": "Your Job Postings",
+    "dashboard.no_jobs_posted": "You haven't posted any jobs yet.",
+    "dashboard.market_preview": "Market Analysis Preview",
+    "dashboard.view_full_analysis": "View Full Analysis",
+    "dashboard.add_resume": "Add Resume",
+    "dashboard.upload_resume": "Upload Resume",
+    "dashboard.post_job": "Post Job",
+    "dashboard.job_title": "Job Title",
+    "dashboard.applicant": "Applicant",
+    "dashboard.match_score": "Match Score",
+    "dashboard.skills_count_suffix": "skills",
+    "dashboard.required_suffix": "required",
+    "jobs.title": "Jobs",
+    "jobs.create": "Post New Job",
+    "jobs.post_new": "Post New Job",
+    "jobs.required_skills": "Required Skills",
+    "jobs.view_details": "View Details",
+    "jobs.no_jobs_found": "No Jobs Found",
+    "jobs.no_jobs_recruiter": "You haven't posted any jobs yet. Get started by creating your first job posting.",
+    "jobs.no_jobs_seeker": "No job postings are available at the moment. Please check back later.",
+    "jobs.title_label": "Job Title",
+    "jobs.description": "Job Description",
+    "jobs.description_help": "Include details about requirements, responsibilities, and qualifications",
+    "jobs.create_submit": "Create Job",
+    "jobs.apply_now": "Apply Now",
+    "jobs.applied": "You've Applied",
+    "jobs.preferred_skills": "Preferred Skills",
+    "jobs.responsibilities": "Responsibilities",
+    "jobs.qualifications": "Qualifications",
+    "jobs.job_details": "Job Details",
+    "jobs.posted_date": "Posted Date",
+    "jobs.last_updated": "Last Updated",
+    "jobs.required_skills_count": "Required Skills",
+    "jobs.preferred_skills_count": "Preferred Skills",
+    "jobs.applications_count": "Applications",
+    "jobs.view_job": "View Job",
+    "jobs.view_full_job": "View Full Job",
+    "jobs.select_resume": "Select Resume",
+    "jobs.choose_resume": "Choose a resume",
+    "jobs.submit_application": "Submit Application",
+    "jobs.update_status": "Update Status",
+    "jobs.application_status": "Application Status",
+    "jobs.edit": "Edit Job",
+    "jobs.edit_submit": "Update Job",
+    "jobs.delete": "Delete Job",
+    "jobs.delete_confirm": "Are you sure you want to delete this job?",
+    "jobs.location": "Location",
+    "jobs.salary_range": "Salary Range",
+    "jobs.salary_min": "Minimum Salary",
+    "jobs.salary_max": "Maximum Salary",
+    "jobs.job_type": "Employment Type",
+    "jobs.is_remote": "Remote Work",
+    "jobs.experience_level": "Experience Level",
+    "jobs.type.full_time": "Full-Time",
+    "jobs.type.part_time": "Part-Time",
+    "jobs.type.contract": "Contract",
+    "jobs.type.internship": "Internship",
+    "jobs.level.entry": "Entry Level",
+    "jobs.level.mid": "Mid Level",
+    "jobs.level.senior": "Senior Level",
+    "jobs.level.lead": "Lead / Principal",
+    "user.phone": "Phone Number",
+    "user.bio": "About Me",
+    "user.location": "Location",
+    "user.profile_picture": "Profile Picture",
+    "applications.cover_letter": "Cover Letter",
+    "applications.cover_letter_placeholder": "Write a brief cover letter explaining why you are a great fit for this role...",
+    "applications.scoring_pending": "Provisional score, final scoring in progress",
+    "applications.scoring_failed": "Final scoring failed, showing provisional score",
+    "status.new": "New",
+    "status.reviewed": "Reviewed",
+    "status.shortlisted": "Shortlisted",
+    "status.rejected": "Rejected",
+    "resumes.title": "Resumes",
+    "resumes.your_resumes": "Your Resumes",
+    "resumes.upload": "Upload Resume",
+    "resumes.upload_file": "Upload File",
+    "resumes.paste_text": "Paste Text",
+    "resumes.process_resume": "Process Resume",
+    "resumes.resume_file": "Resume File (PDF, DOCX, or TXT)",
+    "resumes.resume_text": "Resume Text",
+    "resumes.no_resumes_found": "No Resumes Found",
+    "resumes.no_resumes_desc": "You haven't uploaded any resumes yet. Get started by uploading your first resume.",
+    "resumes.unnamed": "Unnamed Resume",
+    "resumes.skills_suffix": "skills",
+    "resumes.entries_suffix": "entries",
+    "resumes.details": "Resume Details",
+    "resumes.delete_confirm": "Are you sure you want to delete this resume?",
+    "resumes.info": "Resume Information",
+    "resumes.parsed_data": "Parsed Data",
+    "resumes.raw_text": "Raw Text",
+    "resumes.contact_info": "Contact Information",
+    "resumes.skills": "Skills",
+    "resumes.experience": "Experience",
+    "resumes.education": "Education",
+    "resumes.projects": "Projects",
+    "resumes.certifications": "Certifications",
+    "resumes.project_link": "Project Link",
+    "resumes.no_parsed_data": "No parsed data available for this resume.",
+    "resumes.quality_score": "Quality Score",
+    "resumes.suggestions": "Suggestions",
+    "resumes.improvement_suggestions": "Improvement Suggestions",
+    "resumes.format": "Format",
+    "resumes.bullet_points": "Bullet Points",
+    "resumes.suggested_keywords": "Suggested Keywords",
+    "resumes.skills_highlight": "Skills to Highlight",
+    "resumes.job_recommendations": "Job Recommendations",
+    "resumes.start_na": "N/A",
+    "resumes.present": "Present",
+    "resumes.issued_by": "Issued by",
+    "applications.title": "Applications",
+    "applications.no_found": "No Applications Found",
+    "applications.no_recruiter_desc": "You haven't received any applications yet.",
+    "applications.no_seeker_desc": "You haven't applied to any jobs yet.",
+    "applications.browse_jobs": "Browse Jobs",
+    "applications.job": "Job",
+    "applications.resume": "Resume",
+    "applications.applicant": "Applicant",
+    "applications.match_score": "Match Score",
+    "applications.actions": "Actions",
+    "applications.details": "Application Details",
+    "applications.submitted_on": "Submitted on",
+    "applications.match_analysis": "Match Analysis",
+    "applications.match_details": "Match Details",
+    "applications.feedback": "Feedback",
+    "applications.skills_match": "Skills Match",
+    "applications.score": "Score",
+    "applications.required": "Required Skills",
+    "applications.preferred": "Preferred Skills",
+    "applications.match_rate": "Match rate",
+    "applications.matched": "Matched",
+    "applications.missing": "Missing",
+    "applications.experience_match": "Experience Match",
+    "applications.matching_aspects": "Matching Aspects",
+    "applications.missing_aspects": "Missing Aspects",
+    "applications.experience_analysis": "Experience Analysis",
+    "applications.education_match": "Education Match",
+    "applications.highest_education": "Highest Education",
+    "applications.match_weights": "Match Weights",
+    "applications.no_match_data": "No detailed match data available.",
+    "applications.strengths": "Strengths",
+    "applications.improvement_areas": "Improvement Areas",
+    "applications.missing_skills": "Missing Skills",
+    "applications.recommended_keywords": "Recommended Keywords",
+    "applications.no_strengths": "No specific strengths identified.",
+    "applications.no_improvements": "No specific improvements identified.",
+    "applications.no_missing_skills": "No specific missing skills identified.",
+    "applications.no_keywords": "No specific keyword recommendations.",
+    "applications.no_feedback_data": "No feedback data available.",
+    "applications.job_details": "Job Details",
+    "applications.applicant_details": "Applicant Details",
+    "applications.update_status": "Update Status",
+    "analysis.title": "Job Market Analysis",
+    "analysis.last_updated": "Last updated",
+    "analysis.overview": "Overview",
+    "analysis.based_on": "Analysis based on",
+    "analysis.jobs_from_platform": "jobs from our platform.",
+    "analysis.total_jobs": "Total Jobs",
+    "analysis.analyzed_for_trends": "Analyzed for trends",
+    "analysis.unique_required": "Unique Required Skills",
+    "analysis.in_demand": "Most in-demand skills",
+    "analysis.unique_preferred": "Unique Preferred Skills",
+    "analysis.trending_secondary": "Trending secondary skills",
+    "analysis.top_required": "Top Required Skills",
+    "analysis.top_preferred": "Top Preferred Skills",
+    "analysis.skill": "Skill",
+    "analysis.count": "Count",
+    "analysis.percentage": "Percentage",
+    "analysis.chart_job_count": "Job Count",
+    "analysis.chart_jobs_axis": "Number of Jobs",
+    "analysis.chart_skills_axis": "Skills",
+    "skills_gap.title": "Skills Gap Analysis",
+    "skills_gap.description": "Compare your resume skills against job requirements to identify gaps and get personalized learning recommendations.",
+    "skills_gap.select_resume": "Select Resume",
+    "skills_gap.select_job": "Select Job",
+    "skills_gap.analyze": "Analyze Skills Gap",
+    "skills_gap.score": "Gap Score",
+    "skills_gap.matched": "Matched Skills",
+    "skills_gap.missing": "Missing Skills",
+    "skills_gap.recommendations": "Learning Recommendations",
+    "skills_gap.proficiency": "Proficiency",
+    "skills_gap.importance": "Importance",
+    "skills_gap.no_resumes": "You have no resumes. Upload one first.",
+    "skills_gap.no_jobs": "No jobs available for comparison.",
+    "skills_gap.high": "High",
+    "skills_gap.medium": "Medium",
+    "skills_gap.low": "Low",
+    "nav.skills_gap": "Skills Gap",
+    "footer.copy": "AI-Powered Resume Platform",
+}
+
+LOCALE_OVERRIDES: dict[str, dict[str, str]] = {
+    "hi": {
+        "app.name": "समर्थ AI रिज़्यूमे प्लेटफॉर्म",
+        "nav.home": "होम",
+        "nav.dashboard": "डैशबोर्ड",
+        "nav.resumes": "रिज़्यूमे",
+        "nav.jobs": "नौकरियाँ",
+        "nav.applications": "आवेदन",
+        "nav.analysis": "मार्केट विश्लेषण",
+        "nav.login": "लॉगिन",
+        "nav.register": "रजिस्टर",
+        "nav.logout": "लॉगआउट",
+        "common.submit": "जमा करें",
+        "common.cancel": "रद्द करें",
+        "common.view": "देखें",
+        "common.view_all": "सभी देखें",
+        "common.create": "बनाएँ",
+        "common.update": "अपडेट",
+        "common.delete": "हटाएँ",
+        "common.language": "भाषा",
+        "common.back": "वापस",
+        "common.close": "बंद करें",
+        "common.skip_to_content": "मुख्य सामग्री पर जाएँ",
+        "common.yes": "हाँ",
+        "common.no": "नहीं",
+        "common.name": "नाम",
+        "common.email": "ईमेल",
+        "common.phone": "फ़ोन",
+        "common.date": "तारीख",
+        "common.status": "स्थिति",
+        "home.hero.title": "AI-संचालित रिज़्यूमे और जॉब मैचिंग",
+        "home.hero.subtitle": "AI की मदद से बेहतर रिज़्यूमे बनाएँ, उपयुक्त भूमिकाएँ खोजें।",
+        "home.how_it_works": "यह कैसे काम करता है",
+        "home.step1.title": "अपना रिज़्यूमे अपलोड करें",
+        "home.step1.desc": "हमारा AI आपके रिज़्यूमे का विश्लेषण करता है।",
+        "home.step2.title": "मैचिंग जॉब खोजें",
+        "home.step2.desc": "अपने कौशल के आधार पर नौकरी सिफारिशें प्राप्त करें।",
+        "home.step3.title": "अपना मैच सुधारें",
+        "home.step3.desc": "रिज़्यूमे सुधारने के लिए प्रतिक्रिया प्राप्त करें।",
+        "home.features": "विशेषताएँ",
+        "home.jobseekers": "नौकरी खोजने वाले",
+        "home.recruiters": "भर्तीकर्ता",
+        "auth.login.title": "लॉगिन",
+        "auth.register.title": "खाता बनाएँ",
+        "auth.email": "ईमेल",
+        "auth.password": "पासवर्ड",
+        "auth.full_name": "पूरा नाम",
+        "auth.recruiter": "मैं एक रिक्रूटर हूँ",
+        "auth.register.success": "पंजीकरण सफल! कृपया लॉगिन करें।",
+        "auth.no_account": "खाता नहीं है?",
+        "auth.register_here": "यहाँ रजिस्टर करें",
+        "auth.have_account": "पहले से खाता है?",
+        "auth.login_here": "यहाँ लॉगिन करें",
+        "dashboard.recruiter": "रिक्रूटर डैशबोर्ड",
+        "dashboard.jobseeker": "नौकरी खोजने वाले का डैशबोर्ड",
+        "dashboard.active_jobs": "सक्रिय नौकरियाँ",
+        "dashboard.resumes": "रिज़्यूमे",
+        "dashboard.applications": "आवेदन",
+        "dashboard.add_resume": "रिज़्यूमे जोड़ें",
+        "dashboard.post_job": "नौकरी पोस्ट करें",
+        "dashboard.match_score": "मैच स्कोर",
+        "jobs.title": "नौकरियाँ",
+        "jobs.create": "नई नौकरी पोस्ट करें",
+        "jobs.required_skills": "आवश्यक कौशल",
+        "jobs.apply_now": "अभी आवेदन करें",
+        "jobs.description": "नौकरी विवरण",
+        "jobs.qualifications": "योग्यताएँ",
+        "jobs.responsibilities": "ज़िम्मेदारियाँ",
+        "resumes.title": "रिज़्यूमे",
+        "resumes.upload": "रिज़्यूमे अपलोड करें",
+        "resumes.skills": "कौशल",
+        "resumes.experience": "अनुभव",
+        "resumes.education": "शिक्षा",
+        "resumes.projects": "प्रोजेक्ट",
+        "resumes.certifications": "प्रमाणपत्र",
+        "applications.title": "आवेदन",
+        "applications.match_score": "मैच स्कोर",
+        "applications.details": "आवेदन विवरण",
+        "applications.feedback": "प्रतिक्रिया",
+        "applications.strengths": "ताकतें",
+        "status.new": "नया",
+        "status.reviewed": "समीक्षित",
+        "status.shortlisted": "शॉर्टलिस्ट",
+        "status.rejected": "अस्वीकृत",
+        "analysis.title": "नौकरी बाज़ार विश्लेषण",
+        "footer.copy": "AI-संचालित रिज़्यूमे प्लेटफॉर्म",
+        "nav.skills_gap": "स्किल्स गैप",
+        "skills_gap.title": "स्किल्स गैप विश्लेषण",
+        "skills_gap.description": "नौकरी की आवश्यकताओं के विरुद्ध अपने रिज़्यूमे के कौशल की तुलना करें।",
+        "skills_gap.select_resume": "रिज़्यूमे चुनें",
+        "skills_gap.select_job": "नौकरी चुनें",
+        "skills_gap.analyze": "स्किल्स गैप विश्लेषण करें",
+        "skills_gap.score": "गैप स्कोर",
+        "skills_gap.matched": "मेल खाने वाले कौशल",
+        "skills_gap.missing": "लापता कौशल",
+        "skills_gap.recommendations": "सीखने की सिफारिशें",
+        "skills_gap.proficiency": "दक्षता",
+        "skills_gap.importance": "महत्व",
+        "skills_gap.no_resumes": "आपके पास कोई रिज़्यूमे नहीं है। पहले अपलोड करें।",
+        "skills_gap.no_jobs": "तुलना के लिए कोई नौकरी उपलब्ध नहीं है।",
+        "skills_gap.high": "उच्च",
+        "skills_gap.medium": "मध्यम",
+        "skills_gap.low": "निम्न",
+        "jobs.edit": "नौकरी संपादित करें",
+        "jobs.edit_submit": "नौकरी अपडेट करें",
+        "jobs.delete": "नौकरी हटाएँ",
+        "jobs.delete_confirm": "क्या आप वाकई इस नौकरी को हटाना चाहते हैं?",
+        "jobs.location": "स्थान",
+        "jobs.salary_range": "वेतन सीमा",
+        "jobs.salary_min": "न्यूनतम वेतन",
+        "jobs.salary_max": "अधिकतम वेतन",
+        "jobs.job_type": "रोज़गार प्रकार",
+        "jobs.is_remote": "दूरस्थ कार्य",
+        "jobs.experience_level": "अनुभव स्तर",
+        "jobs.type.full_time": "पूर्णकालिक",
+        "jobs.type.part_time": "अंशकालिक",
+        "jobs.type.contract": "अनुबंध",
+        "jobs.type.internship": "इंटर्नशिप",
+        "jobs.level.entry": "प्रवेश स्तर",
+        "jobs.level.mid": "मध्य स्तर",
+        "jobs.level.senior": "वरिष्ठ स्तर",
+        "jobs.level.lead": "लीड / प्रमुख",
+        "user.phone": "फ़ोन नंबर",
+        "user.bio": "परिचय",
+        "user.location": "स्थान",
+        "user.profile_picture": "प्रोफ़ाइल चित्र",
+        "applications.cover_letter": "कवर लेटर",
+        "applications.cover_letter_placeholder": "बताएं कि आप इस भूमिका के लिए क्यों सबसे उपयुक्त हैं...",
+        "applications.scoring_pending": "अस्थायी स्कोर, अंतिम स्कोरिंग जारी है",
+        "applications.scoring_failed": "अंतिम स्कोरिंग विफल, अस्थायी स्कोर दिखाया जा रहा है",
+        "common.load_more": "और लोड करें",
+        "common.loading": "लोड हो रहा है…",
+        "resumes.panel_unavailable": "यह अनुभाग अभी उपलब्ध नहीं है। फिर से कोशिश करने के लिए पेज रीलोड करें।",
+    },
+    "es": {
+        "app.name": "Samarth AI Plataforma de Currículum",
+        "nav.home": "Inicio",
+        "nav.dashboard": "Panel",
+        "nav.resumes": "Currículums",
+        "nav.jobs": "Empleos",
+        "nav.applications": "Solicitudes",
+        "nav.analysis": "Análisis de mercado",
+        "nav.login": "Iniciar sesión",
+        "nav.register": "Registrarse",
+        "nav.logout": "Cerrar sesión",
+        "common.submit": "Enviar",
+        "common.cancel": "Cancelar",
+        "common.view": "Ver",
+        "common.view_all": "Ver todo",
+        "common.create": "Crear",
+        "common.update": "Actualizar",
+        "common.delete": "Eliminar",
+        "common.language": "Idioma",
+        "common.back": "Atrás",
+        "common.close": "Cerrar",
+        "common.skip_to_content": "Ir al contenido",
+        "common.yes": "Sí",
+        "common.no": "No",
+        "common.name": "Nombre",
+        "common.email": "Correo",
+        "common.phone": "Teléfono",
+        "common.date": "Fecha",
+        "common.status": "Estado",
+        "home.hero.title": "Coincidencia de Currículum y Empleo con IA",
+        "home.hero.subtitle": "Crea mejores currículums, descubre roles relevantes y mejora tus solicitudes con IA.",
+        "home.how_it_works": "Cómo funciona",
+        "home.step1.title": "Sube tu currículum",
+        "home.step1.desc": "Nuestra IA analiza tu currículum, extrayendo habilidades y experiencia.",
+        "home.step2.title": "Encuentra empleos coincidentes",
+        "home.step2.desc": "Obtén recomendaciones personalizadas según tu perfil.",
+        "home.step3.title": "Mejora tu coincidencia",
+        "home.step3.desc": "Recibe comentarios prácticos para mejorar tu currículum.",
+        "home.features": "Características",
+        "home.jobseekers": "Solicitantes de empleo",
+        "home.recruiters": "Reclutadores",
+        "auth.login.title": "Iniciar sesión",
+        "auth.register.title": "Crear cuenta",
+        "auth.email": "Correo electrónico",
+        "auth.password": "Contraseña",
+        "auth.full_name": "Nombre completo",
+        "auth.recruiter": "Soy reclutador",
+        "auth.register.success": "¡Registro exitoso! Por favor inicia sesión.",
+        "auth.no_account": "¿No tienes cuenta?",
+        "auth.register_here": "Regístrate aquí",
+        "auth.have_account": "¿Ya tienes cuenta?",
+        "auth.login_here": "Inicia sesión aquí",
+        "dashboard.recruiter": "Panel del reclutador",
+        "dashboard.jobseeker": "Panel del candidato",
+        "dashboard.active_jobs": "Empleos activos",
+        "dashboard.resumes": "Currículums",
+        "dashboard.applications": "Solicitudes",
+        "dashboard.add_resume": "Agregar currículum",
+        "dashboard.post_job": "Publicar empleo",
+        "dashboard.match_score": "Puntuación",
+        "jobs.title": "Empleos",
+        "jobs.create": "Publicar empleo",
+        "jobs.required_skills": "Habilidades requeridas",
+        "jobs.apply_now": "Aplicar ahora",
+        "jobs.description": "Descripción del empleo",
+        "jobs.qualifications": "Calificaciones",
+        "jobs.responsibilities": "Responsabilidades",
+        "resumes.title": "Currículums",
+        "resumes.upload": "Subir currículum",
+        "resumes.skills": "Habilidades",
+        "resumes.experience": "Experiencia",
+        "resumes.education": "Educación",
+        "resumes.projects": "Proyectos",
+        "resumes.certifications": "Certificaciones",
+        "applications.title": "Solicitudes",
+        "applications.match_score": "Puntuación",
+        "applications.details": "Detalles de solicitud",
+        "applications.feedback": "Comentarios",
+        "applications.strengths": "Fortalezas",
+        "status.new": "Nuevo",
+        "status.reviewed": "Revisado",
+        "status.shortlisted": "Preseleccionado",
+        "status.rejected": "Rechazado",
+        "analysis.title": "Análisis del mercado laboral",
+        "footer.copy": "Plataforma de currículum con IA",
+        "nav.skills_gap": "Brecha de habilidades",
+        "skills_gap.title": "Análisis de brecha de habilidades",
+        "skills_gap.description": "Compare sus habilidades con los requisitos del empleo para identificar brechas.",
+        "skills_gap.select_resume": "Seleccionar currículum",
+        "skills_gap.select_job": "Seleccionar empleo",
+        "skills_gap.analyze": "Analizar brecha de habilidades",
+        "skills_gap.score": "Puntuación de brecha",
+        "skills_gap.matched": "Habilidades coincidentes",
+        "skills_gap.missing": "Habilidades faltantes",
+        "skills_gap.recommendations": "Recomendaciones de aprendizaje",
+        "skills_gap.proficiency": "Dominio",
+        "skills_gap.importance": "Importancia",
+        "skills_gap.no_resumes": "No tienes currículums. Sube uno primero.",
+        "skills_gap.no_jobs": "No hay empleos disponibles para comparar.",
+        "skills_gap.high": "Alto",
+        "skills_gap.medium": "Medio",
+        "skills_gap.low": "Bajo",
+        "jobs.edit": "Editar empleo",
+        "jobs.edit_submit": "Actualizar empleo",
+        "jobs.delete": "Eliminar empleo",
+        "jobs.delete_confirm": "¿Está seguro de que desea eliminar este empleo?",
+        "jobs.location": "Ubicación",
+        "jobs.salary_range": "Rango salarial",
+        "jobs.salary_min": "Salario mínimo",
+        "jobs.salary_max": "Salario máximo",
+        "jobs.job_type": "Tipo de empleo",
+        "jobs.is_remote": "Trabajo remoto",
+        "jobs.experience_level": "Nivel de experiencia",
+        "jobs.type.full_time": "Tiempo completo",
+        "jobs.type.part_time": "Medio tiempo",
+        "jobs.type.contract": "Contrato",
+        "jobs.type.internship": "Pasantía",
+        "jobs.level.entry": "Nivel inicial",
+        "jobs.level.mid": "Nivel intermedio",
+        "jobs.level.senior": "Nivel senior",
+        "jobs.level.lead": "Líder / Principal",
+        "user.phone": "Número de teléfono",
+        "user.bio": "Acerca de mí",
+        "user.location": "Ubicación",
+        "user.profile_picture": "Foto de perfil",
+        "applications.cover_letter": "Carta de presentación",
+        "applications.cover_letter_placeholder": "Explica brevemente por qué eres el candidato ideal para este puesto...",
+        "applications.scoring_pending": "Puntuación provisional, cálculo final en curso",
+        "applications.scoring_failed": "Falló el cálculo final, se muestra la puntuación provisional",
+        "common.load_more": "Cargar más",
+        "common.loading": "Cargando…",
+        "resumes.panel_unavailable": "Esta sección no está disponible ahora. Recarga la página para intentarlo de nuevo.",
+    },
+    "fr": {
+        "app.name": "Samarth AI Plateforme CV",
+        "nav.home": "Accueil",
+        "nav.dashboard": "Tableau de bord",
+        "nav.resumes": "CV",
+        "nav.jobs": "Emplois",
+        "nav.applications": "Candidatures",
+        "nav.analysis": "Analyse du marché",
+        "nav.login": "Connexion",
+        "nav.register": "S'inscrire",
+        "nav.logout": "Déconnexion",
+        "common.submit": "Soumettre",
+        "common.cancel": "Annuler",
+        "common.view": "Voir",
+        "common.view_all": "Tout voir",
+        "common.create": "Créer",
+        "common.update": "Mettre à jour",
+        "common.delete": "Supprimer",
+        "common.language": "Langue",
+        "common.back": "Retour",
+        "common.close": "Fermer",
+        "common.skip_to_content": "Aller au contenu",
+        "common.yes": "Oui",
+        "common.no": "Non",
+        "common.name": "Nom",
+        "common.email": "E-mail",
+        "common.phone": "Téléphone",
+        "common.date": "Date",
+        "common.status": "Statut",
+        "home.hero.title": "Correspondance CV et emploi par IA",
+        "home.hero.subtitle": "Créez de meilleurs CV et améliorez vos candidatures avec l'IA.",
+        "home.how_it_works": "Comment ça marche",
+        "home.step1.title": "Téléchargez votre CV",
+        "home.step1.desc": "Notre IA analyse votre CV et extrait compétences et expérience.",
+        "home.step2.title": "Trouvez des emplois correspondants",
+        "home.step2.desc": "Obtenez des recommandations personnalisées selon votre profil.",
+        "home.step3.title": "Améliorez votre correspondance",
+        "home.step3.desc": "Recevez des conseils pratiques pour améliorer votre CV.",
+        "home.features": "Fonctionnalités",
+        "home.jobseekers": "Chercheurs d'emploi",
+        "home.recruiters": "Recruteurs",
+        "auth.login.title": "Connexion",
+        "auth.register.title": "Créer un compte",
+        "auth.email": "Adresse e-mail",
+        "auth.password": "Mot de passe",
+        "auth.full_name": "Nom complet",
+        "auth.recruiter": "Je suis recruteur",
+        "auth.register.success": "Inscription réussie ! Veuillez vous connecter.",
+        "auth.no_account": "Pas de compte ?",
+        "auth.register_here": "Inscrivez-vous ici",
+        "auth.have_account": "Déjà un compte ?",
+        "auth.login_here": "Connectez-vous ici",
+        "dashboard.recruiter": "Tableau de bord recruteur",
+        "dashboard.jobseeker": "Tableau de bord candidat",
+        "dashboard.active_jobs": "Emplois actifs",
+        "dashboard.resumes": "CV",
+        "dashboard.applications": "Candidatures",
+        "dashboard.add_resume": "Ajouter un CV",
+        "dashboard.post_job": "Publier un emploi",
+        "dashboard.match_score": "Score de correspondance",
+        "jobs.title": "Emplois",
+        "jobs.create": "Publier un emploi",
+        "jobs.required_skills": "Compétences requises",
+        "jobs.apply_now": "Postuler maintenant",
+        "jobs.description": "Description du poste",
+        "jobs.qualifications": "Qualifications",
+        "jobs.responsibilities": "Responsabilités",
+        "resumes.title": "CV",
+        "resumes.upload": "Télécharger un CV",
+        "resumes.skills": "Compétences",
+        "resumes.experience": "Expérience",
+        "resumes.education": "Formation",
+        "resumes.projects": "Projets",
+        "resumes.certifications": "Certifications",
+        "applications.title": "Candidatures",
+        "applications.match_score": "Score",
+        "applications.details": "Détails de la candidature",
+        "applications.feedback": "Retour",
+        "applications.strengths": "Points forts",
+        "status.new": "Nouveau",
+        "status.reviewed": "Examiné",
+        "status.shortlisted": "Présélectionné",
+        "status.rejected": "Rejeté",
+        "analysis.title": "Analyse du marché de l'emploi",
+        "footer.copy": "Plateforme CV propulsée par IA",
+        "nav.skills_gap": "Écart de compétences",
+        "skills_gap.title": "Analyse de l'écart de compétences",
+        "skills_gap.description": "Comparez vos compétences avec les exigences du poste pour identifier les lacunes.",
+        "skills_gap.select_resume": "Sélectionner un CV",
+        "skills_gap.select_job": "Sélectionner un emploi",
+        "skills_gap.analyze": "Analyser l'écart de compétences",
+        "skills_gap.score": "Score d'écart",
+        "skills_gap.matched": "Compétences correspondantes",
+        "skills_gap.missing": "Compétences manquantes",
+        "skills_gap.recommendations": "Recommandations d'apprentissage",
+        "skills_gap.proficiency": "Maîtrise",
+        "skills_gap.importance": "Importance",
+        "skills_gap.no_resumes": "Vous n'avez pas de CV. Téléchargez-en un d'abord.",
+        "skills_gap.no_jobs": "Aucun emploi disponible pour la comparaison.",
+        "skills_gap.high": "Élevé",
+        "skills_gap.medium": "Moyen",
+        "skills_gap.low": "Faible",
+        "jobs.edit": "Modifier l'emploi",
+        "jobs.edit_submit": "Mettre à jour l'emploi",
+        "jobs.delete": "Supprimer l'emploi",
+        "jobs.delete_confirm": "Êtes-vous sûr de vouloir supprimer cet emploi ?",
+        "jobs.location": "Lieu",
+        "jobs.salary_range": "Fourchette salariale",
+        "jobs.salary_min": "Salaire minimum",
+        "jobs.salary_max": "Salaire maximum",
+        "jobs.job_type": "Type d'emploi",
+        "jobs.is_remote": "Télétravail",
+        "jobs.experience_level": "Niveau d'expérience",
+        "jobs.type.full_time": "Temps plein",
+        "jobs.type.part_time": "Temps partiel",
+        "jobs.type.contract": "Contrat",
+        "jobs.type.internship": "Stage",
+        "jobs.level.entry": "Débutant",
+        "jobs.level.mid": "Intermédiaire",
+        "jobs.level.senior": "Sénior",
+        "jobs.level.lead": "Lead / Principal",
+        "user.phone": "Numéro de téléphone",
+        "user.bio": "À propos de moi",
+        "user.location": "Lieu",
+        "user.profile_picture": "Photo de profil",
+        "applications.cover_letter": "Lettre de motivation",
+        "applications.cover_letter_placeholder": "Expliquez brièvement pourquoi vous êtes le candidat idéal pour ce poste...",
+        "applications.scoring_pending": "Score provisoire, calcul final en cours",
+        "applications.scoring_failed": "Échec du calcul final, score provisoire affiché",
+        "common.load_more": "Charger plus",
+        "common.loading": "Chargement…",
+        "resumes.panel_unavailable": "Cette section n'est pas disponible pour le moment. Rechargez la page pour réessayer.",
+    },
+    "de": {
+        "app.name": "Samarth AI Lebenslauf-Plattform",
+        "nav.home": "Startseite",
+        "nav.dashboard": "Dashboard",
+        "nav.resumes": "Lebensläufe",
+        "nav.jobs": "Jobs",
+        "nav.applications": "Bewerbungen",
+        "nav.analysis": "Marktanalyse",
+        "nav.login": "Anmelden",
+        "nav.register": "Registrieren",
+        "nav.logout": "Abmelden",
+        "common.submit": "Absenden",
+        "common.cancel": "Abbrechen",
+        "common.view": "Ansehen",
+        "common.create": "Erstellen",
+        "common.update": "Aktualisieren",
+        "common.delete": "Löschen",
+        "common.language": "Sprache",
+        "common.back": "Zurück",
+        "common.close": "Schließen",
+        "common.yes": "Ja",
+        "common.no": "Nein",
+        "common.name": "Name",
+        "common.email": "E-Mail",
+        "common.phone": "Telefon",
+        "common.date": "Datum",
+        "common.status": "Status",
+        "home.hero.title": "KI-gestützter Lebenslauf- und Job-Abgleich",
+        "home.hero.subtitle": "Erstellen Sie bessere Lebensläufe und verbessern Sie Ihre Bewerbungen mit KI.",
+        "home.how_it_works": "So funktioniert's",
+        "home.step1.title": "Lebenslauf hochladen",
+        "home.step1.desc": "Unsere KI analysiert Ihren Lebenslauf und extrahiert Fähigkeiten und Erfahrung.",
+        "home.step2.title": "Passende Jobs finden",
+        "home.step2.desc": "Erhalten Sie personalisierte Empfehlungen basierend auf Ihrem Profil.",
+        "home.step3.title": "Ihre Übereinstimmung verbessern",
+        "home.step3.desc": "Erhalten Sie praktische Hinweise zur Verbesserung Ihres Lebenslaufs.",
+        "home.features": "Funktionen",
+        "home.jobseekers": "Jobsuchende",
+        "home.recruiters": "Recruiter",
+        "auth.login.title": "Anmelden",
+        "auth.register.title": "Konto erstellen",
+        "auth.email": "E-Mail",
+        "auth.password": "Passwort",
+        "auth.full_name": "Vollständiger Name",
+        "auth.recruiter": "Ich bin Recruiter",
+        "auth.register.success": "Registrierung erfolgreich! Bitte anmelden.",
+        "auth.no_account": "Kein Konto?",
+        "auth.register_here": "Hier registrieren",
+        "auth.have_account": "Bereits ein Konto?",
+        "auth.login_here": "Hier anmelden",
+        "dashboard.recruiter": "Recruiter-Dashboard",
+        "dashboard.jobseeker": "Bewerber-Dashboard",
+        "dashboard.active_jobs": "Aktive Jobs",
+        "dashboard.resumes": "Lebensläufe",
+        "dashboard.applications": "Bewerbungen",
+        "dashboard.add_resume": "Lebenslauf hinzufügen",
+        "dashboard.post_job": "Job veröffentlichen",
+        "dashboard.match_score": "Übereinstimmung",
+        "jobs.title": "Jobs",
+        "jobs.create": "Job veröffentlichen",
+        "jobs.required_skills": "Erforderliche Fähigkeiten",
+        "jobs.apply_now": "Jetzt bewerben",
+        "jobs.description": "Stellenbeschreibung",
+        "jobs.qualifications": "Qualifikationen",
+        "jobs.responsibilities": "Aufgaben",
+        "resumes.title": "Lebensläufe",
+        "resumes.upload": "Lebenslauf hochladen",
+        "resumes.skills": "Fähigkeiten",
+        "resumes.experience": "Erfahrung",
+        "resumes.education": "Ausbildung",
+        "resumes.projects": "Projekte",
+        "resumes.certifications": "Zertifikate",
+        "applications.title": "Bewerbungen",
+        "applications.match_score": "Score",
+        "applications.details": "Bewerbungsdetails",
+        "applications.feedback": "Rückmeldung",
+        "applications.strengths": "Stärken",
+        "status.new": "Neu",
+        "status.reviewed": "Überprüft",
+        "status.shortlisted": "Vorauswahl",
+        "status.rejected": "Abgelehnt",
+        "analysis.title": "Arbeitsmarktanalyse",
+        "footer.copy": "KI-gestützte Lebenslauf-Plattform",
+        "nav.skills_gap": "Kompetenzlücke",
+        "skills_gap.title": "Kompetenzlückenanalyse",
+        "skills_gap.description": "Vergleichen Sie Ihre Fähigkeiten mit den Stellenanforderungen, um Lücken zu identifizieren.",
+        "skills_gap.select_resume": "Lebenslauf auswählen",
+        "skills_gap.select_job": "Job auswählen",
+        "skills_gap.analyze": "Kompetenzlücke analysieren",
+        "skills_gap.score": "Lücken-Score",
+        "skills_gap.matched": "Übereinstimmende Fähigkeiten",
+        "skills_gap.missing": "Fehlende Fähigkeiten",
+        "skills_gap.recommendations": "Lernempfehlungen",
+        "skills_gap.proficiency": "Kenntnisstand",
+        "skills_gap.importance": "Wichtigkeit",
+        "skills_gap.no_resumes": "Sie haben keine Lebensläufe. Laden Sie zuerst einen hoch.",
+        "skills_gap.no_jobs": "Keine Jobs für den Vergleich verfügbar.",
+        "skills_gap.high": "Hoch",
+        "skills_gap.medium": "Mittel",
+        "skills_gap.low": "Niedrig",
+        "jobs.edit": "Job bearbeiten",
+        "jobs.edit_submit": "Job aktualisieren",
+        "jobs.delete": "Job löschen",
+        "jobs.delete_confirm": "Möchten Sie diesen Job wirklich löschen?",
+        "jobs.location": "Standort",
+        "jobs.salary_range": "Gehaltsbereich",
+        "jobs.salary_min": "Mindestgehalt",
+        "jobs.salary_max": "Höchstgehalt",
+        "jobs.job_type": "Beschäftigungsart",
+        "jobs.is_remote": "Remote-Arbeit",
+        "jobs.experience_level": "Erfahrungsstufe",
+        "jobs.type.full_time": "Vollzeit",
+        "jobs.type.part_time": "Teilzeit",
+        "jobs.type.contract": "Vertrag",
+        "jobs.type.internship": "Praktikum",
+        "jobs.level.entry": "Einstiegsniveau",
+        "jobs.level.mid": "Mittelniveau",
+        "jobs.level.senior": "Senior-Niveau",
+        "jobs.level.lead": "Lead / Principal",
+        "user.phone": "Telefonnummer",
+        "user.bio": "Über mich",
+        "user.location": "Standort",
+        "user.profile_picture": "Profilbild",
+        "applications.cover_letter": "Anschreiben",
+        "applications.cover_letter_placeholder": "Erklären Sie kurz, warum Sie die ideale Besetzung für diese Stelle sind...",
+        "applications.scoring_pending": "Vorläufige Bewertung, endgültige Bewertung läuft",
+        "applications.scoring_failed": "Endgültige Bewertung fehlgeschlagen, vorläufige Bewertung angezeigt",
+        "common.load_more": "Mehr laden",
+        "common.loading": "Wird geladen…",
+        "resumes.panel_unavailable": "Dieser Bereich ist gerade nicht verfügbar. Laden Sie die Seite neu, um es erneut zu versuchen.",
+    },
+    "zh": {
+        "app.name": "Samarth AI 简历平台",
+        "nav.home": "首页",
+        "nav.dashboard": "仪表板",
+        "nav.resumes": "简历",
+        "nav.jobs": "职位",
+        "nav.applications": "申请",
+        "nav.analysis": "市场分析",
+        "nav.login": "登录",
+        "nav.register": "注册",
+        "nav.logout": "退出",
+        "common.submit": "提交",
+        "common.cancel": "取消",
+        "common.view": "查看",
+        "common.view_all": "查看全部",
+        "common.create": "创建",
+        "common.update": "更新",
+        "common.delete": "删除",
+        "common.language": "语言",
+        "common.back": "返回",
+        "common.close": "关闭",
+        "common.yes": "是",
+        "common.no": "否",
+        "common.name": "姓名",
+        "common.email": "邮箱",
+        "common.phone": "电话",
+        "common.date": "日期",
+        "common.status": "状态",
+        "home.hero.title": "AI驱动的简历与职位匹配",
+        "home.hero.subtitle": "利用AI打造更好的简历，发现相关职位，提升您的申请。",
+        "home.how_it_works": "工作原理",
+        "home.step1.title": "上传简历",
+        "home.step1.desc": "AI分析您的简历，自动提取技能、经验和资质。",
+        "home.step2.title": "查找匹配职位",
+        "home.step2.desc": "根据您的技能和经验获取个性化职位推荐。",
+        "home.step3.title": "提升匹配度",
+        "home.step3.desc": "获取可操作的反馈以提升简历和匹配分数。",
+        "home.features": "功能特点",
+        "home.jobseekers": "求职者",
+        "home.recruiters": "招聘者",
+        "auth.login.title": "登录",
+        "auth.register.title": "创建账户",
+        "auth.email": "邮箱",
+        "auth.password": "密码",
+        "auth.full_name": "全名",
+        "auth.recruiter": "我是招聘人员",
+        "auth.register.success": "注册成功！请登录。",
+        "auth.no_account": "没有账户？",
+        "auth.register_here": "在此注册",
+        "auth.have_account": "已有账户？",
+        "auth.login_here": "在此登录",
+        "dashboard.recruiter": "招聘人员仪表板",
+        "dashboard.jobseeker": "求职者仪表板",
+        "dashboard.active_jobs": "活跃职位",
+        "dashboard.resumes": "简历",
+        "dashboard.applications": "申请",
+        "dashboard.add_resume": "添加简历",
+        "dashboard.post_job": "发布职位",
+        "dashboard.match_score": "匹配分数",
+        "jobs.title": "职位",
+        "jobs.create": "发布职位",
+        "jobs.required_skills": "必需技能",
+        "jobs.apply_now": "立即申请",
+        "jobs.description": "职位描述",
+        "jobs.qualifications": "任职资格",
+        "jobs.responsibilities": "工作职责",
+        "resumes.title": "简历",
+        "resumes.upload": "上传简历",
+        "resumes.skills": "技能",
+        "resumes.experience": "经验",
+        "resumes.education": "教育",
+        "resumes.projects": "项目",
+        "resumes.certifications": "证书",
+        "applications.title": "申请",
+        "applications.match_score": "匹配分数",
+        "applications.details": "申请详情",
+        "applications.feedback": "反馈",
+        "applications.strengths": "优势",
+        "status.new": "新建",
+        "status.reviewed": "已审核",
+        "status.shortlisted": "已入围",
+        "status.rejected": "已拒绝",
+        "analysis.title": "就业市场分析",
+        "footer.copy": "AI驱动简历平台",
+        "nav.skills_gap": "技能差距",
+        "skills_gap.title": "技能差距分析",
+        "skills_gap.description": "将您的技能与职位要求进行比较，找出差距并获取学习建议。",
+        "skills_gap.select_resume": "选择简历",
+        "skills_gap.select_job": "选择职位",
+        "skills_gap.analyze": "分析技能差距",
+        "skills_gap.score": "差距分数",
+        "skills_gap.matched": "匹配技能",
+        "skills_gap.missing": "缺失技能",
+        "skills_gap.recommendations": "学习建议",
+        "skills_gap.proficiency": "熟练度",
+        "skills_gap.importance": "重要性",
+        "skills_gap.no_resumes": "您还没有简历。请先上传一份。",
+        "skills_gap.no_jobs": "没有可比较的职位。",
+        "skills_gap.high": "高",
+        "skills_gap.medium": "中",
+        "skills_gap.low": "低",
+        "jobs.edit": "编辑职位",
+        "jobs.edit_submit": "更新职位",
+        "jobs.delete": "删除职位",
+        "jobs.delete_confirm": "您确定要删除此职位吗？",
+        "jobs.location": "地点",
+        "jobs.salary_range": "薪资范围",
+        "jobs.salary_min": "最低薪资",
+        "jobs.salary_max": "最高薪资",
+        "jobs.job_type": "就业类型",
+        "jobs.is_remote": "远程工作",
+        "jobs.experience_level": "经验级别",
+        "jobs.type.full_time": "全职",
+        "jobs.type.part_time": "兼职",
+        "jobs.type.contract": "合同制",
+        "jobs.type.internship": "实习",
+        "jobs.level.entry": "入门级",
+        "jobs.level.mid": "中级",
+        "jobs.level.senior": "高级",
+        "jobs.level.lead": "领导 / 首席",
+        "user.phone": "电话号码",
+        "user.bio": "关于我",
+        "user.location": "地点",
+        "user.profile_picture": "头像",
+        "applications.cover_letter": "求职信",
+        "applications.cover_letter_placeholder": "请简要说明您为何是该职位的理想候选人...",
+        "applications.scoring_pending": "临时评分，最终评分进行中",
+        "applications.scoring_failed": "最终评分失败，显示临时评分",
+        "common.load_more": "加载更多",
+        "common.loading": "加载中…",
+        "resumes.panel_unavailable": "此部分暂时不可用。请刷新页面重试。",
+    },
+    "ja": {
+        "app.name": "Samarth AI 履歴書プラットフォーム",
+        "nav.home": "ホーム",
+        "nav.dashboard": "ダッシュボード",
+        "nav.resumes": "履歴書",
+        "nav.jobs": "求人",
+        "nav.applications": "応募",
+        "nav.analysis": "市場分析",
+        "nav.login": "ログイン",
+        "nav.register": "登録",
+        "nav.logout": "ログアウト",
+        "common.submit": "送信",
+        "common.cancel": "キャンセル",
+        "common.view": "表示",
+        "common.view_all": "すべて表示",
+        "common.create": "作成",
+        "common.update": "更新",
+        "common.delete": "削除",
+        "common.language": "言語",
+        "common.back": "戻る",
+        "common.close": "閉じる",
+        "common.yes": "はい",
+        "common.no": "いいえ",
+        "common.name": "名前",
+        "common.email": "メール",
+        "common.phone": "電話",
+        "common.date": "日付",
+        "common.status": "ステータス",
+        "home.hero.title": "AIによる履歴書と求人マッチング",
+        "home.hero.subtitle": "AIでより良い履歴書を作成し、関連する職種を発見しましょう。",
+        "home.how_it_works": "使い方",
+        "home.step1.title": "履歴書をアップロード",
+        "home.step1.desc": "AIが履歴書を分析し、スキルと経験を自動抽出します。",
+        "home.step2.title": "マッチする求人を検索",
+        "home.step2.desc": "プロフィールに基づいたパーソナライズされた求人推薦を取得。",
+        "home.step3.title": "マッチ度を改善",
+        "home.step3.desc": "履歴書を改善するための実践的なフィードバックを取得。",
+        "home.features": "機能",
+        "home.jobseekers": "求職者",
+        "home.recruiters": "採用担当者",
+        "auth.login.title": "ログイン",
+        "auth.register.title": "アカウント作成",
+        "auth.email": "メールアドレス",
+        "auth.password": "パスワード",
+        "auth.full_name": "氏名",
+        "auth.recruiter": "採用担当者です",
+        "auth.register.success": "登録完了！ログインしてください。",
+        "auth.no_account": "アカウントをお持ちでない方",
+        "auth.register_here": "こちらで登録",
+        "auth.have_account": "アカウントをお持ちの方",
+        "auth.login_here": "こちらでログイン",
+        "dashboard.recruiter": "採用担当ダッシュボード",
+        "dashboard.jobseeker": "求職者ダッシュボード",
+        "dashboard.active_jobs": "アクティブな求人",
+        "dashboard.resumes": "履歴書",
+        "dashboard.applications": "応募",
+        "dashboard.add_resume": "履歴書を追加",
+        "dashboard.post_job": "求人を投稿",
+        "dashboard.match_score": "マッチスコア",
+        "jobs.title": "求人",
+        "jobs.create": "求人を投稿",
+        "jobs.required_skills": "必須スキル",
+        "jobs.apply_now": "今すぐ応募",
+        "jobs.description": "求人内容",
+        "jobs.qualifications": "資格要件",
+        "jobs.responsibilities": "職務内容",
+        "resumes.title": "履歴書",
+        "resumes.upload": "履歴書をアップロード",
+        "resumes.skills": "スキル",
+        "resumes.experience": "経験",
+        "resumes.education": "学歴",
+        "resumes.projects": "プロジェクト",
+        "resumes.certifications": "資格",
+        "applications.title": "応募",
+        "applications.match_score": "マッチスコア",
+        "applications.details": "応募詳細",
+        "applications.feedback": "フィードバック",
+        "applications.strengths": "強み",
+        "status.new": "新規",
+        "status.reviewed": "確認済み",
+        "status.shortlisted": "候補リスト",
+        "status.rejected": "不採用",
+        "analysis.title": "求人市場分析",
+        "footer.copy": "AI搭載履歴書プラットフォーム",
+        "nav.skills_gap": "スキルギャップ",
+        "skills_gap.title": "スキルギャップ分析",
+        "skills_gap.description": "履歴書のスキルと求人要件を比較してギャップを特定します。",
+        "skills_gap.select_resume": "履歴書を選択",
+        "skills_gap.select_job": "求人を選択",
+        "skills_gap.analyze": "スキルギャップを分析",
+        "skills_gap.score": "ギャップスコア",
+        "skills_gap.matched": "一致したスキル",
+        "skills_gap.missing": "不足しているスキル",
+        "skills_gap.recommendations": "学習推薦",
+        "skills_gap.proficiency": "習熟度",
+        "skills_gap.importance": "重要度",
+        "skills_gap.no_resumes": "履歴書がありません。先にアップロードしてください。",
+        "skills_gap.no_jobs": "比較できる求人がありません。",
+        "skills_gap.high": "高",
+        "skills_gap.medium": "中",
+        "skills_gap.low": "低",
+        "jobs.edit": "求人を編集",
+        "jobs.edit_submit": "求人を更新",
+        "jobs.delete": "求人を削除",
+        "jobs.delete_confirm": "この求人を削除してもよろしいですか？",
+        "jobs.location": "勤務地",
+        "jobs.salary_range": "給与範囲",
+        "jobs.salary_min": "最低給与",
+        "jobs.salary_max": "最高給与",
+        "jobs.job_type": "雇用形態",
+        "jobs.is_remote": "リモートワーク",
+        "jobs.experience_level": "経験レベル",
+        "jobs.type.full_time": "正社員",
+        "jobs.type.part_time": "非正規",
+        "jobs.type.contract": "契約社員",
+        "jobs.type.internship": "インターンシップ",
+        "jobs.level.entry": "エントリーレベル",
+        "jobs.level.mid": "ミドルレベル",
+        "jobs.level.senior": "シニアレベル",
+        "jobs.level.lead": "リード / プリンシパル",
+        "user.phone": "電話番号",
+        "user.bio": "自己紹介",
+        "user.location": "所在地",
+        "user.profile_picture": "プロフィール写真",
+        "applications.cover_letter": "カバーレター",
+        "applications.cover_letter_placeholder": "この職種に最適な理由を簡潔にお書きください...",
+        "applications.scoring_pending": "暫定スコア、最終スコアを計算中",
+        "applications.scoring_failed": "最終スコアの計算に失敗しました。暫定スコアを表示しています",
+        "common.load_more": "さらに読み込む",
+        "common.loading": "読み込み中…",
+        "resumes.panel_unavailable": "このセクションは現在利用できません。ページを再読み込みしてもう一度お試しください。",
+    },
+    "ko": {
+        "app.name": "Samarth AI 이력서 플랫폼",
+        "nav.home": "홈",
+        "nav.dashboard": "대시보드",
+        "nav.resumes": "이력서",
+        "nav.jobs": "채용",
+        "nav.applications": "지원서",
+        "nav.analysis": "시장 분석",
+        "nav.login": "로그인",
+        "nav.register": "가입",
+        "nav.logout": "로그아웃",
+        "common.submit": "제출",
+        "common.cancel": "취소",
+        "common.view": "보기",
+        "common.view_all": "전체 보기",
+        "common.create": "생성",
+        "common.update": "수정",
+        "common.delete": "삭제",
+        "common.language": "언어",
+        "common.back": "뒤로",
+        "common.close": "닫기",
+        "common.yes": "예",
+        "common.no": "아니오",
+        "common.name": "이름",
+        "common.email": "이메일",
+        "common.phone": "전화",
+        "common.date": "날짜",
+        "common.status": "상태",
+        "home.hero.title": "AI 기반 이력서 및 채용 매칭",
+        "home.hero.subtitle": "AI로 더 나은 이력서를 만들고 적합한 직무를 찾으세요.",
+        "home.how_it_works": "이용 방법",
+        "home.step1.title": "이력서 업로드",
+        "home.step1.desc": "AI가 이력서를 분석하여 기술과 경력을 자동 추출합니다.",
+        "home.step2.title": "매칭 채용 검색",
+        "home.step2.desc": "프로필 기반 맞춤형 채용 추천을 받으세요.",
+        "home.step3.title": "매칭도 개선",
+        "home.step3.desc": "이력서 개선을 위한 실질적인 피드백을 받으세요.",
+        "home.features": "기능",
+        "home.jobseekers": "구직자",
+        "home.recruiters": "채용담당자",
+        "auth.login.title": "로그인",
+        "auth.register.title": "계정 만들기",
+        "auth.email": "이메일",
+        "auth.password": "비밀번호",
+        "auth.full_name": "이름",
+        "auth.recruiter": "채용 담당자입니다",
+        "auth.register.success": "가입 완료! 로그인해 주세요.",
+        "auth.no_account": "계정이 없으신가요?",
+        "auth.register_here": "여기서 가입",
+        "auth.have_account": "이미 계정이 있으신가요?",
+        "auth.login_here": "여기서 로그인",
+        "dashboard.recruiter": "채용담당자 대시보드",
+        "dashboard.jobseeker": "구직자 대시보드",
+        "dashboard.active_jobs": "활성 채용",
+        "dashboard.resumes": "이력서",
+        "dashboard.applications": "지원서",
+        "dashboard.add_resume": "이력서 추가",
+        "dashboard.post_job": "채용 등록",
+        "dashboard.match_score": "매칭 점수",
+        "jobs.title": "채용",
+        "jobs.create": "채용 등록",
+        "jobs.required_skills": "필수 기술",
+        "jobs.apply_now": "지금 지원",
+        "resumes.title": "이력서",
+        "resumes.upload": "이력서 업로드",
+        "resumes.skills": "기술",
+        "resumes.experience": "경력",
+        "resumes.education": "학력",
+        "applications.title": "지원서",
+        "applications.match_score": "매칭 점수",
+        "applications.details": "지원 상세",
+        "applications.feedback": "피드백",
+        "applications.strengths": "강점",
+        "status.new": "신규",
+        "status.reviewed": "검토됨",
+        "status.shortlisted": "후보",
+        "status.rejected": "불합격",
+        "analysis.title": "채용 시장 분석",
+        "footer.copy": "AI 기반 이력서 플랫폼",
+        "nav.skills_gap": "스킬 갭",
+        "skills_gap.title": "스킬 갭 분석",
+        "skills_gap.description": "이력서 스킬을 채용 요건과 비교하여 갭을 파악하세요.",
+        "skills_gap.select_resume": "이력서 선택",
+        "skills_gap.select_job": "채용 선택",
+        "skills_gap.analyze": "스킬 갭 분석",
+        "skills_gap.score": "갭 점수",
+        "skills_gap.matched": "매칭된 스킬",
+        "skills_gap.missing": "부족한 스킬",
+        "skills_gap.recommendations": "학습 추천",
+        "skills_gap.proficiency": "숙련도",
+        "skills_gap.importance": "중요도",
+        "skills_gap.no_resumes": "이력서가 없습니다. 먼저 업로드하세요.",
+        "skills_gap.no_jobs": "비교할 채용이 없습니다.",
+        "skills_gap.high": "높음",
+        "skills_gap.medium": "중간",
+        "skills_gap.low": "낮음",
+        "jobs.edit": "채용 수정",
+        "jobs.edit_submit": "채용 업데이트",
+        "jobs.delete": "채용 삭제",
+        "jobs.delete_confirm": "이 채용을 삭제하시겠습니까?",
+        "jobs.location": "근무지",
+        "jobs.salary_range": "급여 범위",
+        "jobs.salary_min": "최저 급여",
+        "jobs.salary_max": "최고 급여",
+        "jobs.job_type": "고용 형태",
+        "jobs.is_remote": "원격 근무",
+        "jobs.experience_level": "경력 수준",
+        "jobs.type.full_time": "정규직",
+        "jobs.type.part_time": "파트타임",
+        "jobs.type.contract": "계약직",
+        "jobs.type.internship": "인턴십",
+        "jobs.level.entry": "신입",
+        "jobs.level.mid": "중급",
+        "jobs.level.senior": "시니어",
+        "jobs.level.lead": "리드 / 수석",
+        "user.phone": "전화번호",
+        "user.bio": "자기소개",
+        "user.location": "위치",
+        "user.profile_picture": "프로필 사진",
+        "applications.cover_letter": "자기소개서",
+        "applications.cover_letter_placeholder": "이 직무에 적합한 이유를 간단하게 써 주세요...",
+        "applications.scoring_pending": "임시 점수, 최종 점수 계산 중",
+        "applications.scoring_failed": "최종 점수 계산 실패, 임시 점수 표시 중",
+        "common.load_more": "더 보기",
+        "common.loading": "불러오는 중…",
+        "resumes.panel_unavailable": "지금은 이 섹션을 표시할 수 없습니다. 페이지를 새로고침하여 다시 시도하세요.",
+    },
+    "bn": {
+        "app.name": "সমর্থ AI রেজ্যুমে প্ল্যাটফর্ম",
+        "nav.home": "হোম",
+        "nav.dashboard": "ড্যাশবোর্ড",
+        "nav.resumes": "রেজ্যুমে",
+        "nav.jobs": "চাকরি",
+        "nav.applications": "আবেদন",
+        "nav.analysis": "বাজার বিশ্লেষণ",
+        "nav.login": "লগইন",
+        "nav.register": "রেজিস্টার",
+        "nav.logout": "লগআউট",
+        "common.submit": "জমা দিন",
+        "common.cancel": "বাতিল",
+        "common.language": "ভাষা",
+        "common.yes": "হ্যাঁ",
+        "common.no": "না",
+        "home.hero.title": "AI-চালিত রেজ্যুমে ও চাকরি ম্যাচিং",
+        "auth.login.title": "লগইন",
+        "auth.register.title": "অ্যাকাউন্ট তৈরি করুন",
+        "auth.email": "ইমেইল",
+        "auth.password": "পাসওয়ার্ড",
+        "auth.full_name": "পুরো নাম",
+        "auth.recruiter": "আমি একজন নিয়োগকারী",
+        "jobs.title": "চাকরি",
+        "resumes.title": "রেজ্যুমে",
+        "resumes.skills": "দক্ষতা",
+        "resumes.experience": "অভিজ্ঞতা",
+        "resumes.education": "শিক্ষা",
+        "applications.title": "আবেদন",
+        "status.new": "নতুন",
+        "status.reviewed": "পর্যালোচিত",
+        "status.shortlisted": "সংক্ষিপ্ত তালিকা",
+        "status.rejected": "প্রত্যাখ্যাত",
+        "analysis.title": "চাকরির বাজার বিশ্লেষণ",
+        "footer.copy": "AI-চালিত রেজ্যুমে প্ল্যাটফর্ম",
+        "nav.skills_gap": "স্কিল গ্যাপ",
+        "skills_gap.title": "স্কিল গ্যাপ বিশ্লেষণ",
+        "skills_gap.select_resume": "রেজ্যুমে নির্বাচন করুন",
+        "skills_gap.select_job": "চাকরি নির্বাচন করুন",
+        "skills_gap.analyze": "স্কিল গ্যাপ বিশ্লেষণ করুন",
+        "jobs.edit": "চাকরি সম্পাদনা করুন",
+        "jobs.delete": "চাকরি মুছুন",
+        "jobs.delete_confirm": "আপনি কি এই চাকরিটি মুছতে চান?",
+        "jobs.location": "অবস্থান",
+        "jobs.salary_range": "বেতন পরিসর",
+        "jobs.salary_min": "সর্বনিম্ন বেতন",
+        "jobs.salary_max": "সর্বোচ্চ বেতন",
+        "jobs.job_type": "কর্মসংস্থানের ধরন",
+        "jobs.is_remote": "দূরবর্তী কাজ",
+        "jobs.experience_level": "অভিজ্ঞতার স্তর",
+        "jobs.type.full_time": "পূর্ণকালীন",
+        "jobs.type.part_time": "খণ্ডকালীন",
+        "jobs.type.contract": "চুক্তিভিত্তিক",
+        "jobs.type.internship": "ইন্টার্নশিপ",
+        "jobs.level.entry": "প্রাথমিক স্তর",
+        "jobs.level.mid": "মধ্যবর্তী স্তর",
+        "jobs.level.senior": "সিনিয়র স্তর",
+        "jobs.level.lead": "লিড / প্রধান",
+        "user.phone": "ফোন নম্বর",
+        "user.bio": "পরিচয়",
+        "user.location": "অবস্থান",
+        "user.profile_picture": "প্রোফাইল ছবি",
+        "applications.cover_letter": "কভার লেটার",
+        "applications.cover_letter_placeholder": "সংক্ষেপে লিখুন কেন আপনি এই পদের জন্য উপযুক্ত...",
+        "applications.scoring_pending": "অস্থায়ী স্কোর, চূড়ান্ত স্কোরিং চলছে",
+        "applications.scoring_failed": "চূড়ান্ত স্কোরিং ব্যর্থ, অস্থায়ী স্কোর দেখানো হচ্ছে",
+        "common.load_more": "আরও লোড করুন",
+        "common.loading": "লোড হচ্ছে…",
+        "resumes.panel_unavailable": "এই অংশটি এখন উপলব্ধ নয়। আবার চেষ্টা করতে পৃষ্ঠাটি রিলোড করুন।",
+    },
+    "te": {
+        "app.name": "సమర్థ AI రెజ్యూమే ప్లాట్‌ఫారమ్",
+        "nav.home": "హోమ్",
+        "nav.dashboard": "డ్యాష్‌బోర్డ్",
+        "nav.resumes": "రెజ్యూమేలు",
+        "nav.jobs": "ఉద్యోగాలు",
+        "nav.applications": "దరఖాస్తులు",
+        "nav.analysis": "మార్కెట్ విశ్లేషణ",
+        "nav.login": "లాగిన్",
+        "nav.register": "నమోదు",
+        "nav.logout": "లాగౌట్",
+        "common.submit": "సమర్పించు",
+        "common.cancel": "రద్దు",
+        "common.language": "భాష",
+        "common.yes": "అవును",
+        "common.no": "కాదు",
+        "home.hero.title": "AI-ఆధారిత రెజ్యూమే మరియు ఉద్యోగ సరిపోలిక",
+        "auth.login.title": "లాగిన్",
+        "auth.register.title": "ఖాతా సృష్టించు",
+        "jobs.title": "ఉద్యోగాలు",
+        "resumes.title": "రెజ్యూమేలు",
+        "resumes.skills": "నైపుణ్యాలు",
+        "resumes.experience": "అనుభవం",
+        "resumes.education": "విద్య",
+        "applications.title": "దరఖాస్తులు",
+        "status.new": "కొత్త",
+        "status.reviewed": "సమీక్షించబడింది",
+        "status.shortlisted": "షార్ట్‌లిస్ట్",
+        "status.rejected": "తిరస్కరించబడింది",
+        "analysis.title": "ఉద్యోగ మార్కెట్ విశ్లేషణ",
+        "footer.copy": "AI-ఆధారిత రెజ్యూమే ప్లాట్‌ఫారమ్",
+        "nav.skills_gap": "స్కిల్ గ్యాప్",
+        "skills_gap.title": "స్కిల్ గ్యాప్ విశ్లేషణ",
+        "skills_gap.select_resume": "రెజ్యూమే ఎంచుకోండి",
+        "skills_gap.select_job": "ఉద్యోగం ఎంచుకోండి",
+        "skills_gap.analyze": "స్కిల్ గ్యాప్ విశ్లేషించండి",
+        "jobs.edit": "ఉద్యోగం సవరించు",
+        "jobs.delete": "ఉద్యోగం తొలగించు",
+        "jobs.delete_confirm": "మీరు ఈ ఉద్యోగాన్ని తొలగించాలనుకుంటున్నారా?",
+        "jobs.location": "స్థానం",
+        "jobs.salary_range": "వేతన పరిధి",
+        "jobs.salary_min": "కనిష్ట వేతనం",
+        "jobs.salary_max": "గరిష్ట వేతనం",
+        "jobs.job_type": "ఉద్యోగ రకం",
+        "jobs.is_remote": "రిమోట్ పని",
+        "jobs.experience_level": "అనుభవ స్థాయి",
+        "jobs.type.full_time": "పూర్ణకాలిక",
+        "jobs.type.part_time": "పార్ట్ టైమ్",
+        "jobs.type.contract": "కాంట్రాక్ట్",
+        "jobs.type.internship": "ఇంటర్న్‌షిప్",
+        "jobs.level.entry": "ప్రారంభ స్థాయి",
+        "jobs.level.mid": "మధ్యస్థ స్థాయి",
+        "jobs.level.senior": "సీనియర్ స్థాయి",
+        "jobs.level.lead": "లీడ్ / ప్రిన్సిపల్",
+        "user.phone": "ఫోన్ నంబర్",
+        "user.bio": "నా గురించి",
+        "user.location": "స్థానం",
+        "user.profile_picture": "ప్రొఫైల్ చిత్రం",
+        "applications.cover_letter": "కవర్ లెటర్",
+        "applications.cover_letter_placeholder": "ఈ పాత్రకు మీరు ఎందుకు సరైన అభ్యర్థి అనే విషయాన్ని సంక్షిప్తంగా వివరించండి...",
+        "applications.scoring_pending": "తాత్కాలిక స్కోర్, తుది స్కోరింగ్ జరుగుతోంది",
+        "applications.scoring_failed": "తుది స్కోరింగ్ విఫలమైంది, తాత్కాలిక స్కోర్ చూపబడుతోంది",
+        "common.load_more": "మరిన్ని లోడ్ చేయండి",
+        "common.loading": "లోడ్ అవుతోంది…",
+        "resumes.panel_unavailable": "ఈ విభాగం ప్రస్తుతం అందుబాటులో లేదు. మళ్లీ ప్రయత్నించడానికి పేజీని రీలోడ్ చేయండి.",
+    },
+    "mr": {
+        "app.name": "समर्थ AI रेझ्युमे प्लॅटफॉर्म",
+        "nav.home": "मुख्यपृष्ठ",
+        "nav.dashboard": "डॅशबोर्ड",
+        "nav.resumes": "रेझ्युमे",
+        "nav.jobs": "नोकऱ्या",
+        "nav.applications": "अर्ज",
+        "nav.analysis": "बाजार विश्लेषण",
+        "nav.login": "लॉगिन",
+        "nav.register": "नोंदणी",
+        "nav.logout": "लॉगआउट",
+        "common.submit": "सबमिट करा",
+        "common.cancel": "रद्द करा",
+        "common.language": "भाषा",
+        "common.yes": "होय",
+        "common.no": "नाही",
+        "home.hero.title": "AI-चालित रेझ्युमे आणि जॉब मॅचिंग",
+        "auth.login.title": "लॉगिन",
+        "auth.register.title": "खाते तयार करा",
+        "jobs.title": "नोकऱ्या",
+        "resumes.title": "रेझ्युमे",
+        "resumes.skills": "कौशल्ये",
+        "resumes.experience": "अनुभव",
+        "resumes.education": "शिक्षण",
+        "applications.title": "अर्ज",
+        "status.new": "नवीन",
+        "status.reviewed": "तपासलेले",
+        "status.shortlisted": "निवडलेले",
+        "status.rejected": "नाकारलेले",
+        "analysis.title": "नोकरी बाजार विश्लेषण",
+        "footer.copy": "AI-चालित रेझ्युमे प्लॅटफॉर्म",
+        "nav.skills_gap": "स्किल गॅप",
+        "skills_gap.title": "स्किल गॅप विश्लेषण",
+        "skills_gap.select_resume": "रेझ्युमे निवडा",
+        "skills_gap.select_job": "नोकरी निवडा",
+        "skills_gap.analyze": "स्किल गॅप विश्लेषण करा",
+        "jobs.edit": "नोकरी संपादित करा",
+        "jobs.delete": "नोकरी हटवा",
+        "jobs.delete_confirm": "तुम्हाला ही नोकरी हटवायची आहे का?",
+        "jobs.location": "ठिकाण",
+        "jobs.salary_range": "पगाराची श्रेणी",
+        "jobs.salary_min": "किमान पगार",
+        "jobs.salary_max": "कमाल पगार",
+        "jobs.job_type": "रोजगाराचा प्रकार",
+        "jobs.is_remote": "दूरस्थ काम",
+        "jobs.experience_level": "अनुभव पातळी",
+        "jobs.type.full_time": "पूर्णवेळ",
+        "jobs.type.part_time": "अर्धवेळ",
+        "jobs.type.contract": "करार",
+        "jobs.type.internship": "इंटर्नशिप",
+        "jobs.level.entry": "प्रवेश स्तर",
+        "jobs.level.mid": "मध्यम स्तर",
+        "jobs.level.senior": "वरिष्ठ स्तर",
+        "jobs.level.lead": "लीड / मुख्य",
+        "user.phone": "फोन नंबर",
+        "user.bio": "माझ्याबद्दल",
+        "user.location": "ठिकाण",
+        "user.profile_picture": "प्रोफाईल चित्र",
+        "applications.cover_letter": "कव्हर लेटर",
+        "applications.cover_letter_placeholder": "आपण या भूमिकेसाठी का योग्य आहात हे थोडक्यात सांगा...",
+        "applications.scoring_pending": "तात्पुरता स्कोअर, अंतिम स्कोअरिंग सुरू आहे",
+        "applications.scoring_failed": "अंतिम स्कोअरिंग अयशस्वी, तात्पुरता स्कोअर दाखवत आहे",
+        "common.load_more": "आणखी लोड करा",
+        "common.loading": "लोड होत आहे…",
+        "resumes.panel_unavailable": "हा विभाग सध्या उपलब्ध नाही. पुन्हा प्रयत्न करण्यासाठी पृष्ठ रीलोड करा.",
+    },
+    "ta": {
+        "app.name": "சமர்த் AI சுயவிவர தளம்",
+        "nav.home": "முகப்பு",
+        "nav.dashboard": "டாஷ்போர்டு",
+        "nav.resumes": "சுயவிவரங்கள்",
+        "nav.jobs": "வேலைகள்",
+        "nav.applications": "விண்ணப்பங்கள்",
+        "nav.analysis": "சந்தை பகுப்பாய்வு",
+        "nav.login": "உள்நுழை",
+        "nav.register": "பதிவு",
+        "nav.logout": "வெளியேறு",
+        "common.submit": "சமர்ப்பி",
+        "common.cancel": "ரத்து",
+        "common.language": "மொழி",
+        "common.yes": "ஆம்",
+        "common.no": "இல்லை",
+        "home.hero.title": "AI-இயக்கப்படும் சுயவிவரம் மற்றும் வேலை பொருத்தம்",
+        "auth.login.title": "உள்நுழை",
+        "auth.register.title": "கணக்கை உருவாக்கு",
+        "jobs.title": "வேலைகள்",
+        "resumes.title": "சுயவிவரங்கள்",
+        "resumes.skills": "திறன்கள்",
+        "resumes.experience": "அனுபவம்",
+        "resumes.education": "கல்வி",
+        "applications.title": "விண்ணப்பங்கள்",
+        "status.new": "புதிய",
+        "status.reviewed": "மதிப்பாய்வு",
+        "status.shortlisted": "குறுகிய பட்டியல்",
+        "status.rejected": "நிராகரிக்கப்பட்டது",
+        "analysis.title": "வேலை சந்தை பகுப்பாய்வு",
+        "footer.copy": "AI-இயக்கப்படும் சுயவிவர தளம்",
+        "nav.skills_gap": "திறன் இடைவெளி",
+        "skills_gap.title": "திறன் இடைவெளி பகுப்பாய்வு",
+        "skills_gap.select_resume": "சுயவிவரம் தேர்ந்தெடு",
+        "skills_gap.select_job": "வேலை தேர்ந்தெடு",
+        "skills_gap.analyze": "திறன் இடைவெளி பகுப்பாய்வு செய்",
+        "jobs.edit": "வேலை திருத்து",
+        "jobs.delete": "வேலை நீக்கு",
+        "jobs.delete_confirm": "இந்த வேலையை நீக்க விரும்புகிறீர்களா?",
+        "jobs.location": "இடம்",
+        "jobs.salary_range": "சம்பள வரம்பு",
+        "jobs.salary_min": "குறைந்தபட்ச சம்பளம்",
+        "jobs.salary_max": "அதிகபட்ச சம்பளம்",
+        "jobs.job_type": "வேலை வகை",
+        "jobs.is_remote": "தொலைதூர வேலை",
+        "jobs.experience_level": "அனுபவ நிலை",
+        "jobs.type.full_time": "முழு நேரம்",
+        "jobs.type.part_time": "பகுதி நேரம்",
+        "jobs.type.contract": "ஒப்பந்தம்",
+        "jobs.type.internship": "இன்டர்ன்ஷிப்",
+        "jobs.level.entry": "தொடக்க நிலை",
+        "jobs.level.mid": "நடுத்தர நிலை",
+        "jobs.level.senior": "மூத்த நிலை",
+        "jobs.level.lead": "லீட் / முதன்மை",
+        "user.phone": "தொலைபேசி எண்",
+        "user.bio": "என்னைப் பற்றி",
+        "user.location": "இடம்",
+        "user.profile_picture": "சுயவிவர படம்",
+        "applications.cover_letter": "கவர் லெட்டர்",
+        "applications.cover_letter_placeholder": "இந்த பதவிக்கு நீங்கள் ஏன் சரியான நபர் என்பதை சுருக்கமாக விளக்குங்கள்...",
+        "applications.scoring_pending": "தற்காலிக மதிப்பெண், இறுதி மதிப்பீடு நடைபெறுகிறது",
+        "applications.scoring_failed": "இறுதி மதிப்பீடு தோல்வியடைந்தது, தற்காலிக மதிப்பெண் காட்டப்படுகிறது",
+        "common.load_more": "மேலும் ஏற்று",
+        "common.loading": "ஏற்றுகிறது…",
+        "resumes.panel_unavailable": "இந்தப் பகுதி இப்போது கிடைக்கவில்லை. மீண்டும் முயல பக்கத்தை மீண்டும் ஏற்றவும்.",
+    },
+    "ur": {
+        "app.name": "سمرتھ AI ریزومے پلیٹ فارم",
+        "nav.home": "ہوم",
+        "nav.dashboard": "ڈیش بورڈ",
+        "nav.resumes": "ریزومے",
+        "nav.jobs": "نوکریاں",
+        "nav.applications": "درخواستیں",
+        "nav.analysis": "مارکیٹ تجزیہ",
+        "nav.login": "لاگ ان",
+        "nav.register": "رجسٹر",
+        "nav.logout": "لاگ آؤٹ",
+        "common.submit": "جمع کریں",
+        "common.cancel": "منسوخ",
+        "common.language": "زبان",
+        "common.yes": "ہاں",
+        "common.no": "نہیں",
+        "home.hero.title": "AI سے چلنے والا ریزومے اور نوکری میچنگ",
+        "auth.login.title": "لاگ ان",
+        "auth.register.title": "اکاؤنٹ بنائیں",
+        "jobs.title": "نوکریاں",
+        "resumes.title": "ریزومے",
+        "applications.title": "درخواستیں",
+        "status.new": "نیا",
+        "status.reviewed": "جائزہ لیا",
+        "status.shortlisted": "شارٹ لسٹ",
+        "status.rejected": "مسترد",
+        "analysis.title": "نوکری مارکیٹ تجزیہ",
+        "footer.copy": "AI سے چلنے والا ریزومے پلیٹ فارم",
+        "nav.skills_gap": "اسکل گیپ",
+        "skills_gap.title": "اسکل گیپ تجزیہ",
+        "skills_gap.select_resume": "ریزومے منتخب کریں",
+        "skills_gap.select_job": "نوکری منتخب کریں",
+        "skills_gap.analyze": "اسکل گیپ تجزیہ کریں",
+        "jobs.edit": "نوکری ترمیم کریں",
+        "jobs.delete": "نوکری حذف کریں",
+        "jobs.delete_confirm": "کیا آپ واقعی اس نوکری کو حذف کرنا چاہتے ہیں؟",
+        "jobs.location": "مقام",
+        "jobs.salary_range": "تنخواہ کی حد",
+        "jobs.salary_min": "کم از کم تنخواہ",
+        "jobs.salary_max": "زیادہ سے زیادہ تنخواہ",
+        "jobs.job_type": "ملازمت کی قسم",
+        "jobs.is_remote": "دور دراز کام",
+        "jobs.experience_level": "تجربے کی سطح",
+        "jobs.type.full_time": "کل وقتی",
+        "jobs.type.part_time": "جز وقتی",
+        "jobs.type.contract": "معاہدہ",
+        "jobs.type.internship": "انٹرن شپ",
+        "jobs.level.entry": "ابتدائی سطح",
+        "jobs.level.mid": "درمیانی سطح",
+        "jobs.level.senior": "سینئر سطح",
+        "jobs.level.lead": "لیڈ / پرنسپل",
+        "user.phone": "فون نمبر",
+        "user.bio": "میرے بارے میں",
+        "user.location": "مقام",
+        "user.profile_picture": "پروفائل تصویر",
+        "applications.cover_letter": "کور لیٹر",
+        "applications.cover_letter_placeholder": "مختصراً بتائیں کہ آپ اس کردار کے لیے کیوں موزوں ہیں...",
+        "applications.scoring_pending": "عارضی اسکور، حتمی اسکورنگ جاری ہے",
+        "applications.scoring_failed": "حتمی اسکورنگ ناکام، عارضی اسکور دکھایا جا رہا ہے",
+        "common.load_more": "مزید لوڈ کریں",
+        "common.loading": "لوڈ ہو رہا ہے…",
+        "resumes.panel_unavailable": "یہ حصہ ابھی دستیاب نہیں ہے۔ دوبارہ کوشش کرنے کے لیے صفحہ ری لوڈ کریں۔",
+    },
+    "gu": {
+        "app.name": "સમર્થ AI રિઝ્યૂમે પ્લેટફોર્મ",
+        "nav.home": "હોમ",
+        "nav.dashboard": "ડૅશબોર્ડ",
+        "nav.resumes": "રિઝ્યૂમે",
+        "nav.jobs": "નોકરીઓ",
+        "nav.applications": "અરજીઓ",
+        "nav.analysis": "માર્કેટ વિશ્લેષણ",
+        "nav.login": "લૉગિન",
+        "nav.register": "નોંધણી",
+        "nav.logout": "લૉગઆઉટ",
+        "common.submit": "સબમિટ કરો",
+        "common.cancel": "રદ કરો",
+        "common.language": "ભાષા",
+        "common.yes": "હા",
+        "common.no": "ના",
+        "home.hero.title": "AI-સંચાલિત રિઝ્યૂમે અને જોબ મેચિંગ",
+        "auth.login.title": "લૉગિન",
+        "auth.register.title": "ખાતું બનાવો",
+        "jobs.title": "નોકરીઓ",
+        "resumes.title": "રિઝ્યૂમે",
+        "applications.title": "અરજીઓ",
+        "status.new": "નવું",
+        "status.reviewed": "સમીક્ષિત",
+        "status.shortlisted": "શોર્ટલિસ્ટ",
+        "status.rejected": "નકાર્યું",
+        "analysis.title": "નોકરી બજાર વિશ્લેષણ",
+        "footer.copy": "AI-સંચાલિત રિઝ્યૂમે પ્લેટફોર્મ",
+        "nav.skills_gap": "સ્કિલ ગૅપ",
+        "skills_gap.title": "સ્કિલ ગૅપ વિશ્લેષણ",
+        "skills_gap.select_resume": "રિઝ્યૂમે પસંદ કરો",
+        "skills_gap.select_job": "નોકરી પસંદ કરો",
+        "skills_gap.analyze": "સ્કિલ ગૅપ વિશ્લેષણ કરો",
+        "jobs.edit": "નોકરી સંપાદિત કરો",
+        "jobs.delete": "નોકરી કાઢો",
+        "jobs.delete_confirm": "શું તમે ખરેખર આ નોકરી કાઢવા ઇચ્છો છો?",
+        "jobs.location": "સ્થળ",
+        "jobs.salary_range": "પગારની શ્રેણી",
+        "jobs.salary_min": "ઓછામાં ઓછો પગાર",
+        "jobs.salary_max": "વધુમાં વધુ પગાર",
+        "jobs.job_type": "રોજગારનો પ્રકાર",
+        "jobs.is_remote": "દૂરસ્થ કાર્ય",
+        "jobs.experience_level": "અનુભવ સ્તર",
+        "jobs.type.full_time": "પૂર્ણ સમય",
+        "jobs.type.part_time": "આંશિક સમય",
+        "jobs.type.contract": "કરાર",
+        "jobs.type.internship": "ઇન્ટર્નશિપ",
+        "jobs.level.entry": "પ્રવેશ સ્તર",
+        "jobs.level.mid": "મધ્ય સ્તર",
+        "jobs.level.senior": "વરિષ્ઠ સ્તર",
+        "jobs.level.lead": "લીડ / મુખ્ય",
+        "user.phone": "ફોન નંબર",
+        "user.bio": "મારા વિષે",
+        "user.location": "સ્થળ",
+        "user.profile_picture": "પ્રોફાઇલ ચિત્ર",
+        "applications.cover_letter": "કવર લેટર",
+        "applications.cover_letter_placeholder": "સંક્ષિપ્તમાં જણાવો કે આ ભૂમિકા માટે આપ કેમ શ્રેષ્ઠ ઉમેદવાર છો...",
+        "applications.scoring_pending": "કામચલાઉ સ્કોર, અંતિમ સ્કોરિંગ ચાલુ છે",
+        "applications.scoring_failed": "અંતિમ સ્કોરિંગ નિષ્ફળ, કામચલાઉ સ્કોર બતાવવામાં આવે છે",
+        "common.load_more": "વધુ લોડ કરો",
+        "common.loading": "લોડ થઈ રહ્યું છે…",
+        "resumes.panel_unavailable": "આ વિભાગ હાલમાં ઉપલબ્ધ નથી. ફરી પ્રયાસ કરવા માટે પેજ રીલોડ કરો.",
+    },
+    "kn": {
+        "app.name": "ಸಮರ್ಥ AI ರೆಸ್ಯೂಮ್ ಪ್ಲಾಟ್‌ಫಾರ್ಮ್",
+        "nav.home": "ಮುಖಪುಟ",
+        "nav.dashboard": "ಡ್ಯಾಶ್‌ಬೋರ್ಡ್",
+        "nav.resumes": "ರೆಸ್ಯೂಮ್‌ಗಳು",
+        "nav.jobs": "ಉದ್ಯೋಗಗಳು",
+        "nav.applications": "ಅರ್ಜಿಗಳು",
+        "nav.analysis": "ಮಾರುಕಟ್ಟೆ ವಿಶ್ಲೇಷಣೆ",
+        "nav.login": "ಲಾಗಿನ್",
+        "nav.register": "ನೋಂದಣಿ",
+        "nav.logout": "ಲಾಗ್‌ಔಟ್",
+        "common.submit": "ಸಲ್ಲಿಸಿ",
+        "common.cancel": "ರದ್ದುಮಾಡಿ",
+        "common.language": "ಭಾಷೆ",
+        "common.yes": "ಹೌದು",
+        "common.no": "ಇಲ್ಲ",
+        "home.hero.title": "AI-ಚಾಲಿತ ರೆಸ್ಯೂಮ್ ಮತ್ತು ಉದ್ಯೋಗ ಹೊಂದಾಣಿಕೆ",
+        "auth.login.title": "ಲಾಗಿನ್",
+        "auth.register.title": "ಖಾತೆ ರಚಿಸಿ",
+        "jobs.title": "ಉದ್ಯೋಗಗಳು",
+        "resumes.title": "ರೆಸ್ಯೂಮ್‌ಗಳು",
+        "applications.title": "ಅರ್ಜಿಗಳು",
+        "status.new": "ಹೊಸ",
+        "status.reviewed": "ಪರಿಶೀಲಿಸಲಾಗಿದೆ",
+        "status.shortlisted": "ಆಯ್ಕೆ ಪಟ್ಟಿ",
+        "status.rejected": "ನಿರಾಕರಿಸಲಾಗಿದೆ",
+        "analysis.title": "ಉದ್ಯೋಗ ಮಾರುಕಟ್ಟೆ ವಿಶ್ಲೇಷಣೆ",
+        "footer.copy": "AI-ಚಾಲಿತ ರೆಸ್ಯೂಮ್ ಪ್ಲಾಟ್‌ಫಾರ್ಮ್",
+        "nav.skills_gap": "ಕೌಶಲ್ಯ ಅಂತರ",
+        "skills_gap.title": "ಕೌಶಲ್ಯ ಅಂತರ ವಿಶ್ಲೇಷಣೆ",
+        "skills_gap.select_resume": "ರೆಸ್ಯೂಮ್ ಆಯ್ಕೆಮಾಡಿ",
+        "skills_gap.select_job": "ಉದ್ಯೋಗ ಆಯ್ಕೆಮಾಡಿ",
+        "skills_gap.analyze": "ಕೌಶಲ್ಯ ಅಂತರ ವಿಶ್ಲೇಷಿಸಿ",
+        "jobs.edit": "ಉದ್ಯೋಗ ಸಂಪಾದಿಸಿ",
+        "jobs.delete": "ಉದ್ಯೋಗ ಅಳಿಸಿ",
+        "jobs.delete_confirm": "ನೀವು ಈ ಉದ್ಯೋಗವನ್ನು ಅಳಿಸಲು ಬಯಸುತ್ತೀರಾ?",
+        "jobs.location": "ಸ್ಥಳ",
+        "jobs.salary_range": "ವೇತನ ಶ್ರೇಣಿ",
+        "jobs.salary_min": "ಕನಿಷ್ಠ ವೇತನ",
+        "jobs.salary_max": "ಗರಿಷ್ಠ ವೇತನ",
+        "jobs.job_type": "ಉದ್ಯೋಗ ಪ್ರಕಾರ",
+        "jobs.is_remote": "ರಿಮೋಟ್ ಕೆಲಸ",
+        "jobs.experience_level": "ಅನುಭವ ಮಟ್ಟ",
+        "jobs.type.full_time": "ಪೂರ್ಣ ಸಮಯ",
+        "jobs.type.part_time": "ಅಂಶಕಾಲ",
+        "jobs.type.contract": "ಒಪ್ಪಂದ",
+        "jobs.type.internship": "ಇಂಟರ್ನ್‌ಶಿಪ್",
+        "jobs.level.entry": "ಪ್ರವೇಶ ಮಟ್ಟ",
+        "jobs.level.mid": "ಮಧ್ಯಮ ಮಟ್ಟ",
+        "jobs.level.senior": "ಹಿರಿಯ ಮಟ್ಟ",
+        "jobs.level.lead": "ಲೀಡ್ / ಪ್ರಿನ್ಸಿಪಲ್",
+        "user.phone": "ಫೋನ್ ಸಂಖ್ಯೆ",
+        "user.bio": "ನನ್ನ ಬಗ್ಗೆ",
+        "user.location": "ಸ್ಥಳ",
+        "user.profile_picture": "ಪ್ರೊಫೈಲ್ ಫೋಟೋ",
+        "applications.cover_letter": "ಕವರ್ ಲೆಟರ್",
+        "applications.cover_letter_placeholder": "ಈ ಹುದ್ದೆಗೆ ನೀವು ಏಕೆ ಸೂಕ್ತ ಅಭ್ಯರ್ಥಿ ಎಂಬುದನ್ನು ಸಂಕ್ಷಿಪ್ತವಾಗಿ ವಿವರಿಸಿ...",
+        "applications.scoring_pending": "ತಾತ್ಕಾಲಿಕ ಅಂಕ, ಅಂತಿಮ ಮೌಲ್ಯಮಾಪನ ನಡೆಯುತ್ತಿದೆ",
+        "applications.scoring_failed": "ಅಂತಿಮ ಮೌಲ್ಯಮಾಪನ ವಿಫಲವಾಗಿದೆ, ತಾತ್ಕಾಲಿಕ ಅಂಕ ತೋರಿಸಲಾಗುತ್ತಿದೆ",
+        "common.load_more": "ಇನ್ನಷ್ಟು ಲೋಡ್ ಮಾಡಿ",
+        "common.loading": "ಲೋಡ್ ಆಗುತ್ತಿದೆ…",
+        "resumes.panel_unavailable": "ಈ ವಿಭಾಗ ಈಗ ಲಭ್ಯವಿಲ್ಲ. ಮತ್ತೆ ಪ್ರಯತ್ನಿಸಲು ಪುಟವನ್ನು ರೀಲೋಡ್ ಮಾಡಿ.",
+    },
+    "ml": {
+        "app.name": "സമർത്ഥ AI റെസ്യൂമ പ്ലാറ്റ്‌ഫോം",
+        "nav.home": "ഹോം",
+        "nav.dashboard": "ഡാഷ്ബോർഡ്",
+        "nav.resumes": "റെസ്യൂമുകൾ",
+        "nav.jobs": "ജോലികൾ",
+        "nav.applications": "അപേക്ഷകൾ",
+        "nav.analysis": "മാർക്കറ്റ് വിശകലനം",
+        "nav.login": "ലോഗിൻ",
+        "nav.register": "രജിസ്റ്റർ",
+        "nav.logout": "ലോഗൗട്ട്",
+        "common.submit": "സമർപ്പിക്കുക",
+        "common.cancel": "റദ്ദാക്കുക",
+        "common.language": "ഭാഷ",
+        "common.yes": "അതെ",
+        "common.no": "ഇല്ല",
+        "home.hero.title": "AI-ചാലിത റെസ്യൂമ, ജോലി പൊരുത്തപ്പെടുത്തൽ",
+        "auth.login.title": "ലോഗിൻ",
+        "auth.register.title": "അക്കൗണ്ട് സൃഷ്ടിക്കുക",
+        "jobs.title": "ജോലികൾ",
+        "resumes.title": "റെസ്യൂമുകൾ",
+        "applications.title": "അപേക്ഷകൾ",
+        "status.new": "പുതിയ",
+        "status.reviewed": "അവലോകനം ചെയ്തു",
+        "status.shortlisted": "ഷോർട്ട്‌ലിസ്റ്റ്",
+        "status.rejected": "നിരസിച്ചു",
+        "analysis.title": "ജോലി വിപണി വിശകലനം",
+        "footer.copy": "AI-ചാലിത റെസ്യൂമ പ്ലാറ്റ്‌ഫോം",
+        "nav.skills_gap": "സ്കിൽ ഗ്യാപ്",
+        "skills_gap.title": "സ്കിൽ ഗ്യാപ് വിശകലനം",
+        "skills_gap.select_resume": "റെസ്യൂമ തിരഞ്ഞെടുക്കുക",
+        "skills_gap.select_job": "ജോലി തിരഞ്ഞെടുക്കുക",
+        "skills_gap.analyze": "സ്കിൽ ഗ്യാപ് വിശകലനം ചെയ്യുക",
+        "jobs.edit": "ജോലി എഡിറ്റ് ചെയ്യുക",
+        "jobs.delete": "ജോലി ഇല്ലാതാക്കുക",
+        "jobs.delete_confirm": "ഈ ജോലി ഇല്ലാതാക്കണോ?",
+        "jobs.location": "സ്ഥലം",
+        "jobs.salary_range": "ശമ്പള പരിധി",
+        "jobs.salary_min": "ഏറ്റവും കുറഞ്ഞ ശമ്പളം",
+        "jobs.salary_max": "പരമാവധി ശമ്പളം",
+        "jobs.job_type": "ജോലിയുടെ തരം",
+        "jobs.is_remote": "റിമോട്ട് ജോലി",
+        "jobs.experience_level": "അനുഭവ നില",
+        "jobs.type.full_time": "പൂർണ്ണ സമയം",
+        "jobs.type.part_time": "ഭാഗ്യ സമയം",
+        "jobs.type.contract": "കരാർ",
+        "jobs.type.internship": "ഇന്റേൺഷിപ്പ്",
+        "jobs.level.entry": "പ്രവേശന തലം",
+        "jobs.level.mid": "മധ്യ തലം",
+        "jobs.level.senior": "സീനിയർ തലം",
+        "jobs.level.lead": "ലീഡ് / പ്രിൻസിപ്പൽ",
+        "user.phone": "ഫോൺ നമ്പർ",
+        "user.bio": "എന്നെ കുറിച്ച്",
+        "user.location": "സ്ഥലം",
+        "user.profile_picture": "പ്രൊഫൈൽ ചിത്രം",
+        "applications.cover_letter": "കവർ ലെറ്റർ",
+        "applications.cover_letter_placeholder": "ഈ തസ്തികയ്ക്ക് അനുയോജ്യനായ ഉദ്യോഗാർഥി ആകുന്നത് എന്തുകൊണ്ടെന്ന് ചുരുക്കി എഴുതുക...",
+        "applications.scoring_pending": "താൽക്കാലിക സ്കോർ, അന്തിമ സ്കോറിംഗ് പുരോഗമിക്കുന്നു",
+        "applications.scoring_failed": "അന്തിമ സ്കോറിംഗ് പരാജയപ്പെട്ടു, താൽക്കാലിക സ്കോർ കാണിക്കുന്നു",
+        "common.load_more": "കൂടുതൽ ലോഡ് ചെയ്യുക",
+        "common.loading": "ലോഡ് ചെയ്യുന്നു…",
+        "resumes.panel_unavailable": "ഈ ഭാഗം ഇപ്പോൾ ലഭ്യമല്ല. വീണ്ടും ശ്രമിക്കാൻ പേജ് റീലോഡ് ചെയ്യുക.",
+    },
+    "ar": {
+        "app.name": "منصة سمارث AI للسير الذاتية",
+        "nav.home": "الرئيسية",
+        "nav.dashboard": "لوحة التحكم",
+        "nav.resumes": "السير الذاتية",
+        "nav.jobs": "الوظائف",
+        "nav.applications": "الطلبات",
+        "nav.analysis": "تحليل السوق",
+        "nav.login": "تسجيل الدخول",
+        "nav.register": "إنشاء حساب",
+        "nav.logout": "تسجيل الخروج",
+        "common.submit": "إرسال",
+        "common.cancel": "إلغاء",
+        "common.language": "اللغة",
+        "common.yes": "نعم",
+        "common.no": "لا",
+        "home.hero.title": "مطابقة السيرة الذاتية والوظائف بالذكاء الاصطناعي",
+        "auth.login.title": "تسجيل الدخول",
+        "auth.register.title": "إنشاء حساب",
+        "auth.email": "البريد الإلكتروني",
+        "auth.password": "كلمة المرور",
+        "auth.full_name": "الاسم الكامل",
+        "auth.recruiter": "أنا مسؤول توظيف",
+        "jobs.title": "الوظائف",
+        "resumes.title": "السير الذاتية",
+        "resumes.skills": "المهارات",
+        "resumes.experience": "الخبرة",
+        "resumes.education": "التعليم",
+        "applications.title": "الطلبات",
+        "status.new": "جديد",
+        "status.reviewed": "تمت المراجعة",
+        "status.shortlisted": "القائمة المختصرة",
+        "status.rejected": "مرفوض",
+        "analysis.title": "تحليل سوق العمل",
+        "footer.copy": "منصة السيرة الذاتية بالذكاء الاصطناعي",
+        "nav.skills_gap": "فجوة المهارات",
+        "skills_gap.title": "تحليل فجوة المهارات",
+        "skills_gap.description": "قارن مهاراتك بمتطلبات الوظيفة لتحديد الثغرات والحصول على توصيات تعليمية.",
+        "skills_gap.select_resume": "اختر السيرة الذاتية",
+        "skills_gap.select_job": "اختر الوظيفة",
+        "skills_gap.analyze": "تحليل فجوة المهارات",
+        "skills_gap.score": "نقاط الفجوة",
+        "skills_gap.matched": "المهارات المتطابقة",
+        "skills_gap.missing": "المهارات المفقودة",
+        "skills_gap.recommendations": "توصيات التعلم",
+        "skills_gap.proficiency": "الكفاءة",
+        "skills_gap.importance": "الأهمية",
+        "skills_gap.no_resumes": "ليس لديك سيرة ذاتية. قم بتحميلها أولاً.",
+        "skills_gap.no_jobs": "لا توجد وظائف متاحة للمقارنة.",
+        "skills_gap.high": "عال",
+        "skills_gap.medium": "متوسط",
+        "skills_gap.low": "منخفض",
+        "jobs.edit": "تعديل الوظيفة",
+        "jobs.edit_submit": "تحديث الوظيفة",
+        "jobs.delete": "حذف الوظيفة",
+        "jobs.delete_confirm": "هل أنت متأكد أنك تريد حذف هذه الوظيفة؟",
+        "jobs.location": "الموقع",
+        "jobs.salary_range": "نطاق الراتب",
+        "jobs.salary_min": "الحد الأدنى للراتب",
+        "jobs.salary_max": "الحد الأقصى للراتب",
+        "jobs.job_type": "نوع الوظيفة",
+        "jobs.is_remote": "العمل عن بُعد",
+        "jobs.experience_level": "مستوى الخبرة",
+        "jobs.type.full_time": "دوام كامل",
+        "jobs.type.part_time": "دوام جزئي",
+        "jobs.type.contract": "عقد",
+        "jobs.type.internship": "تدريب",
+        "jobs.level.entry": "مستوى مبتدئ",
+        "jobs.level.mid": "مستوى متوسط",
+        "jobs.level.senior": "مستوى متقدم",
+        "jobs.level.lead": "قيادي / رئيسي",
+        "user.phone": "رقم الهاتف",
+        "user.bio": "نبذة عني",
+        "user.location": "الموقع",
+        "user.profile_picture": "صورة الملف الشخصي",
+        "applications.cover_letter": "خطاب التقديم",
+        "applications.cover_letter_placeholder": "اكتب باختصار لماذا تعتقد أنك مناسب لهذا المنصب...",
+        "applications.scoring_pending": "درجة مؤقتة، التقييم النهائي قيد التنفيذ",
+        "applications.scoring_failed": "فشل التقييم النهائي، يتم عرض الدرجة المؤقتة",
+        "common.load_more": "تحميل المزيد",
+        "common.loading": "جارٍ التحميل…",
+        "resumes.panel_unavailable": "هذا القسم غير متاح الآن. أعد تحميل الصفحة للمحاولة مرة أخرى.",
+    },
+    "pt": {
+        "app.name": "Samarth AI Plataforma de Currículo",
+        "nav.home": "Início",
+        "nav.dashboard": "Painel",
+        "nav.resumes": "Currículos",
+        "nav.jobs": "Vagas",
+        "nav.applications": "Candidaturas",
+        "nav.analysis": "Análise de mercado",
+        "nav.login": "Entrar",
+        "nav.register": "Registrar",
+        "nav.logout": "Sair",
+        "common.submit": "Enviar",
+        "common.cancel": "Cancelar",
+        "common.language": "Idioma",
+        "common.yes": "Sim",
+        "common.no": "Não",
+        "home.hero.title": "Correspondência de Currículo e Vaga com IA",
+        "auth.login.title": "Entrar",
+        "auth.register.title": "Criar conta",
+        "auth.email": "E-mail",
+        "auth.password": "Senha",
+        "auth.full_name": "Nome completo",
+        "auth.recruiter": "Sou recrutador",
+        "jobs.title": "Vagas",
+        "resumes.title": "Currículos",
+        "resumes.skills": "Competências",
+        "resumes.experience": "Experiência",
+        "resumes.education": "Educação",
+        "applications.title": "Candidaturas",
+        "status.new": "Novo",
+        "status.reviewed": "Revisado",
+        "status.shortlisted": "Pré-selecionado",
+        "status.rejected": "Rejeitado",
+        "analysis.title": "Análise do mercado de trabalho",
+        "footer.copy": "Plataforma de currículo com IA",
+        "nav.skills_gap": "Lacuna de habilidades",
+        "skills_gap.title": "Análise de lacuna de habilidades",
+        "skills_gap.description": "Compare suas habilidades com os requisitos da vaga para identificar lacunas.",
+        "skills_gap.select_resume": "Selecionar currículo",
+        "skills_gap.select_job": "Selecionar vaga",
+        "skills_gap.analyze": "Analisar lacuna de habilidades",
+        "skills_gap.score": "Pontuação de lacuna",
+        "skills_gap.matched": "Habilidades correspondentes",
+        "skills_gap.missing": "Habilidades ausentes",
+        "skills_gap.recommendations": "Recomendações de aprendizagem",
+        "skills_gap.proficiency": "Proficiência",
+        "skills_gap.importance": "Importância",
+        "skills_gap.no_resumes": "Você não tem currículos. Envie um primeiro.",
+        "skills_gap.no_jobs": "Nenhuma vaga disponível para comparação.",
+        "skills_gap.high": "Alto",
+        "skills_gap.medium": "Médio",
+        "skills_gap.low": "Baixo",
+        "jobs.edit": "Editar vaga",
+        "jobs.edit_submit": "Atualizar vaga",
+        "jobs.delete": "Excluir vaga",
+        "jobs.delete_confirm": "Tem certeza de que deseja excluir esta vaga?",
+        "jobs.location": "Localização",
+        "jobs.salary_range": "Faixa salarial",
+        "jobs.salary_min": "Salário mínimo",
+        "jobs.salary_max": "Salário máximo",
+        "jobs.job_type": "Tipo de emprego",
+        "jobs.is_remote": "Trabalho remoto",
+        "jobs.experience_level": "Nível de experiência",
+        "jobs.type.full_time": "Tempo integral",
+        "jobs.type.part_time": "Meio período",
+        "jobs.type.contract": "Contrato",
+        "jobs.type.internship": "Estágio",
+        "jobs.level.entry": "Nível inicial",
+        "jobs.level.mid": "Nível intermediário",
+        "jobs.level.senior": "Nível sênior",
+        "jobs.level.lead": "Líder / Principal",
+        "user.phone": "Número de telefone",
+        "user.bio": "Sobre mim",
+        "user.location": "Localização",
+        "user.profile_picture": "Foto de perfil",
+        "applications.cover_letter": "Carta de apresentação",
+        "applications.cover_letter_placeholder": "Escreva brevemente por que você é o candidato ideal para esta vaga...",
+        "applications.scoring_pending": "Pontuação provisória, cálculo final em andamento",
+        "applications.scoring_failed": "O cálculo final falhou, exibindo a pontuação provisória",
+        "common.load_more": "Carregar mais",
+        "common.loading": "Carregando…",
+        "resumes.panel_unavailable": "Esta seção não está disponível no momento. Recarregue a página para tentar novamente.",
+    },
+    "ru": {
+        "app.name": "Samarth AI Платформа резюме",
+        "nav.home": "Главная",
+        "nav.dashboard": "Панель",
+        "nav.resumes": "Резюме",
+        "nav.jobs": "Вакансии",
+        "nav.applications": "Заявки",
+        "nav.analysis": "Анализ рынка",
+        "nav.login": "Войти",
+        "nav.register": "Регистрация",
+        "nav.logout": "Выйти",
+        "common.submit": "Отправить",
+        "common.cancel": "Отмена",
+        "common.language": "Язык",
+        "common.yes": "Да",
+        "common.no": "Нет",
+        "home.hero.title": "Сопоставление резюме и вакансий с ИИ",
+        "auth.login.title": "Войти",
+        "auth.register.title": "Создать аккаунт",
+        "auth.email": "Электронная почта",
+        "auth.password": "Пароль",
+        "auth.full_name": "Полное имя",
+        "auth.recruiter": "Я рекрутер",
+        "jobs.title": "Вакансии",
+        "resumes.title": "Резюме",
+        "resumes.skills": "Навыки",
+        "resumes.experience": "Опыт",
+        "resumes.education": "Образование",
+        "applications.title": "Заявки",
+        "status.new": "Новая",
+        "status.reviewed": "Рассмотрена",
+        "status.shortlisted": "В списке",
+        "status.rejected": "Отклонена",
+        "analysis.title": "Анализ рынка труда",
+        "footer.copy": "Платформа резюме на основе ИИ",
+        "nav.skills_gap": "Пробел в навыках",
+        "skills_gap.title": "Анализ пробела в навыках",
+        "skills_gap.description": "Сравните свои навыки с требованиями вакансии, чтобы выявить пробелы.",
+        "skills_gap.select_resume": "Выбрать резюме",
+        "skills_gap.select_job": "Выбрать вакансию",
+        "skills_gap.analyze": "Анализировать пробел в навыках",
+        "skills_gap.score": "Оценка пробела",
+        "skills_gap.matched": "Совпадающие навыки",
+        "skills_gap.missing": "Недостающие навыки",
+        "skills_gap.recommendations": "Рекомендации по обучению",
+        "skills_gap.proficiency": "Уровень владения",
+        "skills_gap.importance": "Важность",
+        "skills_gap.no_resumes": "У вас нет резюме. Сначала загрузите его.",
+        "skills_gap.no_jobs": "Нет вакансий для сравнения.",
+        "skills_gap.high": "Высокий",
+        "skills_gap.medium": "Средний",
+        "skills_gap.low": "Низкий",
+        "jobs.edit": "Редактировать вакансию",
+        "jobs.edit_submit": "Обновить вакансию",
+        "jobs.delete": "Удалить вакансию",
+        "jobs.delete_confirm": "Вы уверены, что хотите удалить эту вакансию?",
+        "jobs.location": "Местонахождение",
+        "jobs.salary_range": "Диапазон зарплаты",
+        "jobs.salary_min": "Минимальная зарплата",
+        "jobs.salary_max": "Максимальная зарплата",
+        "jobs.job_type": "Тип занятости",
+        "jobs.is_remote": "Удалённая работа",
+        "jobs.experience_level": "Уровень опыта",
+        "jobs.type.full_time": "Полная занятость",
+        "jobs.type.part_time": "Частичная занятость",
+        "jobs.type.contract": "Контракт",
+        "jobs.type.internship": "Стажировка",
+        "jobs.level.entry": "Начальный уровень",
+        "jobs.level.mid": "Средний уровень",
+        "jobs.level.senior": "Старший уровень",
+        "jobs.level.lead": "Ведущий / Главный",
+        "user.phone": "Номер телефона",
+        "user.bio": "О себе",
+        "user.location": "Местонахождение",
+        "user.profile_picture": "Фото профиля",
+        "applications.cover_letter": "Сопроводительное письмо",
+        "applications.cover_letter_placeholder": "Кратко объясните, почему вы подходите именно на эту должность...",
+        "applications.scoring_pending": "Предварительная оценка, идёт окончательный расчёт",
+        "applications.scoring_failed": "Окончательный расчёт не удался, показана предварительная оценка",
+        "common.load_more": "Загрузить ещё",
+        "common.loading": "Загрузка…",
+        "resumes.panel_unavailable": "Этот раздел сейчас недоступен. Обновите страницу, чтобы попробовать снова.",
+    },
+    "it": {
+        "app.name": "Samarth AI Piattaforma CV",
+        "nav.home": "Home",
+        "nav.dashboard": "Dashboard",
+        "nav.resumes": "Curriculum",
+        "nav.jobs": "Lavori",
+        "nav.applications": "Candidature",
+        "nav.analysis": "Analisi di mercato",
+        "nav.login": "Accedi",
+        "nav.register": "Registrati",
+        "nav.logout": "Esci",
+        "common.submit": "Invia",
+        "common.cancel": "Annulla",
+        "common.language": "Lingua",
+        "common.yes": "Sì",
+        "common.no": "No",
+        "home.hero.title": "Corrispondenza CV e lavoro con IA",
+        "auth.login.title": "Accedi",
+        "auth.register.title": "Crea un account",
+        "auth.email": "E-mail",
+        "auth.password": "Password",
+        "auth.full_name": "Nome completo",
+        "auth.recruiter": "Sono un recruiter",
+        "jobs.title": "Lavori",
+        "resumes.title": "Curriculum",
+        "resumes.skills": "Competenze",
+        "resumes.experience": "Esperienza",
+        "resumes.education": "Istruzione",
+        "applications.title": "Candidature",
+        "status.new": "Nuovo",
+        "status.reviewed": "Esaminato",
+        "status.shortlisted": "Preselezione",
+        "status.rejected": "Rifiutato",
+        "analysis.title": "Analisi del mercato del lavoro",
+        "footer.copy": "Piattaforma CV basata sull'IA",
+        "nav.skills_gap": "Lacuna di competenze",
+        "skills_gap.title": "Analisi della lacuna di competenze",
+        "skills_gap.description": "Confronta le tue competenze con i requisiti della posizione per identificare le lacune.",
+        "skills_gap.select_resume": "Seleziona curriculum",
+        "skills_gap.select_job": "Seleziona lavoro",
+        "skills_gap.analyze": "Analizza lacuna di competenze",
+        "skills_gap.score": "Punteggio lacuna",
+        "skills_gap.matched": "Competenze corrispondenti",
+        "skills_gap.missing": "Competenze mancanti",
+        "skills_gap.recommendations": "Raccomandazioni di apprendimento",
+        "skills_gap.proficiency": "Competenza",
+        "skills_gap.importance": "Importanza",
+        "skills_gap.no_resumes": "Non hai curriculum. Caricane uno prima.",
+        "skills_gap.no_jobs": "Nessun lavoro disponibile per il confronto.",
+        "skills_gap.high": "Alto",
+        "skills_gap.medium": "Medio",
+        "skills_gap.low": "Basso",
+        "jobs.edit": "Modifica lavoro",
+        "jobs.edit_submit": "Aggiorna lavoro",
+        "jobs.delete": "Elimina lavoro",
+        "jobs.delete_confirm": "Sei sicuro di voler eliminare questo lavoro?",
+        "jobs.location": "Sede",
+        "jobs.salary_range": "Fascia salariale",
+        "jobs.salary_min": "Stipendio minimo",
+        "jobs.salary_max": "Stipendio massimo",
+        "jobs.job_type": "Tipo di impiego",
+        "jobs.is_remote": "Lavoro da remoto",
+        "jobs.experience_level": "Livello di esperienza",
+        "jobs.type.full_time": "Tempo pieno",
+        "jobs.type.part_time": "Part-time",
+        "jobs.type.contract": "Contratto a termine",
+        "jobs.type.internship": "Tirocinio",
+        "jobs.level.entry": "Livello base",
+        "jobs.level.mid": "Livello intermedio",
+        "jobs.level.senior": "Livello senior",
+        "jobs.level.lead": "Lead / Senior Principal",
+        "user.phone": "Numero di telefono",
+        "user.bio": "Su di me",
+        "user.location": "Sede",
+        "user.profile_picture": "Foto profilo",
+        "applications.cover_letter": "Lettera di presentazione",
+        "applications.cover_letter_placeholder": "Spiega brevemente perché sei il candidato ideale per questo ruolo...",
+        "applications.scoring_pending": "Punteggio provvisorio, calcolo finale in corso",
+        "applications.scoring_failed": "Calcolo finale non riuscito, viene mostrato il punteggio provvisorio",
+        "common.load_more": "Carica altro",
+        "common.loading": "Caricamento…",
+        "resumes.panel_unavailable": "Questa sezione non è disponibile al momento. Ricarica la pagina per riprovare.",
+    },
+}
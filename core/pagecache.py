@@ -0,0 +1,120 @@
+"""Full-response cache for pages that look the same to every anonymous visitor.
+
+Entries are keyed by URL (without query string) and negotiated locale and hold the
+rendered HTML together with gzip and, when the ``brotli`` package is installed, brotli
+encodings, so a hit is a dictionary lookup plus picking a variant. The cache empties
+itself when ``BUILD_ID`` changes between deploys or any template file changes on disk.
+"""
+
+import gzip
+import hashlib
+import importlib
+import time
+from collections.abc import Hashable
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+
+from fastapi import Request, Response, status
+
+from core.cache import TTLCache
+
+
+def _optional_module(name: str) -> ModuleType | None:
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+# Optional: without it pages are only precompressed with gzip.
+brotli = _optional_module("brotli")
+
+
+@dataclass(slots=True, frozen=True)
+class CachedPage:
+    etag: str
+    # Content-Encoding ("identity", "gzip", "br") -> body.
+    bodies: dict[str, bytes]
+
+
+def _accepted_encodings(request: Request) -> set[str]:
+    accepted = set()
+    for item in request.headers.get("accept-encoding", "").split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = params.strip().removeprefix("q=")
+        if coding and quality not in ("0", "0.0", "0.00", "0.000"):
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+class PageCache:
+    # How often, in seconds, template files are checked for changes.
+    TEMPLATE_CHECK_INTERVAL = 2.0
+
+    def __init__(self, template_dir: str, build_id: str, maxsize: int, ttl: float):
+        self.template_dir = Path(template_dir)
+        self.build_id = build_id
+        self.max_age = int(ttl)
+        self._pages: TTLCache[Hashable, CachedPage] = TTLCache(maxsize, ttl)
+        self._fingerprint = ""
+        self._checked_at = float("-inf")
+
+    def _templates_fingerprint(self) -> str:
+        digest = hashlib.blake2b(self.build_id.encode(), digest_size=8)
+        for path in sorted(self.template_dir.rglob("*.html")):
+            stat = path.stat()
+            digest.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+        return digest.hexdigest()
+
+    def _revalidate(self) -> None:
+        now = time.monotonic()
+        if now - self._checked_at < self.TEMPLATE_CHECK_INTERVAL:
+            return
+        self._checked_at = now
+        fingerprint = self._templates_fingerprint()
+        if fingerprint != self._fingerprint:
+            self._fingerprint = fingerprint
+            self._pages.clear()
+
+    def get(self, key: Hashable) -> CachedPage | None:
+        self._revalidate()
+        return self._pages.get(key)
+
+    def put(self, key: Hashable, html: str) -> CachedPage:
+        body = html.encode("utf-8")
+        bodies = {"identity": body, "gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            bodies["br"] = brotli.compress(body, mode=brotli.MODE_TEXT)
+        etag = hashlib.blake2b(body, digest_size=12).hexdigest()
+        page = CachedPage(etag=etag, bodies=bodies)
+        self._pages.set(key, page)
+        return page
+
+    def clear(self) -> None:
+        self._pages.clear()
+
+    def respond(self, request: Request, page: CachedPage) -> Response:
+        """Serve the best encoding the client accepts, or 304 if its copy is current."""
+        accepted = _accepted_encodings(request)
+        encoding = next((coding for coding in ("br", "gzip") if coding in accepted), "identity")
+        if encoding not in page.bodies:
+            encoding = "gzip" if "gzip" in accepted else "identity"
+        # Each encoding is a different byte sequence, so each gets its own strong ETag.
+        etags = {
+            coding: f'"{page.etag}"' if coding == "identity" else f'"{page.etag}-{coding}"'
+            for coding in page.bodies
+        }
+        headers = {
+            "ETag": etags[encoding],
+            "Cache-Control": f"public, max-age={self.max_age}",
+            "Vary": "Accept-Encoding, Accept-Language, Cookie",
+        }
+        # A client holding any encoding of this page has current content, even if it now
+        # negotiates a different one.
+        if_none_match = request.headers.get("if-none-match", "")
+        if {tag.strip() for tag in if_none_match.split(",")} & set(etags.values()):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        return Response(page.bodies[encoding], media_type="text/html", headers=headers)
@@ -0,0 +1,35 @@
+"""Opaque keyset cursors for list endpoints.
+
+Lists are ordered newest first by ``(created_at, id)``. A cursor carries the sort key
+of the last row on a page, so fetching the next page is an index range scan no matter
+how deep it is, unlike ``OFFSET`` which has to walk every skipped row.
+"""
+
+import base64
+import json
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    payload = json.dumps([created_at.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Return the ``(created_at, id)`` sort key; raise ``ValueError`` if malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def next_cursor(rows: Sequence[Any], limit: int) -> str | None:
+    """Cursor for the page after ``rows``, or ``None`` when this page was not full."""
+    if len(rows) < limit or not rows:
+        return None
+    last = rows[-1]
+    return encode_cursor(last.created_at, last.id)
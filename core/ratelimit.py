@@ -0,0 +1,147 @@
+"""Admission control for endpoints that start AI provider work.
+
+``RateLimiter`` applies token buckets per caller (user id and client IP). Bucket state
+lives in a ``RateLimitStore``; the default keeps it in process memory, so each worker
+enforces its own share. Assign ``rate_limiter.store`` at startup to share buckets between
+workers through an external store.
+
+``LoadShedder`` watches event-loop lag and how long AI calls wait for a provider slot.
+While either is over its threshold, new expensive requests are turned away so cheap reads
+keep their latency.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from typing import Protocol
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitStore(Protocol):
+    async def take(self, buckets: Sequence[tuple[str, float, int]], cost: int = 1) -> float:
+        """Take ``cost`` tokens from each of ``buckets``, or from none of them.
+
+        Each bucket is ``(key, rate, burst)``: its refill rate in tokens per second and its
+        size. Returns 0 when the tokens were taken, otherwise the seconds until all buckets
+        hold enough; ``math.inf`` when ``cost`` exceeds a bucket's size.
+        """
+        ...
+
+    async def reset(self) -> None: ...
+
+
+class MemoryRateLimitStore:
+    """Token buckets in a bounded LRU; idle buckets are the first to go."""
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def take(self, buckets: Sequence[tuple[str, float, int]], cost: int = 1) -> float:
+        now = time.monotonic()
+        levels: list[tuple[str, float, float]] = []
+        wait = 0.0
+        for key, rate, burst in buckets:
+            tokens, updated = self._buckets.get(key, (float(burst), now))
+            tokens = min(float(burst), tokens + (now - updated) * rate)
+            if cost > burst:
+                wait = math.inf
+            elif tokens < cost:
+                wait = max(wait, (cost - tokens) / rate)
+            levels.append((key, tokens, float(cost)))
+        for key, tokens, cost_taken in levels:
+            self._buckets[key] = (tokens if wait else tokens - cost_taken, now)
+            self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return wait
+
+    async def reset(self) -> None:
+        self._buckets.clear()
+
+
+class RateLimiter:
+    def __init__(self, store: RateLimitStore):
+        self.store = store
+
+    @staticmethod
+    def capacity(client_ip: str | None) -> int:
+        """The most tokens one request can cost: the smallest bucket it is charged to."""
+        if client_ip:
+            return min(settings.RATE_LIMIT_USER_BURST, settings.RATE_LIMIT_IP_BURST)
+        return settings.RATE_LIMIT_USER_BURST
+
+    async def retry_after(self, user_id: int, client_ip: str | None, cost: int = 1) -> int:
+        """Charge ``cost`` tokens to the caller's buckets; 0 if admitted, else seconds to wait.
+
+        Nothing is charged unless both the user and the IP bucket admit the request.
+        ``cost`` must not exceed ``capacity(client_ip)``.
+        """
+        if cost > self.capacity(client_ip):
+            raise ValueError(f"A cost of {cost} tokens can never be admitted")
+        buckets = [
+            (
+                f"user:{user_id}",
+                settings.RATE_LIMIT_USER_PER_MINUTE / 60,
+                settings.RATE_LIMIT_USER_BURST,
+            )
+        ]
+        if client_ip:
+            buckets.append(
+                (
+                    f"ip:{client_ip}",
+                    settings.RATE_LIMIT_IP_PER_MINUTE / 60,
+                    settings.RATE_LIMIT_IP_BURST,
+                )
+            )
+        return math.ceil(await self.store.take(buckets, cost))
+
+
+class LoadShedder:
+    # Provider waits are only observed when calls happen. Once shedding stops the calls, the
+    # recorded peak has to fade on its own or the shedder would never reopen.
+    PROVIDER_WAIT_HALF_LIFE = 5.0
+
+    def __init__(self) -> None:
+        self.loop_lag = 0.0
+        self._provider_wait = 0.0
+        self._provider_wait_at = 0.0
+
+    def record_provider_wait(self, seconds: float) -> None:
+        self._provider_wait = max(seconds, self.provider_wait())
+        self._provider_wait_at = time.monotonic()
+
+    def provider_wait(self) -> float:
+        age = time.monotonic() - self._provider_wait_at
+        return self._provider_wait * 0.5 ** (age / self.PROVIDER_WAIT_HALF_LIFE)
+
+    def retry_after(self) -> int:
+        """0 while healthy, else the seconds callers should back off for."""
+        if (
+            self.loop_lag * 1000 > settings.LOAD_SHED_LOOP_LAG_MS
+            or self.provider_wait() * 1000 > settings.LOAD_SHED_PROVIDER_WAIT_MS
+        ):
+            return settings.LOAD_SHED_RETRY_AFTER_SECONDS
+        return 0
+
+    async def monitor_loop_lag(self, interval: float = 0.5) -> None:
+        """Sample how late the event loop wakes a sleeping task; runs until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(interval)
+            lag = max(0.0, loop.time() - started - interval)
+            # Hold a spike for a few samples so shedding lasts until the loop has recovered.
+            self.loop_lag = max(lag, self.loop_lag * 0.5)
+            if lag * 1000 > settings.LOAD_SHED_LOOP_LAG_MS:
+                logger.warning("Event loop lag %.0f ms", lag * 1000)
+
+
+rate_limiter = RateLimiter(MemoryRateLimitStore())
+load_shedder = LoadShedder()
@@ -1,3 +1,5 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -10,18 +12,27 @@ from core.config import settings
 ALGORITHM = "HS256"
 CSRF_SALT = "samarth-csrf"
 
+# bcrypt releases the GIL, so a few threads hash in parallel without blocking the event loop.
+# Calls beyond the pool size wait in the executor's queue instead of piling onto the CPU.
+_password_pool: ThreadPoolExecutor | None = None
+
 
 def _csrf_serializer() -> URLSafeTimedSerializer:
     return URLSafeTimedSerializer(settings.SECRET_KEY, salt=CSRF_SALT)
 
 
-def create_access_token(subject: str | Any, expires_delta: timedelta | None = None) -> str:
+def create_access_token(
+    subject: str | Any, expires_delta: timedelta | None = None, version: int | None = None
+) -> str:
+    """A signed token for ``subject``; ``version`` is the user's ``auth_version`` at issue."""
     if expires_delta:
         expire = datetime.now(UTC) + expires_delta
     else:
         expire = datetime.now(UTC) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
 
-    to_encode = {"exp": expire, "sub": str(subject)}
+    to_encode: dict[str, Any] = {"exp": expire, "sub": str(subject)}
+    if version is not None:
+        to_encode["ver"] = version
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
@@ -38,10 +49,42 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     pwd_bytes = password.encode("utf-8")
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     return bcrypt.hashpw(pwd_bytes, salt).decode("utf-8")
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """True when a stored hash was made with a different cost than ``BCRYPT_ROUNDS``."""
+    try:
+        rounds = int(hashed_password.split("$")[2])
+    except (IndexError, ValueError):
+        return True
+    return rounds != settings.BCRYPT_ROUNDS
+
+
+def _password_executor() -> ThreadPoolExecutor:
+    global _password_pool
+    if _password_pool is None:
+        _password_pool = ThreadPoolExecutor(
+            max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash"
+        )
+    return _password_pool
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """``verify_password`` on the password hashing pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _password_executor(), verify_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """``get_password_hash`` on the password hashing pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor(), get_password_hash, password)
+
+
 def create_csrf_token(subject: str | int) -> str:
     serializer = _csrf_serializer()
     return serializer.dumps({"sub": str(subject)})
@@ -0,0 +1,63 @@
+"""JSON responses encoded straight to bytes.
+
+With ``response_model`` FastAPI validates an endpoint's return value, dumps the result to
+Python primitives and encodes those with the stdlib ``json`` module: three passes over
+every nested resume or job document. ``json_response`` validates once through a cached
+``TypeAdapter`` and has pydantic-core write the JSON bytes directly, skipping validation
+entirely for models and documents the services built themselves. ``FastJSONResponse``
+uses the same encoder for routes that still return plain data.
+"""
+
+from collections.abc import Mapping
+from functools import cache
+from typing import Any
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+
+
+@cache
+def type_adapter(model: Any) -> TypeAdapter[Any]:
+    return TypeAdapter(model)
+
+
+def dump_json(value: Any, model: Any = None) -> bytes:
+    """Encode ``value``, first validating it as ``model`` unless that is None.
+
+    ORM objects are read through their attributes. A value that already is an instance
+    of ``model`` is encoded as is.
+    """
+    if model is None:
+        return to_json(value)
+    adapter = type_adapter(model)
+    if isinstance(model, type) and issubclass(model, BaseModel) and isinstance(value, model):
+        return adapter.dump_json(value)
+    return adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+
+
+def json_response(
+    value: Any,
+    model: Any = None,
+    *,
+    status_code: int = 200,
+    headers: Mapping[str, str] | None = None,
+) -> Response:
+    """A JSON response for ``value``; see ``dump_json``.
+
+    Routes returning a ``Response`` bypass their ``response_model``, which then only
+    documents the schema, and drop headers set on an injected ``Response`` parameter
+    unless they are passed as ``headers``.
+    """
+    return Response(
+        dump_json(value, model),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
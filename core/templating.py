@@ -0,0 +1,106 @@
+"""Jinja2 templates compiled once per locale.
+
+Templates call ``t('some.key')`` for every UI string. ``TranslationExtension`` replaces
+each call whose argument is a string literal with the translated text while the template
+is compiled, so rendering does no lookups for them. Calls with computed keys (e.g.
+``t('status.' ~ app.status|lower)``) are left to the ``t`` function in the template
+context.
+"""
+
+from collections.abc import Iterator
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from jinja2 import Environment, FileSystemLoader, Template
+from jinja2.ext import Extension
+from jinja2.lexer import Token, TokenStream
+from starlette.templating import Jinja2Templates, _TemplateResponse
+
+from core.i18n import BASE_LOCALE, get_catalog, normalize_locale
+
+# The locale each environment compiles templates for; environments not listed use English.
+_ENVIRONMENT_LOCALES: WeakKeyDictionary[Environment, str] = WeakKeyDictionary()
+
+
+class TranslationExtension(Extension):
+    """Folds ``t('literal')`` calls into constants for the environment's locale."""
+
+    def filter_stream(self, stream: TokenStream) -> Iterator[Token]:
+        catalog = get_catalog(_ENVIRONMENT_LOCALES.get(self.environment, BASE_LOCALE))
+        tokens = list(stream)
+        previous: Token | None = None
+        index = 0
+        while index < len(tokens):
+            token = tokens[index]
+            call = tokens[index : index + 4]
+            if (
+                token.type == "name"
+                and token.value == "t"
+                # ``obj.t(...)`` and ``value|t(...)`` are not the translation function.
+                and (previous is None or previous.type not in ("dot", "pipe"))
+                and [part.type for part in call] == ["name", "lparen", "string", "rparen"]
+            ):
+                yield Token(token.lineno, "string", catalog.translate(call[2].value))
+                previous = call[-1]
+                index += 4
+                continue
+            yield token
+            previous = token
+            index += 1
+
+
+# Positional parameters of ``Jinja2Templates.TemplateResponse`` in its current
+# ``(request, name, ...)`` form and its deprecated ``(name, context, ...)`` form.
+_RESPONSE_PARAMS = ("request", "name", "context", "status_code", "headers", "media_type")
+_LEGACY_RESPONSE_PARAMS = ("name", "context", "status_code", "headers", "media_type")
+
+
+class LocalizedTemplates(Jinja2Templates):
+    """``Jinja2Templates`` with one environment, and so one compiled template, per locale.
+
+    The locale comes from the ``locale`` entry of the template context.
+    """
+
+    def __init__(self, directory: str):
+        env = Environment(
+            loader=FileSystemLoader(directory),
+            autoescape=True,
+            extensions=[TranslationExtension],
+        )
+        super().__init__(env=env)
+        self._environments: dict[str, Environment] = {BASE_LOCALE: env}
+
+    def environment(self, locale: str) -> Environment:
+        locale = normalize_locale(locale)
+        env = self._environments.get(locale)
+        if env is None:
+            # An overlay shares the loader, globals and filters but gets its own cache.
+            env = self.env.overlay(cache_size=400)
+            _ENVIRONMENT_LOCALES[env] = locale
+            self._environments[locale] = env
+        return env
+
+    def get_template(self, name: str, locale: str = BASE_LOCALE) -> Template:
+        return self.environment(locale).get_template(name)
+
+    def TemplateResponse(self, *args: Any, **kwargs: Any) -> _TemplateResponse:  # noqa: N802
+        """Same arguments as ``Jinja2Templates.TemplateResponse``; renders in the context's locale."""
+        legacy = bool(args) and isinstance(args[0], str)
+        params = dict(
+            zip(_LEGACY_RESPONSE_PARAMS if legacy else _RESPONSE_PARAMS, args, strict=False)
+        )
+        params.update(kwargs)
+        context: dict[str, Any] = params.get("context") or {}
+        request = params.get("request") or context["request"]
+        context.setdefault("request", request)
+        for processor in self.context_processors:
+            context.update(processor(request))
+        template = self.get_template(params["name"], context.get("locale", BASE_LOCALE))
+        return _TemplateResponse(
+            template,
+            context,
+            status_code=params.get("status_code", 200),
+            headers=params.get("headers"),
+            media_type=params.get("media_type"),
+            background=params.get("background"),
+        )
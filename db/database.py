@@ -1,15 +1,90 @@
+import asyncio
 import logging
+from typing import Any
 
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy import event, make_url, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
 
 from core.config import settings
 
 logger = logging.getLogger(__name__)
 
-engine = create_async_engine(settings.DATABASE_URL, echo=settings.ENVIRONMENT == "development")
+
+def sqlite_pragmas() -> list[str]:
+    """Connection settings for file-backed SQLite in production.
+
+    WAL lets readers run alongside the single writer, and ``synchronous=NORMAL`` only
+    fsyncs at checkpoints, which is still durable against application crashes.
+    """
+    return [
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}",
+        f"PRAGMA cache_size=-{settings.SQLITE_CACHE_SIZE_KIB}",
+        f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}",
+        "PRAGMA temp_store=MEMORY",
+        # Bounds the rows PRAGMA optimize samples per index when it re-analyzes.
+        "PRAGMA analysis_limit=400",
+    ]
+
+
+def _apply_sqlite_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in sqlite_pragmas():
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def configure_sqlite(db_engine: AsyncEngine) -> None:
+    """Apply the tuning profile to every new connection of a SQLite engine."""
+    if db_engine.dialect.name == "sqlite":
+        event.listen(db_engine.sync_engine, "connect", _apply_sqlite_pragmas)
+
+
+async def sqlite_maintenance(db_engine: AsyncEngine) -> None:
+    """Periodically checkpoint the WAL and refresh planner statistics."""
+    while True:
+        await asyncio.sleep(settings.SQLITE_MAINTENANCE_INTERVAL_SECONDS)
+        try:
+            async with db_engine.connect() as conn:
+                await conn.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
+                await conn.execute(text("PRAGMA optimize"))
+        except Exception:
+            logger.exception("SQLite maintenance failed")
+
+
+def _create_engine(url: str, pool_size: int, max_overflow: int) -> AsyncEngine:
+    options: dict[str, Any] = {}
+    if make_url(url).get_backend_name() != "sqlite":
+        options = {"pool_size": pool_size, "max_overflow": max_overflow}
+    db_engine = create_async_engine(url, echo=settings.ENVIRONMENT == "development", **options)
+    if settings.SQLITE_TUNING:
+        configure_sqlite(db_engine)
+    return db_engine
+
+
+engine = _create_engine(settings.DATABASE_URL, settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW)
 async_session_factory = async_sessionmaker(engine, expire_on_commit=False)
 
+# Replica for read-only pages that tolerate replication lag. Without DATABASE_READ_URL
+# reads share the primary engine.
+read_engine = (
+    _create_engine(
+        settings.DATABASE_READ_URL, settings.DB_READ_POOL_SIZE, settings.DB_READ_MAX_OVERFLOW
+    )
+    if settings.DATABASE_READ_URL
+    else engine
+)
+read_session_factory = async_sessionmaker(read_engine, expire_on_commit=False)
+
 
 class Base(DeclarativeBase):
     pass
@@ -18,3 +93,18 @@ class Base(DeclarativeBase):
 async def get_db():
     async with async_session_factory() as session:
         yield session
+
+
+async def get_read_db():
+    """Session on the read replica.
+
+    Only for lag-tolerant reads; anything that must see the caller's own writes uses
+    ``get_db``.
+    """
+    async with read_session_factory() as session:
+        yield session
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Session factory for work that outlives the request, such as background tasks."""
+    return async_session_factory
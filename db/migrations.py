@@ -0,0 +1,242 @@
+"""Versioned schema migrations.
+
+``create_all`` only creates missing tables, so databases created by an older release
+never pick up new columns or indexes. Migrations are applied in order and recorded in
+``schema_version``; each one must be safe to run against a database whose tables were
+already created from the current models (fresh installs and the test suite).
+
+Run ``python -m db.migrations upgrade`` to migrate without starting the app, or leave
+``AUTO_MIGRATE`` enabled to migrate on startup.
+"""
+
+import argparse
+import asyncio
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from sqlalchemy import (
+    Column,
+    Connection,
+    DateTime,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    func,
+    insert,
+    inspect,
+    select,
+    text,
+)
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+import models  # noqa: F401  # registers tables on Base.metadata
+from db.database import Base, engine
+
+logger = logging.getLogger(__name__)
+
+schema_version = Table(
+    "schema_version",
+    MetaData(),
+    Column("version", Integer, primary_key=True),
+    Column("name", String, nullable=False),
+    Column("applied_at", DateTime(timezone=True), server_default=func.now()),
+)
+
+# Arbitrary key for the PostgreSQL advisory lock that serialises concurrent upgrades.
+_PG_LOCK_KEY = 0x5A4D
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    upgrade: Callable[[Connection], None]
+
+
+def _add_column(conn: Connection, table_name: str, column_name: str) -> None:
+    """Add a model column to an existing table unless it is already there."""
+    existing = {column["name"] for column in inspect(conn).get_columns(table_name)}
+    if column_name in existing:
+        return
+    column = Base.metadata.tables[table_name].c[column_name]
+    ddl = f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column.type.compile(conn.dialect)}"
+    if column.server_default is not None:
+        ddl += f" DEFAULT '{column.server_default.arg}'"
+    if not column.nullable:
+        ddl += " NOT NULL"
+    conn.execute(text(ddl))
+
+
+def _create_indexes(conn: Connection, *names: str) -> None:
+    """Create model-declared indexes by name, skipping any that already exist."""
+    indexes = {
+        index.name: index for table in Base.metadata.tables.values() for index in table.indexes
+    }
+    for name in names:
+        indexes[name].create(conn, checkfirst=True)
+
+
+def _baseline(conn: Connection) -> None:
+    Base.metadata.create_all(conn)
+
+
+def _application_scoring_status(conn: Connection) -> None:
+    _add_column(conn, "applications", "scoring_status")
+
+
+def _hot_path_indexes(conn: Connection) -> None:
+    # Owner-scoped lists filter on the owner and will page by creation time; the
+    # applications indexes also serve the job/resume IN-subqueries with a status filter.
+    _create_indexes(
+        conn,
+        "ix_resumes_user_id_created_at",
+        "ix_jobs_company_id_created_at",
+        "ix_applications_job_id_status",
+        "ix_applications_resume_id_status",
+    )
+
+
+def _keyset_pagination(conn: Connection) -> None:
+    # Unfiltered lists (all jobs for job seekers, all resumes for recruiters) page by
+    # creation time alone.
+    _create_indexes(conn, "ix_resumes_created_at", "ix_jobs_created_at")
+    if conn.dialect.name != "sqlite":
+        return
+    # Rows written with the CURRENT_TIMESTAMP server default lack fractional seconds, which
+    # breaks text comparisons against bound datetimes; rewrite them in SQLAlchemy's format.
+    for table in ("resumes", "jobs", "applications"):
+        conn.execute(
+            text(
+                f"UPDATE {table} SET created_at = "
+                "strftime('%Y-%m-%d %H:%M:%f', created_at) || '000' "
+                "WHERE length(created_at) = 19"
+            )
+        )
+
+
+def _jsonb_skill_columns(conn: Connection) -> None:
+    # Only PostgreSQL has JSONB; there the skill documents get GIN indexes for containment
+    # filters. The index definitions are PostgreSQL-only, so elsewhere this is a no-op.
+    if conn.dialect.name == "postgresql":
+        for table, column in (
+            ("resumes", "parsed_sections"),
+            ("resumes", "skills"),
+            ("jobs", "required_skills"),
+            ("jobs", "preferred_skills"),
+        ):
+            conn.execute(
+                text(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb")
+            )
+    _create_indexes(
+        conn,
+        "ix_resumes_skills_gin",
+        "ix_jobs_required_skills_gin",
+        "ix_jobs_preferred_skills_gin",
+    )
+
+
+def _user_auth_version(conn: Connection) -> None:
+    _add_column(conn, "users", "auth_version")
+
+
+def _resume_artifacts(conn: Connection) -> None:
+    Base.metadata.tables["resume_artifacts"].create(conn, checkfirst=True)
+
+
+def _application_updated_at(conn: Connection) -> None:
+    # Scoring and status changes bump it, so application lists get HTTP validators.
+    _add_column(conn, "applications", "updated_at")
+
+
+def _resume_artifact_skill_ids(conn: Connection) -> None:
+    Base.metadata.tables["skills"].create(conn, checkfirst=True)
+    _add_column(conn, "resume_artifacts", "skill_ids")
+    # Dropped and restored in the same release; installs that kept it already have it.
+    _add_column(conn, "resume_artifacts", "years_experience")
+
+
+def _application_scoring_claim(conn: Connection) -> None:
+    _add_column(conn, "applications", "scoring_claimed_at")
+
+
+MIGRATIONS: list[Migration] = [
+    Migration(1, "baseline", _baseline),
+    Migration(2, "application_scoring_status", _application_scoring_status),
+    Migration(3, "hot_path_indexes", _hot_path_indexes),
+    Migration(4, "keyset_pagination", _keyset_pagination),
+    Migration(5, "jsonb_skill_columns", _jsonb_skill_columns),
+    Migration(6, "user_auth_version", _user_auth_version),
+    Migration(7, "resume_artifacts", _resume_artifacts),
+    Migration(8, "application_updated_at", _application_updated_at),
+    Migration(9, "resume_artifact_skill_ids", _resume_artifact_skill_ids),
+    Migration(10, "application_scoring_claim", _application_scoring_claim),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+def _applied_versions(conn: Connection) -> set[int]:
+    if not inspect(conn).has_table(schema_version.name):
+        return set()
+    return set(conn.scalars(select(schema_version.c.version)))
+
+
+def _upgrade(conn: Connection, target: int | None = None) -> list[int]:
+    if conn.dialect.name == "postgresql":
+        conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _PG_LOCK_KEY})
+    schema_version.create(conn, checkfirst=True)
+    applied = _applied_versions(conn)
+
+    ran: list[int] = []
+    for migration in MIGRATIONS:
+        if migration.version in applied:
+            continue
+        if target is not None and migration.version > target:
+            break
+        logger.info("Applying migration %s: %s", migration.version, migration.name)
+        migration.upgrade(conn)
+        conn.execute(insert(schema_version).values(version=migration.version, name=migration.name))
+        ran.append(migration.version)
+    return ran
+
+
+async def run_migrations(db_engine: AsyncEngine, target: int | None = None) -> list[int]:
+    """Apply pending migrations in one transaction and return the versions applied."""
+    async with db_engine.begin() as conn:
+        return await conn.run_sync(_upgrade, target)
+
+
+async def current_version(db_engine: AsyncEngine) -> int | None:
+    async with db_engine.connect() as conn:
+        applied = await conn.run_sync(_applied_versions)
+    return max(applied, default=None)
+
+
+async def _main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m db.migrations")
+    commands = parser.add_subparsers(dest="command", required=True)
+    upgrade = commands.add_parser("upgrade", help="apply pending migrations")
+    upgrade.add_argument("--target", type=int, default=None, help="stop after this version")
+    commands.add_parser("current", help="print the applied schema version")
+    commands.add_parser("history", help="list known migrations")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "upgrade":
+            applied = await run_migrations(engine, args.target)
+            print(f"Applied {applied}" if applied else "Already up to date")
+        elif args.command == "current":
+            version = await current_version(engine)
+            print(version if version is not None else "none")
+        else:
+            for migration in MIGRATIONS:
+                print(f"{migration.version:>4}  {migration.name}")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s [%(name)s] %(message)s")
+    asyncio.run(_main())
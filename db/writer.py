@@ -0,0 +1,134 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from core.config import settings
+from db.database import async_session_factory
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+WriteOp = Callable[[AsyncSession], Awaitable[T]]
+
+
+@dataclass(slots=True)
+class _PendingWrite:
+    op: WriteOp[Any]
+    future: asyncio.Future[Any]
+
+
+class WriteCoordinator:
+    """Single writer task that group-commits queued write operations.
+
+    SQLite allows one writer at a time, so request handlers that each commit end up
+    queueing on the database lock. Routed through the coordinator, their operations run
+    back to back in one transaction and share a single commit. If any operation in a
+    batch fails, the batch is rolled back and replayed one operation per transaction so
+    the failure only reaches its own caller.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        max_batch: int = 64,
+        window_ms: float = 0,
+    ):
+        self.session_factory = session_factory
+        self.max_batch = max_batch
+        self.window_ms = window_ms
+        self._queue: asyncio.Queue[_PendingWrite | None] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Finish the writes already queued, then stop the writer task."""
+        task, self._task = self._task, None
+        if task is None or self._queue is None:
+            return
+        self._queue.put_nowait(None)
+        await task
+
+    async def execute(self, db: AsyncSession, op: WriteOp[T]) -> T:
+        """Run ``op`` and commit it.
+
+        While the coordinator is running ``op`` is given the writer's session, so any
+        ORM objects it returns are detached once the batch commits. Otherwise it runs on
+        ``db`` and commits there.
+        """
+        if self._task is None or self._queue is None:
+            result = await op(db)
+            await db.commit()
+            return result
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(_PendingWrite(op, future))
+        return await future
+
+    async def _run(self) -> None:
+        assert self._queue is not None
+        stopping = False
+        while not stopping:
+            first = await self._queue.get()
+            if first is None:
+                return
+            if self.window_ms:
+                await asyncio.sleep(self.window_ms / 1000)
+            batch = [first]
+            while len(batch) < self.max_batch and not self._queue.empty():
+                pending = self._queue.get_nowait()
+                if pending is None:
+                    stopping = True
+                    break
+                batch.append(pending)
+            try:
+                await self._commit(batch)
+            except Exception as exc:
+                logger.exception("Write batch failed")
+                for pending in batch:
+                    if not pending.future.done():
+                        pending.future.set_exception(exc)
+
+    async def _commit(self, batch: list[_PendingWrite]) -> None:
+        async with self.session_factory() as db:
+            try:
+                results = [await pending.op(db) for pending in batch]
+                await db.commit()
+            except Exception:
+                await db.rollback()
+            else:
+                for pending, result in zip(batch, results, strict=True):
+                    if not pending.future.done():
+                        pending.future.set_result(result)
+                return
+
+        if len(batch) > 1:
+            logger.warning("Write batch of %d failed; replaying one at a time", len(batch))
+        for pending in batch:
+            async with self.session_factory() as db:
+                try:
+                    result = await pending.op(db)
+                    await db.commit()
+                except Exception as exc:
+                    if not pending.future.done():
+                        pending.future.set_exception(exc)
+                else:
+                    if not pending.future.done():
+                        pending.future.set_result(result)
+
+
+write_coordinator = WriteCoordinator(
+    async_session_factory,
+    max_batch=settings.WRITE_BATCH_MAX_SIZE,
+    window_ms=settings.WRITE_BATCH_WINDOW_MS,
+)
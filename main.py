@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 from collections.abc import AsyncIterator
@@ -9,7 +10,11 @@ from fastapi.staticfiles import StaticFiles
 
 from api import router as api_router
 from core.config import settings
-from db.database import Base, engine
+from core.ratelimit import load_shedder
+from db.database import async_session_factory, engine, sqlite_maintenance
+from db.migrations import run_migrations
+from db.writer import write_coordinator
+from services import job_service, matching_service, recommendation_service, trend_service
 from ui import router as ui_router
 
 logging.basicConfig(
@@ -24,12 +29,28 @@ os.makedirs("static", exist_ok=True)
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
-    logger.info("Creating database tables")
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    if settings.AUTO_MIGRATE:
+        logger.info("Applying database migrations")
+        await run_migrations(engine)
+    await job_service.ensure_skill_demand(async_session_factory)
+    if settings.WRITE_BATCHING:
+        write_coordinator.start()
+    # Backfill recommendation lists for resumes that predate them or missed an update.
+    refill = asyncio.create_task(recommendation_service.refill(async_session_factory))
+    # Finish deferred scoring that a previous process started but did not complete.
+    pending = asyncio.create_task(matching_service.score_pending(async_session_factory))
+    rollups = asyncio.create_task(trend_service.run_periodically(async_session_factory))
+    background = [refill, pending, rollups]
+    if settings.SQLITE_TUNING and engine.dialect.name == "sqlite":
+        background.append(asyncio.create_task(sqlite_maintenance(engine)))
+    if settings.LOAD_SHEDDING:
+        background.append(asyncio.create_task(load_shedder.monitor_loop_lag()))
     logger.info("Startup complete")
     yield
     logger.info("Shutting down")
+    for task in background:
+        task.cancel()
+    await write_coordinator.stop()
 
 
 app = FastAPI(
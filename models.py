@@ -1,12 +1,43 @@
-from datetime import datetime
+from datetime import UTC, date, datetime
 from typing import Any
 
-from sqlalchemy import JSON, Boolean, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Date,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from db.database import Base
 
 
+def _utcnow() -> datetime:
+    # Paginated tables set created_at client-side so SQLite stores the same text format
+    # as bound parameters; keyset comparisons on created_at rely on it. updated_at is
+    # client-side too, so an UPDATE never needs a follow-up SELECT for the new value.
+    return datetime.now(UTC)
+
+
+# Skill and parsed-profile documents are JSONB on PostgreSQL so containment filters can use
+# GIN indexes; other databases keep plain JSON.
+SearchableJSON = JSON().with_variant(JSONB(), "postgresql")
+
+
+def _gin_index(name: str, column: str) -> Index:
+    return Index(
+        name, column, postgresql_using="gin", postgresql_ops={column: "jsonb_path_ops"}
+    ).ddl_if(dialect="postgresql")
+
+
 class User(Base):
     __tablename__ = "users"
 
@@ -20,23 +51,34 @@ class User(Base):
     profile_picture_url: Mapped[str | None] = mapped_column(String, default=None)
     is_recruiter: Mapped[bool] = mapped_column(default=False)
     is_active: Mapped[bool] = mapped_column(default=True)
+    # Bumped whenever a field of the cached principal changes. Tokens carry the version
+    # they were issued at, so a bump revokes them (see ``UserService.get_principal``).
+    auth_version: Mapped[int] = mapped_column(default=0, server_default="0")
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime | None] = mapped_column(
-        DateTime(timezone=True), onupdate=func.now(), default=None
+        DateTime(timezone=True), onupdate=_utcnow, default=None
     )
 
-    resumes: Mapped[list["Resume"]] = relationship(back_populates="owner", lazy="selectin")
-    jobs: Mapped[list["Job"]] = relationship(back_populates="company", lazy="selectin")
+    resumes: Mapped[list["Resume"]] = relationship(back_populates="owner", lazy="raise")
+    jobs: Mapped[list["Job"]] = relationship(back_populates="company", lazy="raise")
 
 
 class Resume(Base):
     __tablename__ = "resumes"
+    __table_args__ = (
+        Index("ix_resumes_user_id_created_at", "user_id", "created_at"),
+        Index("ix_resumes_created_at", "created_at"),
+        _gin_index("ix_resumes_skills_gin", "skills"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
-    full_text: Mapped[str | None] = mapped_column(Text, default=None)
-    parsed_sections: Mapped[dict[str, Any] | None] = mapped_column(JSON, default=None)
-    skills: Mapped[list[Any] | None] = mapped_column(JSON, default=None)
+    # Large text columns load only when a query asks for them (see ``undefer`` in services).
+    full_text: Mapped[str | None] = mapped_column(
+        Text, default=None, deferred=True, deferred_raiseload=True
+    )
+    parsed_sections: Mapped[dict[str, Any] | None] = mapped_column(SearchableJSON, default=None)
+    skills: Mapped[list[Any] | None] = mapped_column(SearchableJSON, default=None)
     experience: Mapped[list[Any] | None] = mapped_column(JSON, default=None)
     education: Mapped[list[Any] | None] = mapped_column(JSON, default=None)
     projects: Mapped[list[Any] | None] = mapped_column(JSON, default=None)
@@ -44,24 +86,32 @@ class Resume(Base):
     achievements: Mapped[list[Any] | None] = mapped_column(JSON, default=None)
     file_path: Mapped[str | None] = mapped_column(String, default=None)
     file_type: Mapped[str | None] = mapped_column(String, default=None)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow, server_default=func.now()
+    )
     updated_at: Mapped[datetime | None] = mapped_column(
-        DateTime(timezone=True), onupdate=func.now(), default=None
+        DateTime(timezone=True), onupdate=_utcnow, default=None
     )
 
-    owner: Mapped["User"] = relationship(back_populates="resumes", lazy="selectin")
-    applications: Mapped[list["Application"]] = relationship(
-        back_populates="resume", lazy="selectin"
-    )
+    owner: Mapped["User"] = relationship(back_populates="resumes", lazy="raise")
+    applications: Mapped[list["Application"]] = relationship(back_populates="resume", lazy="raise")
 
 
 class Job(Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_company_id_created_at", "company_id", "created_at"),
+        Index("ix_jobs_created_at", "created_at"),
+        _gin_index("ix_jobs_required_skills_gin", "required_skills"),
+        _gin_index("ix_jobs_preferred_skills_gin", "preferred_skills"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     company_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
     title: Mapped[str] = mapped_column(String, index=True)
-    description_text: Mapped[str | None] = mapped_column(Text, default=None)
+    description_text: Mapped[str | None] = mapped_column(
+        Text, default=None, deferred=True, deferred_raiseload=True
+    )
     location: Mapped[str | None] = mapped_column(String, default=None)
     salary_min: Mapped[int | None] = mapped_column(Integer, default=None)
     salary_max: Mapped[int | None] = mapped_column(Integer, default=None)
@@ -72,22 +122,28 @@ class Job(Base):
     experience_level: Mapped[str | None] = mapped_column(
         String, default=None
     )  # entry/mid/senior/lead
-    required_skills: Mapped[list[Any] | None] = mapped_column(JSON, default=None)
-    preferred_skills: Mapped[list[Any] | None] = mapped_column(JSON, default=None)
+    required_skills: Mapped[list[Any] | None] = mapped_column(SearchableJSON, default=None)
+    preferred_skills: Mapped[list[Any] | None] = mapped_column(SearchableJSON, default=None)
     responsibilities: Mapped[list[Any] | None] = mapped_column(JSON, default=None)
     qualifications: Mapped[list[Any] | None] = mapped_column(JSON, default=None)
     priority_weights: Mapped[dict[str, Any] | None] = mapped_column(JSON, default=None)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow, server_default=func.now()
+    )
     updated_at: Mapped[datetime | None] = mapped_column(
-        DateTime(timezone=True), onupdate=func.now(), default=None
+        DateTime(timezone=True), onupdate=_utcnow, default=None
     )
 
-    company: Mapped["User"] = relationship(back_populates="jobs", lazy="selectin")
-    applications: Mapped[list["Application"]] = relationship(back_populates="job", lazy="selectin")
+    company: Mapped["User"] = relationship(back_populates="jobs", lazy="raise")
+    applications: Mapped[list["Application"]] = relationship(back_populates="job", lazy="raise")
 
 
 class Application(Base):
     __tablename__ = "applications"
+    __table_args__ = (
+        Index("ix_applications_job_id_status", "job_id", "status"),
+        Index("ix_applications_resume_id_status", "resume_id", "status"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     job_id: Mapped[int] = mapped_column(ForeignKey("jobs.id"))
@@ -100,8 +156,125 @@ class Application(Base):
     match_details: Mapped[dict[str, Any] | None] = mapped_column(JSON, default=None)
     feedback: Mapped[dict[str, Any] | None] = mapped_column(JSON, default=None)
     status: Mapped[str] = mapped_column(String, default="New")
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    scoring_status: Mapped[str] = mapped_column(
+        String, default="scored", server_default="scored"
+    )  # pending/scored/failed
+    # Set by the worker scoring a pending application so no other worker scores it too;
+    # claims older than SCORING_CLAIM_TIMEOUT_SECONDS are from a worker that stopped.
+    scoring_claimed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), default=None
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow, server_default=func.now()
+    )
     reviewed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None)
+    updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), onupdate=_utcnow, default=None
+    )
+
+    job: Mapped["Job"] = relationship(back_populates="applications", lazy="raise")
+    resume: Mapped["Resume"] = relationship(back_populates="applications", lazy="raise")
+
+
+class JobRecommendation(Base):
+    """Materialized top-K job recommendations for a resume.
+
+    Rows are maintained incrementally by ``RecommendationService`` whenever a job or
+    resume is written, so reads are a single indexed range scan.
+    """
+
+    __tablename__ = "job_recommendations"
+    __table_args__ = (Index("ix_job_recommendations_resume_score", "resume_id", "score"),)
+
+    resume_id: Mapped[int] = mapped_column(
+        ForeignKey("resumes.id", ondelete="CASCADE"), primary_key=True
+    )
+    job_id: Mapped[int] = mapped_column(
+        ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True, index=True
+    )
+    score: Mapped[float] = mapped_column(Float, default=0.0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+
+class ResumeArtifact(Base):
+    """Values derived from a resume, computed once in the background after ingest.
+
+    ``version`` is the algorithm version and ``prompt_hash`` fingerprints the improvement
+    prompt; rows that do not match the current ones are stale and get recomputed (see
+    ``ResumeArtifactService``). ``improvement`` stays NULL when no AI provider answered, and
+    ``years_experience`` when no experience entry has a usable date range.
+    """
+
+    __tablename__ = "resume_artifacts"
+
+    resume_id: Mapped[int] = mapped_column(
+        ForeignKey("resumes.id", ondelete="CASCADE"), primary_key=True
+    )
+    version: Mapped[int] = mapped_column(Integer)
+    prompt_hash: Mapped[str] = mapped_column(String)
+    quality_score: Mapped[dict[str, Any]] = mapped_column(JSON)
+    improvement: Mapped[dict[str, Any] | None] = mapped_column(
+        JSON(none_as_null=True), default=None
+    )
+    skill_names: Mapped[list[str]] = mapped_column(JSON)
+    # Sorted ``skills.id`` values of ``skill_names``; the default only fills rows written
+    # before the column existed, which are stale and get recomputed.
+    skill_ids: Mapped[list[int]] = mapped_column(JSON, server_default="[]")
+    years_experience: Mapped[float | None] = mapped_column(Float, default=None)
+    computed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow)
+
+
+class Skill(Base):
+    """Vocabulary of normalized (trimmed, lower-cased) skill names, grown as resumes add them."""
+
+    __tablename__ = "skills"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String, unique=True)
+
+
+class SkillDemand(Base):
+    """Running count of jobs that list a skill, per scope and requirement kind.
+
+    ``scope`` is ``"all"`` for the whole market or ``"company:<user_id>"`` for one
+    recruiter; ``kind`` is ``"required"`` or ``"preferred"``.
+    """
+
+    __tablename__ = "skill_demand"
+    __table_args__ = (Index("ix_skill_demand_scope_kind_count", "scope", "kind", "count"),)
+
+    scope: Mapped[str] = mapped_column(String, primary_key=True)
+    kind: Mapped[str] = mapped_column(String, primary_key=True)
+    skill: Mapped[str] = mapped_column(String, primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, default=0)
+
+
+class SkillTrend(Base):
+    """Number of jobs created in a day or week bucket that list a skill.
+
+    Slice columns use ``""`` rather than NULL for "not specified" so they can be part
+    of the primary key; ``location`` is stored lower-cased.
+    """
+
+    __tablename__ = "skill_trends"
+    __table_args__ = (Index("ix_skill_trends_lookup", "grain", "kind", "skill", "bucket"),)
+
+    grain: Mapped[str] = mapped_column(String, primary_key=True)  # day/week
+    bucket: Mapped[date] = mapped_column(Date, primary_key=True)
+    kind: Mapped[str] = mapped_column(String, primary_key=True)  # required/preferred
+    skill: Mapped[str] = mapped_column(String, primary_key=True)
+    location: Mapped[str] = mapped_column(String, primary_key=True, default="")
+    is_remote: Mapped[bool] = mapped_column(Boolean, primary_key=True, default=False)
+    experience_level: Mapped[str] = mapped_column(String, primary_key=True, default="")
+    count: Mapped[int] = mapped_column(Integer, default=0)
+
+
+class RollupState(Base):
+    """Watermark of the last source row folded into a rollup."""
+
+    __tablename__ = "rollup_state"
 
-    job: Mapped["Job"] = relationship(back_populates="applications", lazy="selectin")
-    resume: Mapped["Resume"] = relationship(back_populates="applications", lazy="selectin")
+    name: Mapped[str] = mapped_column(String, primary_key=True)
+    last_id: Mapped[int] = mapped_column(Integer, default=0)
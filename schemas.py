@@ -1,11 +1,15 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any, Literal
 
-from pydantic import BaseModel, ConfigDict, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
+
+from core.config import settings
 
 
 class TokenPayload(BaseModel):
     sub: str | None = None
+    # The user's auth_version when the token was issued; tokens without one are rejected.
+    ver: int | None = None
 
 
 class Token(BaseModel):
@@ -212,8 +216,10 @@ class Application(ApplicationBase):
     match_details: dict[str, Any] | None = None
     feedback: dict[str, Any] | None = None
     status: str
+    scoring_status: str = "scored"
     created_at: datetime
     reviewed_at: datetime | None = None
+    updated_at: datetime | None = None
 
 
 class ApplicationWithDetails(Application):
@@ -234,6 +240,21 @@ class MatchResponse(BaseModel):
     feedback: dict[str, Any]
 
 
+class MatchBatchRequest(BaseModel):
+    pairs: list[MatchRequest] = Field(max_length=settings.MATCH_BATCH_MAX_PAIRS)
+
+
+class MatchBatchResult(BaseModel):
+    """One NDJSON line of a batch match; ``error`` is set instead of the scores on failure."""
+
+    resume_id: int
+    job_id: int
+    match_score: float | None = None
+    match_details: dict[str, Any] | None = None
+    feedback: dict[str, Any] | None = None
+    error: str | None = None
+
+
 class SkillMatchSection(BaseModel):
     matched: list[str] = []
     missing: list[str] = []
@@ -311,3 +332,26 @@ class SkillsGapResponse(BaseModel):
     missing_preferred: list[SkillGapItem] = []
     learning_path: list[str] = []
     summary: str = ""
+
+
+# ---------------------------------------------------------------------------
+# Skill demand trends
+# ---------------------------------------------------------------------------
+
+
+class SkillTrendPoint(BaseModel):
+    bucket: date
+    count: int
+
+
+class SkillTrendSeries(BaseModel):
+    skill: str
+    points: list[SkillTrendPoint] = []
+
+
+class SkillTrends(BaseModel):
+    grain: Literal["day", "week"]
+    kind: Literal["required", "preferred"]
+    start: date
+    end: date
+    series: list[SkillTrendSeries] = []
@@ -1,11 +1,17 @@
 import asyncio
+import hashlib
+import heapq
 import json
 import logging
 import os
 import re
+import time
 import uuid
 from collections import Counter
-from datetime import UTC, datetime
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from itertools import takewhile
 from pathlib import Path
 from typing import Any
 
@@ -16,13 +22,47 @@ from google import genai
 from google.genai import types
 from openai import OpenAI
 from pypdf import PdfReader
-from sqlalchemy import delete, select
-from sqlalchemy.ext.asyncio import AsyncSession
-
+from sqlalchemy import (
+    Select,
+    String,
+    case,
+    cast,
+    column,
+    delete,
+    desc,
+    event,
+    func,
+    insert,
+    literal,
+    literal_column,
+    or_,
+    select,
+    true,
+    tuple_,
+    type_coerce,
+    update,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import contains_eager, undefer
+
+from core.cache import TTLCache
 from core.config import settings
+from core.loader import BatchLoader
+from core.pagination import decode_cursor
+from core.ratelimit import load_shedder
+from db.writer import write_coordinator
 from models import Application as ApplicationModel
 from models import Job as JobModel
+from models import JobRecommendation as JobRecommendationModel
 from models import Resume as ResumeModel
+from models import ResumeArtifact as ResumeArtifactModel
+from models import RollupState as RollupStateModel
+from models import Skill as SkillModel
+from models import SkillDemand as SkillDemandModel
+from models import SkillTrend as SkillTrendModel
 from models import User as UserModel
 
 logger = logging.getLogger(__name__)
@@ -35,12 +75,323 @@ def _load_prompt(name: str) -> str:
     return path.read_text(encoding="utf-8")
 
 
+def _dialect_insert(db: AsyncSession) -> Any:
+    """Return the dialect-specific ``insert`` that supports ``ON CONFLICT`` upserts."""
+    if db.get_bind().dialect.name == "postgresql":
+        return pg_insert
+    return sqlite_insert
+
+
+def _keyset_page(stmt: Select, model: Any, cursor: str | None, limit: int) -> Select:
+    """Order newest first and start after ``cursor``; raises ``ValueError`` if it is bad."""
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        stmt = stmt.where(tuple_(model.created_at, model.id) < tuple_(created_at, row_id))
+    return stmt.order_by(model.created_at.desc(), model.id.desc()).limit(limit)
+
+
+def _chunked(ids: Iterable[int], size: int = 500) -> Iterator[list[int]]:
+    """Split IDs into chunks that stay below the bound-parameter limits of every backend."""
+    unique = list(dict.fromkeys(ids))
+    for start in range(0, len(unique), size):
+        yield unique[start : start + size]
+
+
+async def _rows_by_id[M: (ResumeModel, JobModel)](
+    db: AsyncSession, model: type[M], ids: Iterable[int]
+) -> dict[int, M]:
+    """Rows of ``model`` keyed by id, fetched in chunked ``IN`` queries; missing ids are absent."""
+    rows: dict[int, M] = {}
+    for chunk in _chunked(ids):
+        result = await db.execute(select(model).where(model.id.in_(chunk)))
+        rows.update((row.id, row) for row in result.scalars())
+    return rows
+
+
+def _json_array_length(db: AsyncSession, column: Any) -> Any:
+    """SQL length of a JSON array column; 0 for NULL and non-array values."""
+    dialect = db.get_bind().dialect
+    if dialect.name != "postgresql":
+        type_of, length = func.json_type, func.json_array_length
+    elif isinstance(column.type.dialect_impl(dialect), JSONB):
+        type_of, length = func.jsonb_typeof, func.jsonb_array_length
+    else:
+        type_of, length = func.json_typeof, func.json_array_length
+    return case((type_of(column) == "array", length(column)), else_=0)
+
+
+def _has_skill(db: AsyncSession, column: Any, skill: str) -> Any:
+    """Whether a skill list column has an entry named exactly ``skill``.
+
+    Entries are ``{"name": ...}`` objects or bare strings. On PostgreSQL this is a JSONB
+    containment test served by the column's GIN index; elsewhere it scans ``json_each``.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        document = type_coerce(column, JSONB)
+        return or_(document.contains([{"name": skill}]), document.contains([skill]))
+    entries = func.json_each(column).table_valued("value", "type")
+    name = case(
+        (entries.c.type == "object", func.json_extract(entries.c.value, "$.name")),
+        else_=entries.c.value,
+    )
+    return select(1).select_from(entries).where(name == skill).exists()
+
+
+def _skill_entries(db: AsyncSession, column_: Any) -> tuple[Any, Any]:
+    """Unnest a JSON skill list into one row per entry.
+
+    Returns a lateral selectable to join against the column's table and the normalized
+    (trimmed, lower-cased) skill name of each entry. Non-array documents yield no rows.
+    """
+    dialect = db.get_bind().dialect
+    if dialect.name == "postgresql":
+        document = type_coerce(column_, JSONB)
+        array = case((func.jsonb_typeof(document) == "array", document), else_=literal([], JSONB))
+        entries = func.jsonb_array_elements(array).table_valued(column("value", JSONB)).lateral()
+        value = entries.c.value
+        name = case(
+            (func.jsonb_typeof(value) == "object", func.jsonb_extract_path_text(value, "name")),
+            (func.jsonb_typeof(value) == "string", value.op("#>>")(literal_column("'{}'"))),
+        )
+    else:
+        array = case((func.json_type(column_) == "array", column_), else_="[]")
+        entries = func.json_each(array).table_valued("value", "type")
+        name = case(
+            (entries.c.type == "object", func.json_extract(entries.c.value, "$.name")),
+            (entries.c.type == "text", entries.c.value),
+        )
+    return entries, func.lower(func.trim(name))
+
+
+class EntityLoaders:
+    """Batch loaders for full resume and job rows, shared by everything using one session.
+
+    Lookups by id made while handling a request are batched and cached (see
+    ``core.loader``); the cache is dropped whenever the session commits or rolls back.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self._db = db
+        # An AsyncSession cannot run statements concurrently, so batches take turns.
+        self._lock = asyncio.Lock()
+        self.resumes: BatchLoader[int, ResumeModel] = BatchLoader(self._load_resumes)
+        self.jobs: BatchLoader[int, JobModel] = BatchLoader(self._load_jobs)
+
+    async def _fetch(self, model: Any, deferred: Any, ids: list[int]) -> dict[int, Any]:
+        rows: dict[int, Any] = {}
+        async with self._lock:
+            for chunk in _chunked(ids):
+                result = await self._db.execute(
+                    select(model).where(model.id.in_(chunk)).options(undefer(deferred))
+                )
+                rows.update((row.id, row) for row in result.scalars())
+        return rows
+
+    async def _load_resumes(self, ids: list[int]) -> dict[int, ResumeModel]:
+        return await self._fetch(ResumeModel, ResumeModel.full_text, ids)
+
+    async def _load_jobs(self, ids: list[int]) -> dict[int, JobModel]:
+        return await self._fetch(JobModel, JobModel.description_text, ids)
+
+    def clear(self) -> None:
+        self.resumes.clear()
+        self.jobs.clear()
+
+
+def entity_loaders(db: AsyncSession) -> EntityLoaders:
+    """The loaders bound to ``db``, created on first use."""
+    loaders = db.info.get("entity_loaders")
+    if loaders is None:
+        loaders = db.info["entity_loaders"] = EntityLoaders(db)
+        for name in ("after_commit", "after_rollback"):
+            event.listen(db.sync_session, name, lambda _session: loaders.clear())
+    return loaders
+
+
+# Achievement bullets that state a measurable outcome.
+_QUANTIFIABLE = re.compile(
+    r"\d+%|\d+x|\$\d+|increased|decreased|improved|reduced|saved|generated", re.IGNORECASE
+)
+_YEAR = re.compile(r"\b(?:19|20)\d{2}\b")
+_ONGOING = re.compile(r"present|current|now|ongoing", re.IGNORECASE)
+
+
+def _quality_score(resume: ResumeModel) -> dict[str, Any]:
+    has_quantifiable = False
+    experience_score = 0
+    for exp in resume.experience or []:
+        achievements = exp.get("achievements", []) if isinstance(exp, dict) else []
+        for achievement in achievements:
+            if _QUANTIFIABLE.search(str(achievement)):
+                has_quantifiable = True
+                experience_score += 10
+
+    skills_score = min(100, len(resume.skills or []) * 7)
+    education_score = min(100, len(resume.education or []) * 30)
+    overall = round(
+        (min(100, experience_score) * 0.5) + (skills_score * 0.3) + (education_score * 0.2),
+        2,
+    )
+
+    suggestions: list[str] = []
+    if not has_quantifiable:
+        suggestions.append("Add measurable outcomes in experience bullets.")
+    if skills_score < 60:
+        suggestions.append("Expand skills with proficiency and role context.")
+    if education_score < 60:
+        suggestions.append("Add education details such as field and achievements.")
+
+    return {
+        "overall_score": overall,
+        "sections": {
+            "experience": min(100, experience_score),
+            "skills": skills_score,
+            "education": education_score,
+        },
+        "suggestions": suggestions,
+    }
+
+
+def _fallback_improvement(resume: ResumeModel) -> dict[str, Any]:
+    return {
+        "format": ["Use consistent section headings and spacing."],
+        "bullet_points": ["Begin bullets with impact verbs and include quantifiable outcomes."],
+        "keywords": ["Collaboration", "Problem Solving", "Delivery"],
+        "skills": [
+            skill.get("name") for skill in (resume.skills or [])[:5] if isinstance(skill, dict)
+        ],
+    }
+
+
+def _years_of_experience(experience: list[Any] | None) -> float | None:
+    """Whole years covered by the experience entries, counting overlapping roles once."""
+    this_year = datetime.now(UTC).year
+    spans: list[tuple[int, int]] = []
+    for exp in experience or []:
+        if not isinstance(exp, dict):
+            continue
+        start = _YEAR.search(str(exp.get("start_date") or ""))
+        if not start:
+            continue
+        end_text = str(exp.get("end_date") or "")
+        end = _YEAR.search(end_text)
+        if end:
+            end_year = int(end.group())
+        elif not end_text or _ONGOING.search(end_text):
+            end_year = this_year
+        else:
+            continue
+        spans.append((int(start.group()), max(int(start.group()), end_year)))
+    if not spans:
+        return None
+
+    total = 0
+    current_start, current_end = sorted(spans)[0]
+    for span_start, span_end in sorted(spans)[1:]:
+        if span_start > current_end:
+            total += current_end - current_start
+            current_start, current_end = span_start, span_end
+        else:
+            current_end = max(current_end, span_end)
+    return float(total + current_end - current_start)
+
+
+def _resume_name() -> Any:
+    return ResumeModel.parsed_sections[("contact", "name")].as_string()
+
+
+# ---------------------------------------------------------------------------
+# Read models for list pages and dashboards. They carry only the columns those
+# views render, so listing never pulls full texts or parsed JSON documents.
+# ---------------------------------------------------------------------------
+
+
+@dataclass(slots=True, frozen=True)
+class ResumeSummary:
+    id: int
+    name: str | None
+    skills_count: int
+    experience_count: int
+    created_at: datetime
+
+
+@dataclass(slots=True, frozen=True)
+class JobSummary:
+    id: int
+    title: str
+    description_preview: str | None
+    location: str | None
+    is_remote: bool
+    required_skills: list[Any] | None
+    created_at: datetime
+
+
+@dataclass(slots=True, frozen=True)
+class ApplicationSummary:
+    id: int
+    job_id: int
+    resume_id: int
+    full_name: str
+    match_score: float
+    status: str
+    scoring_status: str
+    created_at: datetime
+    job_title: str
+    resume_name: str | None
+
+
+@dataclass(slots=True, frozen=True)
+class CollectionVersion:
+    """What a list's HTTP validator is derived from; changes whenever a row is written."""
+
+    count: int
+    max_id: int | None
+    last_modified: datetime | None
+
+
+@dataclass(slots=True, frozen=True)
+class Principal:
+    """The auth-relevant columns of a user, as cached by ``UserService.get_principal``."""
+
+    id: int
+    email: str
+    full_name: str
+    is_active: bool
+    is_recruiter: bool
+    auth_version: int
+
+    def issued(self, version: int | None) -> bool:
+        """Whether a token issued at ``version`` is still valid; unversioned tokens are not."""
+        return version is not None and version == self.auth_version
+
+
+async def _collection_version(db: AsyncSession, model: Any, *where: Any) -> CollectionVersion:
+    """Count, highest id and latest write time of the rows matching ``where``."""
+    modified = func.coalesce(model.updated_at, model.created_at)
+    stmt = select(func.count(), func.max(model.id), func.max(modified)).where(*where)
+    count, max_id, last_modified = (await db.execute(stmt)).one()
+    return CollectionVersion(count, max_id, last_modified)
+
+
+JOB_SUMMARY_COLUMNS = (
+    JobModel.id,
+    JobModel.title,
+    func.substr(JobModel.description_text, 1, 150).label("description_preview"),
+    JobModel.location,
+    JobModel.is_remote,
+    JobModel.required_skills,
+    JobModel.created_at,
+)
+
+
 class AIService:
     """Handles all AI provider interactions with Google GenAI primary and OpenRouter fallback."""
 
     def __init__(self):
         self.google_client = None
         self.openrouter_client = None
+        # Caps in-flight provider calls so bulk callers queue instead of exhausting quota.
+        self.limiter = asyncio.Semaphore(settings.AI_MAX_CONCURRENCY)
 
         if settings.resolved_google_api_key:
             self.google_client = genai.Client(api_key=settings.resolved_google_api_key)
@@ -133,17 +484,23 @@ class AIService:
             return None
 
     async def _call_text(self, prompt: str, file_path: str | None = None) -> str | None:
+        if not self.google_client and not self.openrouter_client:
+            return None
+
         providers = [settings.AI_PRIMARY_PROVIDER, settings.AI_FALLBACK_PROVIDER]
-        for provider in providers:
-            if provider == "google":
-                text = await self._call_google(prompt, file_path=file_path)
-            elif provider == "openrouter":
-                text = await self._call_openrouter(prompt)
-            else:
-                text = None
+        queued_at = time.monotonic()
+        async with self.limiter:
+            load_shedder.record_provider_wait(time.monotonic() - queued_at)
+            for provider in providers:
+                if provider == "google":
+                    text = await self._call_google(prompt, file_path=file_path)
+                elif provider == "openrouter":
+                    text = await self._call_openrouter(prompt)
+                else:
+                    text = None
 
-            if text:
-                return text
+                if text:
+                    return text
 
         return None
 
@@ -507,53 +864,104 @@ class ResumeService:
         self, db: AsyncSession, user_id: int, resume_data: dict[str, Any]
     ) -> ResumeModel:
         parsed = resume_data["parsed_data"]
-        resume = ResumeModel(
-            user_id=user_id,
-            full_text=resume_data["full_text"],
-            parsed_sections=parsed,
-            skills=parsed.get("skills", []),
-            experience=parsed.get("experience", []),
-            education=parsed.get("education", []),
-            projects=parsed.get("projects", []),
-            certifications=parsed.get("certifications", []),
-            achievements=parsed.get("achievements", []),
-            file_path=resume_data["file_path"],
-            file_type=resume_data["file_type"],
-        )
-        db.add(resume)
-        await db.commit()
-        await db.refresh(resume)
-        return resume
+
+        # Built inside the operation so a replayed write never reuses a flushed id.
+        async def _insert(session: AsyncSession) -> ResumeModel:
+            resume = ResumeModel(
+                user_id=user_id,
+                full_text=resume_data["full_text"],
+                parsed_sections=parsed,
+                skills=parsed.get("skills", []),
+                experience=parsed.get("experience", []),
+                education=parsed.get("education", []),
+                projects=parsed.get("projects", []),
+                certifications=parsed.get("certifications", []),
+                achievements=parsed.get("achievements", []),
+                file_path=resume_data["file_path"],
+                file_type=resume_data["file_type"],
+            )
+            session.add(resume)
+            await session.flush()
+            return resume
+
+        return await write_coordinator.execute(db, _insert)
 
     async def get_resumes(
         self,
         db: AsyncSession,
         user_id: int,
         is_recruiter: bool,
-        skip: int = 0,
+        cursor: str | None = None,
         limit: int = 100,
     ) -> list[ResumeModel]:
-        if is_recruiter:
-            stmt = select(ResumeModel).offset(skip).limit(limit)
-        else:
-            stmt = (
-                select(ResumeModel).where(ResumeModel.user_id == user_id).offset(skip).limit(limit)
-            )
-        result = await db.execute(stmt)
+        stmt = select(ResumeModel).options(undefer(ResumeModel.full_text))
+        if not is_recruiter:
+            stmt = stmt.where(ResumeModel.user_id == user_id)
+        result = await db.execute(_keyset_page(stmt, ResumeModel, cursor, limit))
         return list(result.scalars().all())
 
-    async def get_resume(self, db: AsyncSession, resume_id: int) -> ResumeModel | None:
-        result = await db.execute(select(ResumeModel).where(ResumeModel.id == resume_id))
-        return result.scalars().first()
+    async def get_resumes_version(
+        self, db: AsyncSession, user_id: int, is_recruiter: bool
+    ) -> CollectionVersion:
+        where = [] if is_recruiter else [ResumeModel.user_id == user_id]
+        return await _collection_version(db, ResumeModel, *where)
 
-    async def delete_resume(self, db: AsyncSession, resume_id: int) -> bool:
-        resume = await self.get_resume(db, resume_id)
-        if not resume:
+    async def list_resume_summaries(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        is_recruiter: bool,
+        cursor: str | None = None,
+        limit: int = 100,
+    ) -> list[ResumeSummary]:
+        stmt = select(
+            ResumeModel.id,
+            _resume_name().label("name"),
+            _json_array_length(db, ResumeModel.skills).label("skills_count"),
+            _json_array_length(db, ResumeModel.experience).label("experience_count"),
+            ResumeModel.created_at,
+        )
+        if not is_recruiter:
+            stmt = stmt.where(ResumeModel.user_id == user_id)
+        result = await db.execute(_keyset_page(stmt, ResumeModel, cursor, limit))
+        return [ResumeSummary(**row._mapping) for row in result]
+
+    async def get_resume(self, db: AsyncSession, resume_id: int) -> ResumeModel | None:
+        return await entity_loaders(db).resumes.load(resume_id)
+
+    async def get_resumes_by_ids(
+        self, db: AsyncSession, resume_ids: Iterable[int]
+    ) -> dict[int, ResumeModel]:
+        return await _rows_by_id(db, ResumeModel, resume_ids)
+
+    async def delete_resume(
+        self, db: AsyncSession, resume_id: int, owner_id: int | None = None
+    ) -> bool:
+        """Delete a resume, restricted to ``owner_id``'s resumes when given.
+
+        Returns False when no matching resume exists; callers that need to tell a missing
+        resume from someone else's look it up only on that path.
+        """
+        match = [ResumeModel.id == resume_id]
+        if owner_id is not None:
+            match.append(ResumeModel.user_id == owner_id)
+        owned = select(ResumeModel.id).where(*match)
+        await db.execute(
+            delete(JobRecommendationModel).where(JobRecommendationModel.resume_id.in_(owned))
+        )
+        await db.execute(
+            delete(ResumeArtifactModel).where(ResumeArtifactModel.resume_id.in_(owned))
+        )
+        result = await db.execute(
+            delete(ResumeModel).where(*match).returning(ResumeModel.file_path)
+        )
+        deleted = result.first()
+        if deleted is None:
+            await db.rollback()
             return False
-        if resume.file_path and os.path.exists(resume.file_path):
-            os.remove(resume.file_path)
-        await db.execute(delete(ResumeModel).where(ResumeModel.id == resume_id))
         await db.commit()
+        if deleted.file_path and os.path.exists(deleted.file_path):
+            os.remove(deleted.file_path)
         return True
 
 
@@ -593,8 +1001,8 @@ class JobService:
             or {"skills": 0.6, "experience": 0.3, "education": 0.1},
         )
         db.add(job)
+        await self._apply_skill_demand(db, user_id, self._skill_sets(job), 1)
         await db.commit()
-        await db.refresh(job)
         return job
 
     async def get_jobs(
@@ -602,156 +1010,281 @@ class JobService:
         db: AsyncSession,
         user_id: int,
         is_recruiter: bool,
-        skip: int = 0,
+        cursor: str | None = None,
         limit: int = 100,
+        required_skills: Sequence[str] = (),
     ) -> list[JobModel]:
-        if is_recruiter:
-            stmt = select(JobModel).where(JobModel.company_id == user_id).offset(skip).limit(limit)
-        else:
-            stmt = select(JobModel).offset(skip).limit(limit)
-        result = await db.execute(stmt)
+        stmt = select(JobModel).options(undefer(JobModel.description_text))
+        stmt = stmt.where(*self._list_filter(db, user_id, is_recruiter, required_skills))
+        result = await db.execute(_keyset_page(stmt, JobModel, cursor, limit))
         return list(result.scalars().all())
 
+    async def get_jobs_version(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        is_recruiter: bool,
+        required_skills: Sequence[str] = (),
+    ) -> CollectionVersion:
+        where = self._list_filter(db, user_id, is_recruiter, required_skills)
+        return await _collection_version(db, JobModel, *where)
+
+    @staticmethod
+    def _list_filter(
+        db: AsyncSession, user_id: int, is_recruiter: bool, required_skills: Sequence[str]
+    ) -> list[Any]:
+        """Recruiters list their own postings; job seekers see all of them."""
+        where = [JobModel.company_id == user_id] if is_recruiter else []
+        where.extend(_has_skill(db, JobModel.required_skills, skill) for skill in required_skills)
+        return where
+
+    async def list_job_summaries(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        is_recruiter: bool,
+        cursor: str | None = None,
+        limit: int = 100,
+        required_skills: Sequence[str] = (),
+    ) -> list[JobSummary]:
+        stmt = select(*JOB_SUMMARY_COLUMNS).where(
+            *self._list_filter(db, user_id, is_recruiter, required_skills)
+        )
+        result = await db.execute(_keyset_page(stmt, JobModel, cursor, limit))
+        return [JobSummary(**row._mapping) for row in result]
+
     async def get_job(self, db: AsyncSession, job_id: int) -> JobModel | None:
-        result = await db.execute(select(JobModel).where(JobModel.id == job_id))
-        return result.scalars().first()
+        return await entity_loaders(db).jobs.load(job_id)
+
+    async def get_jobs_by_ids(
+        self, db: AsyncSession, job_ids: Iterable[int]
+    ) -> dict[int, JobModel]:
+        return await _rows_by_id(db, JobModel, job_ids)
 
     async def update_job(
         self, db: AsyncSession, job_id: int, job_data: dict[str, Any]
     ) -> JobModel | None:
-        job = await self.get_job(db, job_id)
+        # Callers have usually just loaded the job for their ownership check; ``get`` then
+        # answers from the identity map instead of selecting it again.
+        job = await db.get(JobModel, job_id, options=[undefer(JobModel.description_text)])
         if not job:
             return None
+        before = self._skill_sets(job)
         for key, value in job_data.items():
             setattr(job, key, value)
+        after = self._skill_sets(job)
+        for kind in before:
+            await self._apply_skill_demand(
+                db, job.company_id, {kind: before[kind] - after[kind]}, -1
+            )
+            await self._apply_skill_demand(
+                db, job.company_id, {kind: after[kind] - before[kind]}, 1
+            )
         await db.commit()
-        await db.refresh(job)
         return job
 
-    async def delete_job(self, db: AsyncSession, job_id: int) -> bool:
-        job = await self.get_job(db, job_id)
-        if not job:
-            return False
-        await db.execute(delete(JobModel).where(JobModel.id == job_id))
+    async def delete_job(
+        self, db: AsyncSession, job_id: int, company_id: int | None = None
+    ) -> list[int] | None:
+        """Delete a job, restricted to ``company_id``'s postings when given.
+
+        Returns None if there was no such job, else the resumes whose recommendation
+        lists held it.
+        """
+        match = [JobModel.id == job_id]
+        if company_id is not None:
+            match.append(JobModel.company_id == company_id)
+        listed = await db.scalars(
+            delete(JobRecommendationModel)
+            .where(JobRecommendationModel.job_id.in_(select(JobModel.id).where(*match)))
+            .returning(JobRecommendationModel.resume_id)
+        )
+        resume_ids = list(listed)
+        result = await db.execute(
+            delete(JobModel)
+            .where(*match)
+            .returning(JobModel.company_id, JobModel.required_skills, JobModel.preferred_skills)
+        )
+        deleted = result.first()
+        if deleted is None:
+            await db.rollback()
+            return None
+        await self._apply_skill_demand(db, deleted.company_id, self._skill_sets(deleted), -1)
         await db.commit()
-        return True
+        return resume_ids
 
-    async def get_recommendations(
-        self, resume_id: int, db: AsyncSession, current_user: UserModel, limit: int = 5
-    ) -> list[JobModel]:
-        resume = await resume_service.get_resume(db, resume_id)
-        if not resume:
-            return []
+    def _skill_sets(self, job: Any) -> dict[str, set[str]]:
+        return {
+            "required": set(filter(None, self.ai._extract_skill_names(job.required_skills))),
+            "preferred": set(filter(None, self.ai._extract_skill_names(job.preferred_skills))),
+        }
 
-        jobs = await self.get_jobs(db, current_user.id, current_user.is_recruiter, limit=100)
-        scored: list[tuple[JobModel, float]] = []
+    @staticmethod
+    def _skill_scopes(company_id: int) -> tuple[str, str]:
+        return "all", f"company:{company_id}"
 
-        for job in jobs:
-            score, _ = await self.ai.calculate_match_score(
-                resume.parsed_sections,
-                {
-                    "title": job.title,
-                    "required_skills": job.required_skills,
-                    "preferred_skills": job.preferred_skills,
-                    "responsibilities": job.responsibilities,
-                    "qualifications": job.qualifications,
-                },
+    async def _apply_skill_demand(
+        self,
+        db: AsyncSession,
+        company_id: int,
+        skills_by_kind: dict[str, set[str]],
+        delta: int,
+    ) -> None:
+        """Adjust skill-demand counters in the caller's transaction."""
+        rows = [
+            {"scope": scope, "kind": kind, "skill": skill, "count": delta}
+            for scope in self._skill_scopes(company_id)
+            for kind, skills in skills_by_kind.items()
+            for skill in skills
+        ]
+        if not rows:
+            return
+
+        if delta > 0:
+            stmt = _dialect_insert(db)(SkillDemandModel)
+            await db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["scope", "kind", "skill"],
+                    set_={"count": SkillDemandModel.count + stmt.excluded.count},
+                ),
+                rows,
+            )
+            return
+
+        for scope in self._skill_scopes(company_id):
+            for kind, skills in skills_by_kind.items():
+                if not skills:
+                    continue
+                match = (
+                    SkillDemandModel.scope == scope,
+                    SkillDemandModel.kind == kind,
+                    SkillDemandModel.skill.in_(skills),
+                )
+                await db.execute(
+                    update(SkillDemandModel)
+                    .where(*match)
+                    .values(count=SkillDemandModel.count + delta)
+                )
+                await db.execute(
+                    delete(SkillDemandModel).where(*match, SkillDemandModel.count <= 0)
+                )
+
+    def _skill_counts(self, db: AsyncSession, kind: str, *group_by: Any) -> Select:
+        """Jobs per normalized ``kind`` skill name, counted inside the database."""
+        entries, skill = _skill_entries(db, getattr(JobModel, f"{kind}_skills"))
+        return (
+            select(
+                *group_by, skill.label("skill"), func.count(JobModel.id.distinct()).label("count")
             )
-            scored.append((job, score))
+            .select_from(JobModel)
+            .join(entries, true())
+            .where(skill != "")
+            .group_by(*group_by, skill)
+        )
 
-        scored.sort(key=lambda x: x[1], reverse=True)
-        return [j for j, _ in scored[:limit]]
+    async def count_skills(
+        self, db: AsyncSession, kind: str, company_id: int | None = None, limit: int = 10
+    ) -> list[dict[str, Any]]:
+        """Top ``limit`` skills of ``kind`` computed from the jobs table, without rollups."""
+        stmt = self._skill_counts(db, kind)
+        if company_id is not None:
+            stmt = stmt.where(JobModel.company_id == company_id)
+        result = await db.execute(stmt.order_by(desc("count"), "skill").limit(limit))
+        return [{"name": row.skill, "count": row.count} for row in result]
+
+    async def rebuild_skill_demand(self, db: AsyncSession) -> None:
+        """Recompute all skill-demand counters from the jobs table."""
+        await db.execute(delete(SkillDemandModel))
+        company_scope = literal("company:") + cast(JobModel.company_id, String)
+        for kind in ("required", "preferred"):
+            for scope in (literal("all"), company_scope):
+                counts = self._skill_counts(db, kind, scope.label("scope")).subquery()
+                await db.execute(
+                    insert(SkillDemandModel).from_select(
+                        ["scope", "kind", "skill", "count"],
+                        select(counts.c.scope, literal(kind), counts.c.skill, counts.c.count),
+                    )
+                )
+        await db.commit()
+
+    async def ensure_skill_demand(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        """Backfill counters for databases that have jobs but no aggregates yet."""
+        async with session_factory() as db:
+            has_aggregates = await db.scalar(select(SkillDemandModel.scope).limit(1))
+            has_jobs = await db.scalar(select(JobModel.id).limit(1))
+            if has_jobs is not None and has_aggregates is None:
+                logger.info("Backfilling skill demand aggregates")
+                await self.rebuild_skill_demand(db)
 
     async def get_resume_improvement(
         self, resume_id: int, db: AsyncSession, current_user: UserModel
     ) -> dict[str, Any]:
+        stored = await self.stored_resume_improvement(db, resume_id)
+        if stored is not None:
+            return stored
+        improvement, _ = await self.suggest_resume_improvement(db, resume_id)
+        return improvement
+
+    async def stored_resume_improvement(
+        self, db: AsyncSession, resume_id: int
+    ) -> dict[str, Any] | None:
+        """The resume's AI improvement suggestions if a current artifact holds them."""
+        artifact = await resume_artifact_service.get(db, resume_id)
+        return artifact.improvement if artifact is not None else None
+
+    async def suggest_resume_improvement(
+        self, db: AsyncSession, resume_id: int
+    ) -> tuple[dict[str, Any], bool]:
+        """Ask the AI provider for improvement suggestions and store them.
+
+        Returns the suggestions and whether the provider gave them; when it did not, they
+        are the heuristic fallback, which is not stored.
+        """
         resume = await resume_service.get_resume(db, resume_id)
         if not resume:
-            return {}
-
-        prompt = _load_prompt("improve_resume").replace("{resume_text}", resume.full_text or "")
-        response = await self.ai.call_gemini(prompt)
-        if isinstance(response, dict) and "error" not in response:
-            return response
-
-        return {
-            "format": ["Use consistent section headings and spacing."],
-            "bullet_points": ["Begin bullets with impact verbs and include quantifiable outcomes."],
-            "keywords": ["Collaboration", "Problem Solving", "Delivery"],
-            "skills": [
-                skill.get("name") for skill in (resume.skills or [])[:5] if isinstance(skill, dict)
-            ],
-        }
+            return {}, False
+        improvement = await resume_artifact_service.suggest_improvements(resume)
+        if improvement is None:
+            return _fallback_improvement(resume), False
+        # Keep the answer so later views, and backfill, do not ask the provider again.
+        await resume_artifact_service.store(db, [resume], [improvement])
+        return improvement, True
 
     async def get_resume_quality_score(
         self, resume_id: int, db: AsyncSession, current_user: UserModel
     ) -> dict[str, Any]:
+        artifact = await resume_artifact_service.get(db, resume_id)
+        if artifact is not None:
+            return artifact.quality_score
+
         resume = await resume_service.get_resume(db, resume_id)
         if not resume:
             return {}
-
-        has_quantifiable = False
-        experience_score = 0
-        for exp in resume.experience or []:
-            achievements = exp.get("achievements", []) if isinstance(exp, dict) else []
-            for achievement in achievements:
-                if re.search(
-                    r"\d+%|\d+x|\$\d+|increased|decreased|improved|reduced|saved|generated",
-                    str(achievement),
-                    re.IGNORECASE,
-                ):
-                    has_quantifiable = True
-                    experience_score += 10
-
-        skills_score = min(100, len(resume.skills or []) * 7)
-        education_score = min(100, len(resume.education or []) * 30)
-        overall = round(
-            (min(100, experience_score) * 0.5) + (skills_score * 0.3) + (education_score * 0.2),
-            2,
-        )
-
-        suggestions: list[str] = []
-        if not has_quantifiable:
-            suggestions.append("Add measurable outcomes in experience bullets.")
-        if skills_score < 60:
-            suggestions.append("Expand skills with proficiency and role context.")
-        if education_score < 60:
-            suggestions.append("Add education details such as field and achievements.")
-
-        return {
-            "overall_score": overall,
-            "sections": {
-                "experience": min(100, experience_score),
-                "skills": skills_score,
-                "education": education_score,
-            },
-            "suggestions": suggestions,
-        }
+        return _quality_score(resume)
 
     async def get_market_analysis(
         self, db: AsyncSession, current_user: UserModel
     ) -> dict[str, Any]:
-        jobs = await self.get_jobs(db, current_user.id, current_user.is_recruiter, limit=1000)
-
-        required_counter: Counter[str] = Counter()
-        preferred_counter: Counter[str] = Counter()
-
-        for job in jobs:
-            for skill in job.required_skills or []:
-                if isinstance(skill, dict) and skill.get("name"):
-                    required_counter[str(skill["name"]).lower()] += 1
-            for skill in job.preferred_skills or []:
-                if isinstance(skill, dict) and skill.get("name"):
-                    preferred_counter[str(skill["name"]).lower()] += 1
+        jobs_count = select(func.count()).select_from(JobModel)
+        if current_user.is_recruiter:
+            scope = f"company:{current_user.id}"
+            jobs_count = jobs_count.where(JobModel.company_id == current_user.id)
+        else:
+            scope = "all"
+
+        async def _top_skills(kind: str) -> list[dict[str, Any]]:
+            result = await db.execute(
+                select(SkillDemandModel.skill, SkillDemandModel.count)
+                .where(SkillDemandModel.scope == scope, SkillDemandModel.kind == kind)
+                .order_by(SkillDemandModel.count.desc(), SkillDemandModel.skill)
+                .limit(10)
+            )
+            return [{"name": row.skill, "count": row.count} for row in result]
 
         return {
-            "total_jobs_analyzed": len(jobs),
-            "top_required_skills": [
-                {"name": name, "count": count} for name, count in required_counter.most_common(10)
-            ],
-            "top_preferred_skills": [
-                {"name": name, "count": count} for name, count in preferred_counter.most_common(10)
-            ],
+            "total_jobs_analyzed": await db.scalar(jobs_count) or 0,
+            "top_required_skills": await _top_skills("required"),
+            "top_preferred_skills": await _top_skills("preferred"),
             "analysis_date": datetime.now(UTC).isoformat(),
         }
 
@@ -767,7 +1300,11 @@ class JobService:
         if not job:
             return {}
 
-        resume_skills = set(self.ai._extract_skill_names(resume.skills or []))
+        artifact = await resume_artifact_service.get(db, resume_id)
+        if artifact is not None:
+            resume_skills = set(artifact.skill_names)
+        else:
+            resume_skills = set(filter(None, self.ai._extract_skill_names(resume.skills)))
         required_skills_raw = job.required_skills or []
         preferred_skills_raw = job.preferred_skills or []
         required_skills = set(self.ai._extract_skill_names(required_skills_raw))
@@ -869,6 +1406,16 @@ class MatchingService:
     def __init__(self, ai: AIService):
         self.ai = ai
 
+    @staticmethod
+    def job_match_data(job: JobModel) -> dict[str, Any]:
+        return {
+            "title": job.title,
+            "required_skills": job.required_skills,
+            "preferred_skills": job.preferred_skills,
+            "responsibilities": job.responsibilities,
+            "qualifications": job.qualifications,
+        }
+
     async def match_resume_to_job(
         self, resume_data: dict[str, Any], job_data: dict[str, Any]
     ) -> tuple[float, dict[str, Any], dict[str, Any]]:
@@ -876,30 +1423,158 @@ class MatchingService:
         feedback = await self.ai.generate_resume_feedback(resume_data, job_data, match_details)
         return score, match_details, feedback
 
+    async def apply(
+        self,
+        db: AsyncSession,
+        application_data: dict[str, Any],
+        resume: ResumeModel,
+        job: JobModel,
+    ) -> ApplicationModel:
+        """Create a scored application.
+
+        With ``DEFER_APPLICATION_SCORING`` the row is stored at once with the heuristic
+        score and ``scoring_status="pending"``; the caller schedules ``score_application``.
+        """
+        job_data = self.job_match_data(job)
+        if settings.DEFER_APPLICATION_SCORING:
+            score, match_details = self.ai._heuristic_match_score(
+                resume.parsed_sections or {}, job_data
+            )
+            return await self.create_application(
+                db, application_data, score, match_details, None, scoring_status="pending"
+            )
+
+        score, match_details, feedback = await self.match_resume_to_job(
+            resume.parsed_sections, job_data
+        )
+        return await self.create_application(db, application_data, score, match_details, feedback)
+
+    async def score_application(
+        self, session_factory: async_sessionmaker[AsyncSession], application_id: int
+    ) -> None:
+        """Replace a provisional score with the provider score and feedback.
+
+        The worker first claims the application, so when several workers (or the startup
+        sweep and the task scheduled by ``apply``) reach the same row only one scores it.
+        """
+        claimed_at = datetime.now(UTC)
+        try:
+            async with session_factory() as db:
+                if not await self._claim(db, application_id, claimed_at):
+                    return
+                application_data = await self.get_application(db, application_id)
+        except Exception:
+            logger.exception("Failed to load application %s for scoring", application_id)
+            return
+        if not application_data:
+            return
+        _, job, resume = application_data
+
+        # Provider calls run outside any session so no connection is held while waiting.
+        try:
+            score, match_details, feedback = await self.match_resume_to_job(
+                resume.parsed_sections, self.job_match_data(job)
+            )
+            values: dict[str, Any] = {
+                "match_score": score,
+                "match_details": match_details,
+                "feedback": feedback,
+                "scoring_status": "scored",
+            }
+        except Exception:
+            logger.exception("Deferred scoring failed for application %s", application_id)
+            values = {"scoring_status": "failed"}
+
+        async with session_factory() as db:
+            await db.execute(
+                update(ApplicationModel)
+                .where(
+                    ApplicationModel.id == application_id,
+                    ApplicationModel.scoring_status == "pending",
+                    # Lost if the claim expired and another worker took the row over.
+                    ApplicationModel.scoring_claimed_at == claimed_at,
+                )
+                .values(**values)
+            )
+            await db.commit()
+
+    @staticmethod
+    async def _claim(db: AsyncSession, application_id: int, claimed_at: datetime) -> bool:
+        """Atomically claim a pending application that no live worker is scoring."""
+        expired = claimed_at - timedelta(seconds=settings.SCORING_CLAIM_TIMEOUT_SECONDS)
+        result = await db.execute(
+            update(ApplicationModel)
+            .where(
+                ApplicationModel.id == application_id,
+                ApplicationModel.scoring_status == "pending",
+                or_(
+                    ApplicationModel.scoring_claimed_at.is_(None),
+                    ApplicationModel.scoring_claimed_at < expired,
+                ),
+            )
+            # A claim is bookkeeping, not a change clients see, so updated_at stays put.
+            .values(scoring_claimed_at=claimed_at, updated_at=ApplicationModel.updated_at)
+        )
+        await db.commit()
+        return result.rowcount == 1
+
+    async def score_pending(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        """Score applications left pending, e.g. by a worker that stopped before scoring.
+
+        Every worker runs this at startup; ``score_application`` claims each row, so workers
+        share the backlog rather than each scoring all of it.
+        """
+        expired = datetime.now(UTC) - timedelta(seconds=settings.SCORING_CLAIM_TIMEOUT_SECONDS)
+        try:
+            async with session_factory() as db:
+                result = await db.scalars(
+                    select(ApplicationModel.id)
+                    .where(
+                        ApplicationModel.scoring_status == "pending",
+                        or_(
+                            ApplicationModel.scoring_claimed_at.is_(None),
+                            ApplicationModel.scoring_claimed_at < expired,
+                        ),
+                    )
+                    .order_by(ApplicationModel.id)
+                )
+                application_ids = list(result)
+        except Exception:
+            logger.exception("Failed to list applications pending scoring")
+            return
+        if application_ids:
+            logger.info("Scoring %s pending applications", len(application_ids))
+        for application_id in application_ids:
+            await self.score_application(session_factory, application_id)
+
     async def create_application(
         self,
         db: AsyncSession,
         application_data: dict[str, Any],
         match_score: float,
         match_details: dict[str, Any],
-        feedback: dict[str, Any],
+        feedback: dict[str, Any] | None,
+        scoring_status: str = "scored",
     ) -> ApplicationModel:
-        application = ApplicationModel(
-            job_id=application_data["job_id"],
-            resume_id=application_data["resume_id"],
-            full_name=application_data["full_name"],
-            email=application_data["email"],
-            phone=application_data.get("phone"),
-            cover_letter=application_data.get("cover_letter"),
-            match_score=match_score,
-            match_details=match_details,
-            feedback=feedback,
-            status="New",
-        )
-        db.add(application)
-        await db.commit()
-        await db.refresh(application)
-        return application
+        async def _insert(session: AsyncSession) -> ApplicationModel:
+            application = ApplicationModel(
+                job_id=application_data["job_id"],
+                resume_id=application_data["resume_id"],
+                full_name=application_data["full_name"],
+                email=application_data["email"],
+                phone=application_data.get("phone"),
+                cover_letter=application_data.get("cover_letter"),
+                match_score=match_score,
+                match_details=match_details,
+                feedback=feedback,
+                status="New",
+                scoring_status=scoring_status,
+            )
+            session.add(application)
+            await session.flush()
+            return application
+
+        return await write_coordinator.execute(db, _insert)
 
     async def get_applications(
         self,
@@ -908,58 +1583,725 @@ class MatchingService:
         is_recruiter: bool,
         job_id: int | None = None,
         status: str | None = None,
-        skip: int = 0,
+        cursor: str | None = None,
         limit: int = 100,
     ) -> list[ApplicationModel]:
-        query = select(ApplicationModel)
+        query = select(ApplicationModel).where(
+            *self._list_filter(user_id, is_recruiter, job_id, status)
+        )
+        result = await db.execute(_keyset_page(query, ApplicationModel, cursor, limit))
+        return list(result.scalars().all())
+
+    async def get_applications_version(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        is_recruiter: bool,
+        job_id: int | None = None,
+        status: str | None = None,
+    ) -> CollectionVersion:
+        where = self._list_filter(user_id, is_recruiter, job_id, status)
+        return await _collection_version(db, ApplicationModel, *where)
 
+    @staticmethod
+    def _list_filter(
+        user_id: int, is_recruiter: bool, job_id: int | None, status: str | None
+    ) -> list[Any]:
+        """Recruiters see applications to their jobs; job seekers those from their resumes."""
+        where = []
         if job_id:
-            query = query.where(ApplicationModel.job_id == job_id)
+            where.append(ApplicationModel.job_id == job_id)
         if status:
-            query = query.where(ApplicationModel.status == status)
-
+            where.append(ApplicationModel.status == status)
         if is_recruiter:
             recruiter_jobs = select(JobModel.id).where(JobModel.company_id == user_id)
-            query = query.where(ApplicationModel.job_id.in_(recruiter_jobs.scalar_subquery()))
+            where.append(ApplicationModel.job_id.in_(recruiter_jobs.scalar_subquery()))
         else:
             user_resumes = select(ResumeModel.id).where(ResumeModel.user_id == user_id)
-            query = query.where(ApplicationModel.resume_id.in_(user_resumes.scalar_subquery()))
+            where.append(ApplicationModel.resume_id.in_(user_resumes.scalar_subquery()))
+        return where
 
-        result = await db.execute(query.offset(skip).limit(limit))
-        return list(result.scalars().all())
+    async def list_application_summaries(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        is_recruiter: bool,
+        job_id: int | None = None,
+        status: str | None = None,
+        cursor: str | None = None,
+        limit: int = 100,
+    ) -> list[ApplicationSummary]:
+        query = (
+            select(
+                ApplicationModel.id,
+                ApplicationModel.job_id,
+                ApplicationModel.resume_id,
+                ApplicationModel.full_name,
+                ApplicationModel.match_score,
+                ApplicationModel.status,
+                ApplicationModel.scoring_status,
+                ApplicationModel.created_at,
+                JobModel.title.label("job_title"),
+                _resume_name().label("resume_name"),
+            )
+            .join(JobModel, ApplicationModel.job_id == JobModel.id)
+            .join(ResumeModel, ApplicationModel.resume_id == ResumeModel.id)
+        )
+        if job_id:
+            query = query.where(ApplicationModel.job_id == job_id)
+        if status:
+            query = query.where(ApplicationModel.status == status)
+        if is_recruiter:
+            query = query.where(JobModel.company_id == user_id)
+        else:
+            query = query.where(ResumeModel.user_id == user_id)
+
+        result = await db.execute(_keyset_page(query, ApplicationModel, cursor, limit))
+        return [ApplicationSummary(**row._mapping) for row in result]
 
     async def get_application(
         self, db: AsyncSession, application_id: int
     ) -> tuple[ApplicationModel, JobModel, ResumeModel] | None:
         query = (
             select(ApplicationModel, JobModel, ResumeModel)
-            .join(JobModel, ApplicationModel.job_id == JobModel.id)
-            .join(ResumeModel, ApplicationModel.resume_id == ResumeModel.id)
+            .join(ApplicationModel.job)
+            .join(ApplicationModel.resume)
+            .options(
+                contains_eager(ApplicationModel.job).undefer(JobModel.description_text),
+                contains_eager(ApplicationModel.resume).undefer(ResumeModel.full_text),
+            )
             .where(ApplicationModel.id == application_id)
         )
         result = await db.execute(query)
         row = result.first()
-        if row:
-            return row[0], row[1], row[2]
-        return None
+        if not row:
+            return None
+        application, job, resume = row
+        loaders = entity_loaders(db)
+        loaders.jobs.prime(job.id, job)
+        loaders.resumes.prime(resume.id, resume)
+        return application, job, resume
 
     async def update_application_status(
-        self, db: AsyncSession, application_id: int, status: str
+        self, db: AsyncSession, application_id: int, status: str, company_id: int | None = None
     ) -> ApplicationModel | None:
-        application = await db.get(ApplicationModel, application_id)
-        if not application:
-            return None
-        application.status = status
+        """Set an application's status in one UPDATE … RETURNING.
+
+        With ``company_id`` only applications to that company's jobs match. Returns None
+        when nothing matched.
+        """
+        values: dict[str, Any] = {"status": status}
         if status != "New":
-            application.reviewed_at = datetime.now(UTC)
+            values["reviewed_at"] = datetime.now(UTC)
+        stmt = (
+            update(ApplicationModel)
+            .where(ApplicationModel.id == application_id)
+            .values(**values)
+            .returning(ApplicationModel)
+        )
+        if company_id is not None:
+            company_jobs = select(JobModel.id).where(JobModel.company_id == company_id)
+            stmt = stmt.where(ApplicationModel.job_id.in_(company_jobs))
+
+        async def _update(session: AsyncSession) -> ApplicationModel | None:
+            result = await session.scalars(stmt, execution_options={"populate_existing": True})
+            return result.first()
+
+        return await write_coordinator.execute(db, _update)
+
+
+class RecommendationService:
+    """Materialized top-K job recommendations per resume.
+
+    Lists are kept in ``job_recommendations`` and maintained incrementally: a job write
+    only rescores that job against existing resumes, a resume write only ranks the jobs
+    for that resume, and a job delete only re-ranks the lists that held it. Scoring uses
+    the deterministic heuristic matcher so that background maintenance never spends
+    provider quota. Recruiters are shown their own postings, ranked on demand.
+    """
+
+    BATCH_SIZE = 500
+
+    def __init__(self, ai: AIService):
+        self.ai = ai
+
+    def _score(self, resume: Any, job: Any) -> float:
+        score, _ = self.ai._heuristic_match_score(
+            {
+                "skills": resume.skills,
+                "experience": resume.experience,
+                "education": resume.education,
+            },
+            {
+                "required_skills": job.required_skills,
+                "preferred_skills": job.preferred_skills,
+            },
+        )
+        return score
+
+    @staticmethod
+    def _resume_columns() -> Any:
+        return select(
+            ResumeModel.id, ResumeModel.skills, ResumeModel.experience, ResumeModel.education
+        )
+
+    @staticmethod
+    def _job_columns() -> Any:
+        return select(JobModel.id, JobModel.required_skills, JobModel.preferred_skills)
+
+    async def get_recommendations(
+        self, db: AsyncSession, resume_id: int, limit: int = 5, company_id: int | None = None
+    ) -> list[JobModel]:
+        """The resume's best jobs, only among ``company_id``'s postings when given."""
+        if company_id is not None:
+            return await self._rank_company_jobs(db, resume_id, company_id, limit)
+        stmt = (
+            select(JobModel)
+            .options(undefer(JobModel.description_text))
+            .join(JobRecommendationModel, JobRecommendationModel.job_id == JobModel.id)
+            .where(JobRecommendationModel.resume_id == resume_id)
+            .order_by(JobRecommendationModel.score.desc(), JobRecommendationModel.job_id.desc())
+            .limit(limit)
+        )
+        result = await db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def _rank_company_jobs(
+        self, db: AsyncSession, resume_id: int, company_id: int, limit: int
+    ) -> list[JobModel]:
+        # The materialized lists rank every job, so one company's best are scored here.
+        resume = (
+            await db.execute(self._resume_columns().where(ResumeModel.id == resume_id))
+        ).first()
+        if resume is None:
+            return []
+        postings = await db.execute(self._job_columns().where(JobModel.company_id == company_id))
+        best = heapq.nlargest(limit, ((self._score(resume, job), job.id) for job in postings))
+        if not best:
+            return []
+        result = await db.execute(
+            select(JobModel)
+            .options(undefer(JobModel.description_text))
+            .where(JobModel.id.in_([job_id for _, job_id in best]))
+        )
+        jobs = {job.id: job for job in result.scalars()}
+        return [jobs[job_id] for _, job_id in best if job_id in jobs]
+
+    async def get_recommendation_summaries(
+        self, db: AsyncSession, resume_id: int, limit: int = 5
+    ) -> list[JobSummary]:
+        stmt = (
+            select(*JOB_SUMMARY_COLUMNS)
+            .join(JobRecommendationModel, JobRecommendationModel.job_id == JobModel.id)
+            .where(JobRecommendationModel.resume_id == resume_id)
+            .order_by(JobRecommendationModel.score.desc(), JobRecommendationModel.job_id.desc())
+            .limit(limit)
+        )
+        result = await db.execute(stmt)
+        return [JobSummary(**row._mapping) for row in result]
+
+    async def refresh_job(
+        self, session_factory: async_sessionmaker[AsyncSession], job_id: int
+    ) -> None:
+        """Fold a created or updated job into every resume's list."""
+        try:
+            async with session_factory() as db:
+                job = (await db.execute(self._job_columns().where(JobModel.id == job_id))).first()
+                if job is None:
+                    return
+                await self._refresh_job(db, job)
+        except Exception:
+            logger.exception("Failed to refresh recommendations for job %s", job_id)
+
+    async def _list_stats(
+        self, db: AsyncSession, resume_ids: list[int]
+    ) -> dict[int, tuple[int, float]]:
+        """Size and lowest score of each resume's list, read from the (resume, score) index."""
+        result = await db.execute(
+            select(
+                JobRecommendationModel.resume_id,
+                func.count().label("size"),
+                func.min(JobRecommendationModel.score).label("floor"),
+            )
+            .where(JobRecommendationModel.resume_id.in_(resume_ids))
+            .group_by(JobRecommendationModel.resume_id)
+        )
+        return {row.resume_id: (row.size, row.floor) for row in result}
+
+    async def _refresh_job(self, db: AsyncSession, job: Any) -> None:
+        top_k = settings.RECOMMENDATIONS_TOP_K
+        previous_rows = await db.execute(
+            select(JobRecommendationModel.resume_id, JobRecommendationModel.score).where(
+                JobRecommendationModel.job_id == job.id
+            )
+        )
+        previous = {row.resume_id: row.score for row in previous_rows}
+
+        entries: list[dict[str, Any]] = []
+        stale: list[int] = []
+        last_id = 0
+        while True:
+            # Keyset pages rather than a cursor, so each page's list lookup can run between.
+            partition = (
+                await db.execute(
+                    self._resume_columns()
+                    .where(ResumeModel.id > last_id)
+                    .order_by(ResumeModel.id)
+                    .limit(self.BATCH_SIZE)
+                )
+            ).all()
+            if not partition:
+                break
+            last_id = partition[-1].id
+            stats = await self._list_stats(db, [resume.id for resume in partition])
+            for resume in partition:
+                score = self._score(resume, job)
+                size, floor = stats.get(resume.id, (0, 0.0))
+                old_score = previous.get(resume.id)
+                if old_score is not None:
+                    if score < old_score and size >= top_k:
+                        # Jobs pruned earlier may now outrank this one.
+                        stale.append(resume.id)
+                    else:
+                        entries.append({"resume_id": resume.id, "job_id": job.id, "score": score})
+                elif size < top_k or score > floor:
+                    entries.append({"resume_id": resume.id, "job_id": job.id, "score": score})
+
+        await db.execute(
+            delete(JobRecommendationModel).where(JobRecommendationModel.job_id == job.id)
+        )
+        for start in range(0, len(entries), self.BATCH_SIZE):
+            await db.execute(
+                insert(JobRecommendationModel), entries[start : start + self.BATCH_SIZE]
+            )
+        # The list stats were read before these inserts, and other jobs' writers may have
+        # filled the same lists since, so every list that gained an entry is cut back to K.
+        await self._prune(db, [entry["resume_id"] for entry in entries], top_k)
+        await db.commit()
+
+        if stale:
+            await self._rebuild(db, stale)
+
+    async def _prune(self, db: AsyncSession, resume_ids: list[int], top_k: int) -> None:
+        for start in range(0, len(resume_ids), self.BATCH_SIZE):
+            chunk = resume_ids[start : start + self.BATCH_SIZE]
+            ranked = (
+                select(
+                    JobRecommendationModel.resume_id,
+                    JobRecommendationModel.job_id,
+                    func.row_number()
+                    .over(
+                        partition_by=JobRecommendationModel.resume_id,
+                        order_by=(
+                            JobRecommendationModel.score.desc(),
+                            JobRecommendationModel.job_id.desc(),
+                        ),
+                    )
+                    .label("rank"),
+                )
+                .where(JobRecommendationModel.resume_id.in_(chunk))
+                .subquery()
+            )
+            overflow = select(ranked.c.resume_id, ranked.c.job_id).where(ranked.c.rank > top_k)
+            await db.execute(
+                delete(JobRecommendationModel).where(
+                    tuple_(JobRecommendationModel.resume_id, JobRecommendationModel.job_id).in_(
+                        overflow
+                    )
+                )
+            )
+
+    async def rebuild_resume(
+        self, session_factory: async_sessionmaker[AsyncSession], resume_id: int
+    ) -> None:
+        """Rank every job for a newly created or re-parsed resume."""
+        try:
+            async with session_factory() as db:
+                await self._rebuild(db, [resume_id])
+        except Exception:
+            logger.exception("Failed to rebuild recommendations for resume %s", resume_id)
+
+    async def rebuild_resumes(
+        self, session_factory: async_sessionmaker[AsyncSession], resume_ids: list[int]
+    ) -> None:
+        """Re-rank the lists of ``resume_ids``, e.g. those that held a deleted job."""
+        try:
+            async with session_factory() as db:
+                for start in range(0, len(resume_ids), self.BATCH_SIZE):
+                    await self._rebuild(db, resume_ids[start : start + self.BATCH_SIZE])
+        except Exception:
+            logger.exception("Failed to rebuild recommendations for %s resumes", len(resume_ids))
+
+    async def refill(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        """Rebuild lists left short of top-K, e.g. by a worker that stopped mid-update."""
+        try:
+            async with session_factory() as db:
+                job_count = await db.scalar(select(func.count()).select_from(JobModel))
+                target = min(settings.RECOMMENDATIONS_TOP_K, job_count or 0)
+                if not target:
+                    return
+                underfull = await db.execute(
+                    select(ResumeModel.id)
+                    .outerjoin(
+                        JobRecommendationModel,
+                        JobRecommendationModel.resume_id == ResumeModel.id,
+                    )
+                    .group_by(ResumeModel.id)
+                    .having(func.count(JobRecommendationModel.job_id) < target)
+                )
+                resume_ids = list(underfull.scalars().all())
+                for start in range(0, len(resume_ids), self.BATCH_SIZE):
+                    await self._rebuild(db, resume_ids[start : start + self.BATCH_SIZE])
+        except Exception:
+            logger.exception("Failed to refill recommendation lists")
+
+    async def _rebuild(self, db: AsyncSession, resume_ids: list[int]) -> None:
+        top_k = settings.RECOMMENDATIONS_TOP_K
+        resumes = (
+            await db.execute(self._resume_columns().where(ResumeModel.id.in_(resume_ids)))
+        ).all()
+        if not resumes:
+            return
+
+        ranked: dict[int, list[tuple[float, int]]] = {resume.id: [] for resume in resumes}
+        stream = await db.stream(self._job_columns())
+        async for partition in stream.partitions(self.BATCH_SIZE):
+            for job in partition:
+                for resume in resumes:
+                    candidates = ranked[resume.id]
+                    entry = (self._score(resume, job), job.id)
+                    if len(candidates) < top_k:
+                        heapq.heappush(candidates, entry)
+                    else:
+                        heapq.heappushpop(candidates, entry)
+
+        await db.execute(
+            delete(JobRecommendationModel).where(JobRecommendationModel.resume_id.in_(list(ranked)))
+        )
+        entries = [
+            {"resume_id": resume_id, "job_id": job_id, "score": score}
+            for resume_id, candidates in ranked.items()
+            for score, job_id in candidates
+        ]
+        if entries:
+            await db.execute(insert(JobRecommendationModel), entries)
         await db.commit()
-        await db.refresh(application)
-        return application
+
+
+class ResumeArtifactService:
+    """Quality score, improvement suggestions, skill ids and years of experience per resume.
+
+    Computed in the background after a resume is ingested and stored in
+    ``resume_artifacts``. Rows from an older ``VERSION`` or improvement prompt are stale:
+    ``get`` ignores them and ``backfill`` recomputes them. The prompt is read once, when
+    the service is created, so editing it takes a restart.
+    """
+
+    VERSION = 2
+    BATCH_SIZE = 50
+
+    def __init__(self, ai: AIService):
+        self.ai = ai
+        self.prompt = _load_prompt("improve_resume")
+        self.prompt_hash = hashlib.sha256(self.prompt.encode("utf-8")).hexdigest()[:16]
+
+    def _stale(self) -> Any:
+        return or_(
+            ResumeArtifactModel.resume_id.is_(None),
+            ResumeArtifactModel.version != self.VERSION,
+            ResumeArtifactModel.prompt_hash != self.prompt_hash,
+            ResumeArtifactModel.improvement.is_(None),
+        )
+
+    async def get(self, db: AsyncSession, resume_id: int) -> ResumeArtifactModel | None:
+        """The resume's artifacts if they are current, else None."""
+        artifact = await db.get(ResumeArtifactModel, resume_id)
+        if (
+            artifact is None
+            or artifact.version != self.VERSION
+            or artifact.prompt_hash != self.prompt_hash
+        ):
+            return None
+        return artifact
+
+    async def suggest_improvements(self, resume: ResumeModel) -> dict[str, Any] | None:
+        """AI improvement suggestions, or None when no provider gave a usable answer."""
+        prompt = self.prompt.replace("{resume_text}", resume.full_text or "")
+        response = await self.ai.call_gemini(prompt)
+        if isinstance(response, dict) and "error" not in response:
+            return response
+        return None
+
+    async def refresh(
+        self, session_factory: async_sessionmaker[AsyncSession], resume_id: int
+    ) -> None:
+        """Compute the artifacts of a newly created resume."""
+        try:
+            async with session_factory() as db:
+                await self._compute(db, [resume_id])
+        except Exception:
+            logger.exception("Failed to compute artifacts for resume %s", resume_id)
+
+    async def backfill(self, session_factory: async_sessionmaker[AsyncSession]) -> int:
+        """Recompute missing and stale artifacts; returns how many resumes were processed."""
+        processed = 0
+        async with session_factory() as db:
+            result = await db.execute(
+                select(ResumeModel.id)
+                .outerjoin(ResumeArtifactModel, ResumeArtifactModel.resume_id == ResumeModel.id)
+                .where(self._stale())
+                .order_by(ResumeModel.id)
+            )
+            resume_ids = list(result.scalars())
+            for start in range(0, len(resume_ids), self.BATCH_SIZE):
+                chunk = resume_ids[start : start + self.BATCH_SIZE]
+                await self._compute(db, chunk)
+                processed += len(chunk)
+                logger.info("Computed artifacts for %s/%s resumes", processed, len(resume_ids))
+        return processed
+
+    async def _compute(self, db: AsyncSession, resume_ids: list[int]) -> None:
+        result = await db.execute(
+            select(ResumeModel)
+            .where(ResumeModel.id.in_(resume_ids))
+            .options(undefer(ResumeModel.full_text))
+        )
+        resumes = list(result.scalars())
+        if not resumes:
+            return
+        # Provider calls run concurrently; AIService's limiter caps how many are in flight.
+        improvements = await asyncio.gather(
+            *(self.suggest_improvements(resume) for resume in resumes)
+        )
+        await self.store(db, resumes, improvements)
+
+    async def store(
+        self,
+        db: AsyncSession,
+        resumes: Sequence[ResumeModel],
+        improvements: Sequence[dict[str, Any] | None],
+    ) -> None:
+        """Upsert the artifacts of ``resumes`` given their already computed improvements."""
+        skill_names = [
+            sorted(set(filter(None, self.ai._extract_skill_names(resume.skills))))
+            for resume in resumes
+        ]
+        skill_ids = await self._skill_ids(db, {name for names in skill_names for name in names})
+        rows = [
+            {
+                "resume_id": resume.id,
+                "version": self.VERSION,
+                "prompt_hash": self.prompt_hash,
+                "quality_score": _quality_score(resume),
+                "improvement": improvement,
+                "skill_names": names,
+                "skill_ids": sorted(skill_ids[name] for name in names),
+                "years_experience": _years_of_experience(resume.experience),
+                "computed_at": datetime.now(UTC),
+            }
+            for resume, improvement, names in zip(resumes, improvements, skill_names, strict=True)
+        ]
+        stmt = _dialect_insert(db)(ResumeArtifactModel).values(rows)
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[ResumeArtifactModel.resume_id],
+                set_={column: stmt.excluded[column] for column in rows[0] if column != "resume_id"},
+            )
+        )
+        await db.commit()
+
+    @staticmethod
+    async def _skill_ids(db: AsyncSession, names: set[str]) -> dict[str, int]:
+        """Vocabulary ids of ``names``, adding the ones it does not have yet."""
+        if not names:
+            return {}
+        # Sorted so concurrent writers take the unique-index locks in the same order.
+        ordered = sorted(names)
+        stmt = _dialect_insert(db)(SkillModel).on_conflict_do_nothing(
+            index_elements=[SkillModel.name]
+        )
+        await db.execute(stmt, [{"name": name} for name in ordered])
+        result = await db.execute(
+            select(SkillModel.name, SkillModel.id).where(SkillModel.name.in_(ordered))
+        )
+        return dict(result.tuples().all())
+
+
+class TrendService:
+    """Daily and weekly skill-demand rollups bucketed by job ``created_at``.
+
+    ``roll_up`` folds jobs past the stored id watermark into ``skill_trends`` in id order,
+    stopping at the first one created less than ``TREND_ROLLUP_LAG_SECONDS`` ago so rows
+    from transactions still in flight are not skipped. Buckets keep the skills a job listed when it was
+    rolled up; later edits and deletions do not rewrite history.
+    """
+
+    STATE_NAME = "skill_trends"
+    BATCH_SIZE = 500
+    GRAINS = ("day", "week")
+    KEY_COLUMNS = ("grain", "bucket", "kind", "skill", "location", "is_remote", "experience_level")
+
+    def __init__(self, ai: AIService):
+        self.ai = ai
+
+    @staticmethod
+    def _bucket(grain: str, day: date) -> date:
+        return day if grain == "day" else day - timedelta(days=day.weekday())
+
+    async def roll_up(
+        self, session_factory: async_sessionmaker[AsyncSession], until: datetime | None = None
+    ) -> int:
+        """Fold newly created jobs into the rollups and return how many were processed."""
+        if until is None:
+            until = datetime.now(UTC) - timedelta(seconds=settings.TREND_ROLLUP_LAG_SECONDS)
+        processed = 0
+        async with session_factory() as db:
+            while True:
+                state = await self._lock_state(db)
+                stmt = (
+                    select(
+                        JobModel.id,
+                        JobModel.created_at,
+                        JobModel.location,
+                        JobModel.is_remote,
+                        JobModel.experience_level,
+                        JobModel.required_skills,
+                        JobModel.preferred_skills,
+                        (JobModel.created_at <= until).label("settled"),
+                    )
+                    .where(JobModel.id > state.last_id)
+                    .order_by(JobModel.id)
+                    .limit(self.BATCH_SIZE)
+                )
+                batch = (await db.execute(stmt)).all()
+                # Stop at the first job inside the lag window: moving the watermark past it
+                # would skip it for good, along with any lower ids still being committed.
+                jobs = list(takewhile(lambda job: job.settled, batch))
+                if jobs:
+                    await self._add_counts(db, jobs)
+                    state.last_id = jobs[-1].id
+                await db.commit()
+                processed += len(jobs)
+                if len(jobs) < self.BATCH_SIZE:
+                    break
+        return processed
+
+    async def _lock_state(self, db: AsyncSession) -> RollupStateModel:
+        """Create the watermark row if needed and lock it for the rest of the transaction.
+
+        Concurrent rollups, such as one per worker process, then take turns instead of
+        folding the same jobs in twice. SQLite ignores ``FOR UPDATE``, but the insert
+        already holds its single writer lock until the transaction ends.
+        """
+        await db.execute(
+            _dialect_insert(db)(RollupStateModel)
+            .values(name=self.STATE_NAME, last_id=0)
+            .on_conflict_do_nothing(index_elements=[RollupStateModel.name])
+        )
+        stmt = (
+            select(RollupStateModel)
+            .where(RollupStateModel.name == self.STATE_NAME)
+            .with_for_update()
+        )
+        result = await db.scalars(stmt, execution_options={"populate_existing": True})
+        return result.one()
+
+    async def _add_counts(self, db: AsyncSession, jobs: list[Any]) -> None:
+        counts: Counter[tuple[Any, ...]] = Counter()
+        for job in jobs:
+            day = job.created_at.date()
+            slice_key = (
+                (job.location or "").strip().lower(),
+                bool(job.is_remote),
+                job.experience_level or "",
+            )
+            for kind, skills in (
+                ("required", job.required_skills),
+                ("preferred", job.preferred_skills),
+            ):
+                for skill in set(filter(None, self.ai._extract_skill_names(skills))):
+                    for grain in self.GRAINS:
+                        counts[(grain, self._bucket(grain, day), kind, skill, *slice_key)] += 1
+        if not counts:
+            return
+
+        rows = [
+            dict(zip(self.KEY_COLUMNS, key, strict=True), count=count)
+            for key, count in counts.items()
+        ]
+        stmt = _dialect_insert(db)(SkillTrendModel)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(self.KEY_COLUMNS),
+            set_={"count": SkillTrendModel.count + stmt.excluded.count},
+        )
+        await db.execute(stmt, rows)
+
+    async def run_periodically(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        while True:
+            try:
+                await self.roll_up(session_factory)
+            except Exception:
+                logger.exception("Skill trend rollup failed")
+            await asyncio.sleep(settings.TREND_ROLLUP_INTERVAL_SECONDS)
+
+    async def get_trends(
+        self,
+        db: AsyncSession,
+        skills: list[str],
+        grain: str = "week",
+        kind: str = "required",
+        start: date | None = None,
+        end: date | None = None,
+        location: str | None = None,
+        is_remote: bool | None = None,
+        experience_level: str | None = None,
+    ) -> dict[str, Any]:
+        """Per-skill time series; buckets with no matching jobs are omitted."""
+        end = end or datetime.now(UTC).date()
+        start = start or end - timedelta(days=365)
+        names = list(dict.fromkeys(s.strip().lower() for s in skills if s.strip()))
+
+        stmt = select(
+            SkillTrendModel.skill,
+            SkillTrendModel.bucket,
+            func.sum(SkillTrendModel.count).label("count"),
+        ).where(
+            SkillTrendModel.grain == grain,
+            SkillTrendModel.kind == kind,
+            SkillTrendModel.skill.in_(names),
+            SkillTrendModel.bucket.between(self._bucket(grain, start), end),
+        )
+        if location:
+            stmt = stmt.where(SkillTrendModel.location == location.strip().lower())
+        if is_remote is not None:
+            stmt = stmt.where(SkillTrendModel.is_remote == is_remote)
+        if experience_level:
+            stmt = stmt.where(SkillTrendModel.experience_level == experience_level)
+        stmt = stmt.group_by(SkillTrendModel.skill, SkillTrendModel.bucket).order_by(
+            SkillTrendModel.bucket
+        )
+
+        points: dict[str, list[dict[str, Any]]] = {name: [] for name in names}
+        for row in await db.execute(stmt):
+            points[row.skill].append({"bucket": row.bucket, "count": row.count})
+
+        return {
+            "grain": grain,
+            "kind": kind,
+            "start": start,
+            "end": end,
+            "series": [{"skill": name, "points": points[name]} for name in names],
+        }
 
 
 class UserService:
     """User account management."""
 
+    def __init__(self) -> None:
+        self._principals: TTLCache[int, Principal] = TTLCache(
+            settings.AUTH_CACHE_MAX_SIZE, settings.AUTH_CACHE_TTL_SECONDS
+        )
+
     async def create_user(
         self, db: AsyncSession, user_data: dict[str, Any], hashed_password: str
     ) -> UserModel:
@@ -974,8 +2316,8 @@ class UserService:
             is_recruiter=user_data.get("is_recruiter", False),
         )
         db.add(user)
+        # Server defaults come back from the INSERT … RETURNING.
         await db.commit()
-        await db.refresh(user)
         return user
 
     async def get_user_by_email(self, db: AsyncSession, email: str) -> UserModel | None:
@@ -985,9 +2327,93 @@ class UserService:
     async def get_user_by_id(self, db: AsyncSession, user_id: int) -> UserModel | None:
         return await db.get(UserModel, user_id)
 
+    async def get_principal(self, db: AsyncSession, user_id: int) -> Principal | None:
+        """The identity used to authorize a request.
+
+        Cached per worker for ``AUTH_CACHE_TTL_SECONDS``. Every hit is still checked against
+        the user's ``auth_version`` and ``is_active``, a primary-key lookup of two columns,
+        so a deactivation or role change made by any worker takes effect on the next
+        request; the bumped version also revokes the user's tokens (see
+        ``Principal.issued``).
+        """
+        cached = self._principals.get(user_id)
+        if cached is not None:
+            stamp = (
+                await db.execute(
+                    select(UserModel.auth_version, UserModel.is_active).where(
+                        UserModel.id == user_id
+                    )
+                )
+            ).first()
+            if stamp is None:
+                self._principals.pop(user_id)
+                return None
+            if (stamp.auth_version, stamp.is_active) == (cached.auth_version, cached.is_active):
+                return cached
+
+        result = await db.execute(
+            select(
+                UserModel.id,
+                UserModel.email,
+                UserModel.full_name,
+                UserModel.is_active,
+                UserModel.is_recruiter,
+                UserModel.auth_version,
+            ).where(UserModel.id == user_id)
+        )
+        row = result.first()
+        if row is None:
+            self._principals.pop(user_id)
+            return None
+        principal = Principal(**row._mapping)
+        self._principals.set(user_id, principal)
+        return principal
+
+    async def update_access(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        *,
+        is_active: bool | None = None,
+        is_recruiter: bool | None = None,
+    ) -> bool:
+        """Activate/deactivate a user or change their role; False if the user does not exist.
+
+        ``auth_version`` is bumped in the same UPDATE, which revokes the user's tokens.
+        """
+        values: dict[str, Any] = {"auth_version": UserModel.auth_version + 1}
+        if is_active is not None:
+            values["is_active"] = is_active
+        if is_recruiter is not None:
+            values["is_recruiter"] = is_recruiter
+        result = await db.execute(
+            update(UserModel)
+            .where(UserModel.id == user_id)
+            .values(**values)
+            .returning(UserModel.id)
+        )
+        updated = result.first() is not None
+        await db.commit()
+        self._principals.pop(user_id)
+        return updated
+
+    async def update_password_hash(
+        self, db: AsyncSession, user_id: int, hashed_password: str
+    ) -> None:
+        await db.execute(
+            update(UserModel).where(UserModel.id == user_id).values(hashed_password=hashed_password)
+        )
+        await db.commit()
+
+    def clear_cache(self) -> None:
+        self._principals.clear()
+
 
 ai_service = AIService()
 resume_service = ResumeService(ai_service)
 job_service = JobService(ai_service)
 matching_service = MatchingService(ai_service)
+recommendation_service = RecommendationService(ai_service)
+resume_artifact_service = ResumeArtifactService(ai_service)
+trend_service = TrendService(ai_service)
 user_service = UserService()
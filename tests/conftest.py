@@ -13,8 +13,10 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from db.database import Base, get_db  # noqa: E402
+from core.ratelimit import rate_limiter  # noqa: E402
+from db.database import Base, get_db, get_read_db, get_session_factory  # noqa: E402
 from main import app  # noqa: E402
+from services import user_service  # noqa: E402
 
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
@@ -43,6 +45,11 @@ async def client(db_session: AsyncSession) -> AsyncIterator[AsyncClient]:
         yield db_session
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: _TestSession
+    # Every test starts from an empty database, so user ids repeat between tests.
+    user_service.clear_cache()
+    await rate_limiter.store.reset()
 
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
@@ -2,8 +2,18 @@
 
 from __future__ import annotations
 
+import math
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from db.database import Base, get_read_db
+from main import app
 
 # ---------------------------------------------------------------------------
 # Auth endpoints
@@ -66,6 +76,33 @@ async def test_login_success(client: AsyncClient) -> None:
     assert data["token_type"] == "bearer"
 
 
+@pytest.mark.asyncio
+async def test_login_rehashes_when_cost_changes(
+    client: AsyncClient, db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from core.config import settings
+
+    creds = {"username": "rehash@example.com", "password": "rehash-pass-1"}
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 4)
+    await client.post(
+        "/api/v1/auth/register",
+        json={"email": creds["username"], "password": creds["password"], "full_name": "R"},
+    )
+
+    async def _stored_hash() -> str:
+        result = await db_session.execute(
+            text("SELECT hashed_password FROM users WHERE email = :email"),
+            {"email": creds["username"]},
+        )
+        return result.scalar_one()
+
+    assert (await _stored_hash()).startswith("$2b$04$")
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 5)
+    assert (await client.post("/api/v1/auth/login", data=creds)).status_code == 200
+    assert (await _stored_hash()).startswith("$2b$05$")
+    assert (await client.post("/api/v1/auth/login", data=creds)).status_code == 200
+
+
 @pytest.mark.asyncio
 async def test_login_wrong_password(client: AsyncClient) -> None:
     await client.post(
@@ -122,6 +159,21 @@ async def _register_and_login(
     return {"Authorization": f"Bearer {token}"}
 
 
+@contextmanager
+def _count_queries(db_session: AsyncSession) -> Iterator[list[str]]:
+    statements: list[str] = []
+    engine = db_session.bind.sync_engine
+
+    def _record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
 # ---------------------------------------------------------------------------
 # Resume endpoints
 # ---------------------------------------------------------------------------
@@ -236,6 +288,104 @@ async def test_get_job_by_id(client: AsyncClient) -> None:
     assert resp.json()["id"] == jid
 
 
+@pytest.mark.asyncio
+async def test_list_jobs_keyset_pagination(client: AsyncClient) -> None:
+    headers = await _register_and_login(client, email="job-pages@example.com", is_recruiter=True)
+    created = []
+    for i in range(5):
+        resp = await client.post(
+            "/api/v1/jobs", json={"title": f"Job{i}", "description_text": "Desc"}, headers=headers
+        )
+        created.append(resp.json()["id"])
+
+    seen: list[int] = []
+    params: dict[str, str | int] = {"limit": 2}
+    while True:
+        resp = await client.get("/api/v1/jobs", params=params, headers=headers)
+        assert resp.status_code == 200
+        seen.extend(job["id"] for job in resp.json())
+        cursor = resp.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        assert f"cursor={cursor}" in resp.headers["Link"]
+        assert resp.headers["Link"].endswith('; rel="next"')
+        params["cursor"] = cursor
+
+    assert seen == list(reversed(created))
+
+    resp = await client.get("/api/v1/jobs", params={"cursor": "not-a-cursor"}, headers=headers)
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_returns_304_until_data_changes(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    headers = await _register_and_login(client, email="etag@example.com", is_recruiter=True)
+    jid = (
+        await client.post(
+            "/api/v1/jobs", json={"title": "ETag", "description_text": "Desc"}, headers=headers
+        )
+    ).json()["id"]
+
+    for url in (f"/api/v1/jobs/{jid}", "/api/v1/jobs"):
+        resp = await client.get(url, headers=headers)
+        assert resp.status_code == 200
+        etag = resp.headers["ETag"]
+        assert etag.startswith('W/"')
+        assert resp.headers["Cache-Control"] == "private, no-cache"
+
+        with _count_queries(db_session) as statements:
+            resp = await client.get(url, headers={**headers, "If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.content == b""
+        assert resp.headers["ETag"] == etag
+        # Principal check plus one lookup; the list body is never queried.
+        assert len(statements) <= 2
+
+        if url != "/api/v1/jobs":
+            since = {"If-Modified-Since": resp.headers["Last-Modified"]}
+            assert (await client.get(url, headers={**headers, **since})).status_code == 304
+        # A different query string is a different representation.
+        other = await client.get(
+            url, params={"limit": 1}, headers={**headers, "If-None-Match": etag}
+        )
+        assert other.status_code == 200
+
+    list_etag = (await client.get("/api/v1/jobs", headers=headers)).headers["ETag"]
+    item_etag = (await client.get(f"/api/v1/jobs/{jid}", headers=headers)).headers["ETag"]
+    await client.put(f"/api/v1/jobs/{jid}", json={"title": "Renamed"}, headers=headers)
+    for url, etag in (("/api/v1/jobs", list_etag), (f"/api/v1/jobs/{jid}", item_etag)):
+        resp = await client.get(url, headers={**headers, "If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.headers["ETag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_collection_if_modified_since_survives_deletes(client: AsyncClient) -> None:
+    headers = await _register_and_login(client, email="ims@example.com", is_recruiter=True)
+    jids = [
+        (
+            await client.post(
+                "/api/v1/jobs", json={"title": f"IMS {i}", "description_text": "D"}, headers=headers
+            )
+        ).json()["id"]
+        for i in range(2)
+    ]
+    resp = await client.get("/api/v1/jobs", headers=headers)
+    assert "Last-Modified" not in resp.headers
+    etag = resp.headers["ETag"]
+
+    # Deleting the newest row leaves every remaining timestamp in the past.
+    assert (await client.delete(f"/api/v1/jobs/{jids[1]}", headers=headers)).status_code == 200
+    since = {"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"}
+    resp = await client.get("/api/v1/jobs", headers={**headers, **since})
+    assert resp.status_code == 200
+    assert [job["id"] for job in resp.json()] == jids[:1]
+    resp = await client.get("/api/v1/jobs", headers={**headers, "If-None-Match": etag})
+    assert resp.status_code == 200
+
+
 # ---------------------------------------------------------------------------
 # Unauthenticated access
 # ---------------------------------------------------------------------------
@@ -345,6 +495,102 @@ async def test_list_applications(client: AsyncClient) -> None:
     assert isinstance(resp.json(), list)
 
 
+@pytest.mark.asyncio
+async def test_read_query_count_is_independent_of_data_volume(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    """Relationships are not eagerly cascaded, so reads cost a fixed number of queries."""
+    rec_h = await _register_and_login(client, email="qc-rec@e.com", is_recruiter=True)
+    js_h = await _register_and_login(client, email="qc-js@e.com")
+    rid = (
+        await client.post("/api/v1/resumes", data={"resume_data": "Python"}, headers=js_h)
+    ).json()["id"]
+
+    async def _add_job_with_application() -> int:
+        jid = (
+            await client.post(
+                "/api/v1/jobs", json={"title": "QC", "description_text": "Python"}, headers=rec_h
+            )
+        ).json()["id"]
+        resp = await client.post(
+            "/api/v1/applications",
+            json={"resume_id": rid, "job_id": jid, "full_name": "QC", "email": "qc@e.com"},
+            headers=js_h,
+        )
+        return resp.json()["id"]
+
+    async def _query_counts(application_id: int) -> dict[str, int]:
+        counts = {}
+        for name, url, headers in (
+            ("me", "/api/v1/auth/me", rec_h),
+            ("jobs", "/api/v1/jobs", rec_h),
+            ("applications", "/api/v1/applications", rec_h),
+            ("application", f"/api/v1/applications/{application_id}", rec_h),
+            ("resumes", "/api/v1/resumes", js_h),
+        ):
+            with _count_queries(db_session) as statements:
+                assert (await client.get(url, headers=headers)).status_code == 200
+            counts[name] = len(statements)
+        return counts
+
+    application_id = await _add_job_with_application()
+    baseline = await _query_counts(application_id)
+    # The cached principal's version check, then the full profile row.
+    assert baseline["me"] == 2
+    # Lists add the aggregate query their ETag is derived from.
+    assert max(baseline.values()) <= 3
+
+    for _ in range(5):
+        application_id = await _add_job_with_application()
+    assert await _query_counts(application_id) == baseline
+
+
+@pytest.mark.asyncio
+async def test_owner_scoped_writes_are_single_statements(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    """Ownership is checked in the write's WHERE clause; only failures look the row up."""
+    rec_h = await _register_and_login(client, email="ws-rec@e.com", is_recruiter=True)
+    other_h = await _register_and_login(client, email="ws-other@e.com", is_recruiter=True)
+    js_h = await _register_and_login(client, email="ws-js@e.com")
+    rid = (
+        await client.post("/api/v1/resumes", data={"resume_data": "Python"}, headers=js_h)
+    ).json()["id"]
+    jid = (
+        await client.post(
+            "/api/v1/jobs", json={"title": "WS", "description_text": "Python"}, headers=rec_h
+        )
+    ).json()["id"]
+    app_id = (
+        await client.post(
+            "/api/v1/applications",
+            json={"resume_id": rid, "job_id": jid, "full_name": "WS", "email": "ws@e.com"},
+            headers=js_h,
+        )
+    ).json()["id"]
+
+    url = f"/api/v1/applications/{app_id}/status"
+    params = {"status_value": "Shortlisted"}
+    assert (await client.patch(url, params=params, headers=other_h)).status_code == 403
+    assert (
+        await client.patch("/api/v1/applications/999/status", params=params, headers=rec_h)
+    ).status_code == 404
+    with _count_queries(db_session) as statements:
+        resp = await client.patch(url, params=params, headers=rec_h)
+    assert resp.status_code == 200
+    assert resp.json()["status"] == "Shortlisted"
+    assert resp.json()["reviewed_at"] is not None
+    # The cached principal's version check plus UPDATE … RETURNING.
+    assert len(statements) == 2
+
+    assert (await client.delete(f"/api/v1/jobs/{jid}", headers=other_h)).status_code == 403
+    assert (await client.delete("/api/v1/resumes/999", headers=js_h)).status_code == 404
+    with _count_queries(db_session) as statements:
+        assert (await client.delete(f"/api/v1/resumes/{rid}", headers=js_h)).status_code == 200
+    # Version check, recommendations, artifacts, DELETE … RETURNING.
+    assert len(statements) == 4
+
+
 # ---------------------------------------------------------------------------
 # Match endpoint
 # ---------------------------------------------------------------------------
@@ -378,6 +624,42 @@ async def test_match_resume_to_job(client: AsyncClient) -> None:
     assert "score" in data or "match_score" in data or isinstance(data, dict)
 
 
+@pytest.mark.asyncio
+async def test_match_batch_streams_ndjson(client: AsyncClient) -> None:
+    import json
+
+    headers = await _register_and_login(client, email="batch-seek@e.com")
+    resume_resp = await client.post(
+        "/api/v1/resumes",
+        data={"resume_data": "Skills: Python, SQL"},
+        headers=headers,
+    )
+    rid = resume_resp.json()["id"]
+
+    rec_headers = await _register_and_login(client, email="batch-rec@e.com", is_recruiter=True)
+    job_ids = []
+    for title in ("Data Engineer", "Backend Engineer"):
+        job_resp = await client.post(
+            "/api/v1/jobs",
+            json={"title": title, "description_text": "Python and SQL"},
+            headers=rec_headers,
+        )
+        job_ids.append(job_resp.json()["id"])
+
+    pairs = [{"resume_id": rid, "job_id": jid} for jid in job_ids]
+    pairs += [pairs[0], {"resume_id": 9999, "job_id": job_ids[0]}]
+    resp = await client.post("/api/v1/match/batch", json={"pairs": pairs}, headers=headers)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert len(lines) == 3
+    by_pair = {(line["resume_id"], line["job_id"]): line for line in lines}
+    assert by_pair[(9999, job_ids[0])]["error"] == "Resume not found"
+    for jid in job_ids:
+        assert "match_score" in by_pair[(rid, jid)]
+
+
 # ---------------------------------------------------------------------------
 # Recommendations
 # ---------------------------------------------------------------------------
@@ -385,6 +667,8 @@ async def test_match_resume_to_job(client: AsyncClient) -> None:
 
 @pytest.mark.asyncio
 async def test_get_recommendations(client: AsyncClient) -> None:
+    from core.config import settings
+
     headers = await _register_and_login(client, email="recs@e.com")
     resume_resp = await client.post(
         "/api/v1/resumes",
@@ -395,6 +679,63 @@ async def test_get_recommendations(client: AsyncClient) -> None:
     resp = await client.get(f"/api/v1/recommendations/{rid}", headers=headers)
     assert resp.status_code == 200
     assert isinstance(resp.json(), list)
+    # Only the top K jobs are stored per resume, so asking for more is rejected.
+    over = {"limit": settings.RECOMMENDATIONS_TOP_K + 1}
+    resp = await client.get(f"/api/v1/recommendations/{rid}", params=over, headers=headers)
+    assert resp.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_recommendations_follow_job_writes(client: AsyncClient) -> None:
+    """Precomputed recommendation lists pick up new jobs and drop deleted ones."""
+    headers = await _register_and_login(client, email="recs-live@e.com")
+    resume_resp = await client.post(
+        "/api/v1/resumes",
+        data={"resume_data": "Skills: Python, SQL, Docker"},
+        headers=headers,
+    )
+    rid = resume_resp.json()["id"]
+
+    rec_h = await _register_and_login(client, email="recs-live-rec@e.com", is_recruiter=True)
+    job_resp = await client.post(
+        "/api/v1/jobs",
+        json={"title": "Data Engineer", "description_text": "Python and SQL pipelines"},
+        headers=rec_h,
+    )
+    jid = job_resp.json()["id"]
+
+    resp = await client.get(f"/api/v1/recommendations/{rid}", headers=headers)
+    assert resp.status_code == 200
+    assert [job["id"] for job in resp.json()] == [jid]
+
+    await client.delete(f"/api/v1/jobs/{jid}", headers=rec_h)
+    resp = await client.get(f"/api/v1/recommendations/{rid}", headers=headers)
+    assert resp.json() == []
+
+
+@pytest.mark.asyncio
+async def test_recruiters_are_recommended_their_own_postings(client: AsyncClient) -> None:
+    headers = await _register_and_login(client, email="recs-own@e.com")
+    resume_resp = await client.post(
+        "/api/v1/resumes", data={"resume_data": "Skills: Python, SQL"}, headers=headers
+    )
+    rid = resume_resp.json()["id"]
+
+    job_ids = {}
+    for email in ("recs-own-a@e.com", "recs-own-b@e.com"):
+        rec_h = await _register_and_login(client, email=email, is_recruiter=True)
+        job_resp = await client.post(
+            "/api/v1/jobs",
+            json={"title": "Data Engineer", "description_text": "Python and SQL"},
+            headers=rec_h,
+        )
+        job_ids[email] = (rec_h, job_resp.json()["id"])
+
+    resp = await client.get(f"/api/v1/recommendations/{rid}", headers=headers)
+    assert sorted(job["id"] for job in resp.json()) == sorted(jid for _, jid in job_ids.values())
+    for rec_h, jid in job_ids.values():
+        resp = await client.get(f"/api/v1/recommendations/{rid}", headers=rec_h)
+        assert [job["id"] for job in resp.json()] == [jid]
 
 
 # ---------------------------------------------------------------------------
@@ -449,6 +790,98 @@ async def test_get_market_analysis(client: AsyncClient) -> None:
     assert isinstance(resp.json(), dict)
 
 
+@pytest.mark.asyncio
+async def test_market_analysis_tracks_job_writes(client: AsyncClient) -> None:
+    headers = await _register_and_login(client, email="demand@e.com", is_recruiter=True)
+    other = await _register_and_login(client, email="demand-other@e.com", is_recruiter=True)
+
+    async def _post(title: str, skills: list[str], auth: dict[str, str]) -> int:
+        resp = await client.post(
+            "/api/v1/jobs", json={"title": title, "description_text": title}, headers=auth
+        )
+        jid = resp.json()["id"]
+        await client.put(
+            f"/api/v1/jobs/{jid}",
+            json={
+                "required_skills": [{"name": name} for name in skills],
+                "preferred_skills": [{"name": "Docker"}],
+            },
+            headers=auth,
+        )
+        return jid
+
+    async def _required() -> dict[str, int]:
+        resp = await client.get("/api/v1/market-analysis", headers=headers)
+        return {s["name"]: s["count"] for s in resp.json()["top_required_skills"]}
+
+    first = await _post("A", ["Python", "SQL"], headers)
+    await _post("B", ["python", "Go"], headers)
+    await _post("C", ["Python"], other)
+    assert await _required() == {"python": 2, "sql": 1, "go": 1}
+
+    await client.put(
+        f"/api/v1/jobs/{first}",
+        json={"required_skills": [{"name": "Rust"}, {"name": "Python"}]},
+        headers=headers,
+    )
+    assert await _required() == {"python": 2, "rust": 1, "go": 1}
+
+    await client.delete(f"/api/v1/jobs/{first}", headers=headers)
+    resp = await client.get("/api/v1/market-analysis", headers=headers)
+    data = resp.json()
+    assert data["total_jobs_analyzed"] == 1
+    assert {s["name"]: s["count"] for s in data["top_required_skills"]} == {"python": 1, "go": 1}
+    assert data["top_preferred_skills"] == [{"name": "docker", "count": 1}]
+
+
+@pytest.mark.asyncio
+async def test_market_trends(client: AsyncClient) -> None:
+    seeker = await _register_and_login(client, email="trends-seeker@e.com")
+    resp = await client.get("/api/v1/market-trends", params={"skills": "python"}, headers=seeker)
+    assert resp.status_code == 403
+
+    headers = await _register_and_login(client, email="trends@e.com", is_recruiter=True)
+    resp = await client.get("/api/v1/market-trends", headers=headers)
+    assert resp.status_code == 422
+
+    resp = await client.get(
+        "/api/v1/market-trends",
+        params={"skills": ["Python", "Go"], "grain": "day", "remote": "true"},
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["grain"] == "day"
+    assert [series["skill"] for series in data["series"]] == ["python", "go"]
+
+
+@pytest.mark.asyncio
+async def test_lag_tolerant_reads_use_read_replica(client: AsyncClient) -> None:
+    replica = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    async with replica.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async def _replica_db() -> AsyncIterator[AsyncSession]:
+        async with AsyncSession(replica) as session:
+            yield session
+
+    recruiter = await _register_and_login(client, email="replica-rec@e.com", is_recruiter=True)
+    seeker = await _register_and_login(client, email="replica-seeker@e.com")
+    await client.post(
+        "/api/v1/jobs", json={"title": "Backend", "description_text": "Python"}, headers=recruiter
+    )
+    app.dependency_overrides[get_read_db] = _replica_db
+    try:
+        # The empty replica stands in for one that has not caught up yet.
+        assert (await client.get("/api/v1/jobs", headers=seeker)).json() == []
+        resp = await client.get("/api/v1/market-analysis", headers=recruiter)
+        assert resp.json()["total_jobs_analyzed"] == 0
+        # Recruiters read their own postings from the primary.
+        assert len((await client.get("/api/v1/jobs", headers=recruiter)).json()) == 1
+    finally:
+        await replica.dispose()
+
+
 # ---------------------------------------------------------------------------
 # Skills Gap Analysis (new feature)
 # ---------------------------------------------------------------------------
@@ -843,3 +1276,333 @@ async def test_create_job_invalid_experience_level(client: AsyncClient) -> None:
         headers=rec_h,
     )
     assert resp.status_code == 422
+
+
+# ---------------------------------------------------------------------------
+# Deferred application scoring
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_deferred_application_scoring(client: AsyncClient, monkeypatch) -> None:
+    """With deferred scoring the application is stored provisionally, then scored."""
+    from core.config import settings
+
+    monkeypatch.setattr(settings, "DEFER_APPLICATION_SCORING", True)
+
+    rec_h = await _register_and_login(client, email="defer-rec@e.com", is_recruiter=True)
+    job_resp = await client.post(
+        "/api/v1/jobs",
+        json={"title": "Python Dev", "description_text": "Python and SQL"},
+        headers=rec_h,
+    )
+    jid = job_resp.json()["id"]
+
+    seek_h = await _register_and_login(client, email="defer-seek@e.com")
+    resume_resp = await client.post(
+        "/api/v1/resumes",
+        data={"resume_data": "Python developer"},
+        headers=seek_h,
+    )
+    rid = resume_resp.json()["id"]
+
+    resp = await client.post(
+        "/api/v1/applications",
+        json={"job_id": jid, "resume_id": rid, "full_name": "Defer", "email": "d@e.com"},
+        headers=seek_h,
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["scoring_status"] == "pending"
+    assert data["feedback"] is None
+
+    detail = await client.get(f"/api/v1/applications/{data['id']}", headers=rec_h)
+    assert detail.json()["scoring_status"] == "scored"
+    assert detail.json()["feedback"]
+
+
+@pytest.mark.asyncio
+async def test_pending_applications_are_scored_by_the_sweep(
+    client: AsyncClient, db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from datetime import UTC, datetime, timedelta
+
+    from sqlalchemy import update
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    from core.config import settings
+    from models import Application
+    from services import matching_service
+
+    rec_h = await _register_and_login(client, email="sweep-rec@e.com", is_recruiter=True)
+    job_resp = await client.post(
+        "/api/v1/jobs",
+        json={"title": "Python Dev", "description_text": "Python and SQL"},
+        headers=rec_h,
+    )
+    seek_h = await _register_and_login(client, email="sweep-seek@e.com")
+    resume_resp = await client.post(
+        "/api/v1/resumes", data={"resume_data": "Python developer"}, headers=seek_h
+    )
+    resp = await client.post(
+        "/api/v1/applications",
+        json={
+            "job_id": job_resp.json()["id"],
+            "resume_id": resume_resp.json()["id"],
+            "full_name": "Sweep",
+            "email": "s@e.com",
+        },
+        headers=seek_h,
+    )
+    application_id = resp.json()["id"]
+    # As if the process scoring it had stopped before the background task ran.
+    await db_session.execute(
+        update(Application)
+        .where(Application.id == application_id)
+        .values(scoring_status="pending", feedback=None)
+    )
+    await db_session.commit()
+
+    factory = async_sessionmaker(db_session.bind)
+
+    # Another worker holds a live claim, so this worker's sweep leaves the row to it.
+    calls = []
+    scorer = matching_service.match_resume_to_job
+
+    async def _counting(*args):
+        calls.append(args)
+        return await scorer(*args)
+
+    monkeypatch.setattr(matching_service, "match_resume_to_job", _counting)
+    claim = update(Application).where(Application.id == application_id)
+    await db_session.execute(claim.values(scoring_claimed_at=datetime.now(UTC)))
+    await db_session.commit()
+    await matching_service.score_pending(factory)
+    await matching_service.score_application(factory, application_id)
+    assert calls == []
+
+    # Its claim expires, e.g. because it stopped mid-call; the next sweep takes over.
+    stale = datetime.now(UTC) - timedelta(seconds=settings.SCORING_CLAIM_TIMEOUT_SECONDS + 1)
+    await db_session.execute(claim.values(scoring_claimed_at=stale))
+    await db_session.commit()
+    await matching_service.score_pending(factory)
+    assert len(calls) == 1
+    detail = await client.get(f"/api/v1/applications/{application_id}", headers=rec_h)
+    assert detail.json()["scoring_status"] == "scored"
+    assert detail.json()["feedback"]
+
+
+@pytest.mark.asyncio
+async def test_access_change_revokes_cached_principals_and_tokens(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    from core.security import create_access_token
+    from services import user_service
+
+    headers = await _register_and_login(client, email="pc@e.com")
+    me = (await client.get("/api/v1/auth/me", headers=headers)).json()
+    with _count_queries(db_session) as statements:
+        assert (await client.get("/api/v1/resumes", headers=headers)).status_code == 200
+    # A cache hit costs only the version check before the ETag and list queries.
+    assert len(statements) == 3
+    assert "auth_version" in statements[0] and "email" not in statements[0]
+
+    # Tokens that predate versioning are refused.
+    legacy = {"Authorization": f"Bearer {create_access_token(me['id'])}"}
+    assert (await client.get("/api/v1/resumes", headers=legacy)).status_code == 403
+
+    # A role change revokes the token at once, with the principal still cached.
+    assert await user_service.update_access(db_session, me["id"], is_recruiter=True)
+    resp = await client.get("/api/v1/resumes", headers=headers)
+    assert resp.status_code == 403
+    assert resp.json()["detail"] == "Could not validate credentials"
+    headers = await _register_and_login(client, email="pc@e.com")
+    resp = await client.post(
+        "/api/v1/jobs", json={"title": "T", "description_text": "D"}, headers=headers
+    )
+    assert resp.status_code == 200
+
+    # A change made elsewhere (another worker, an admin script) only touches the row.
+    await db_session.execute(
+        text("UPDATE users SET is_active = 0 WHERE id = :id"),
+        {"id": me["id"]},
+    )
+    await db_session.commit()
+    resp = await client.get("/api/v1/resumes", headers=headers)
+    assert resp.status_code == 403
+    assert resp.json()["detail"] == "Inactive user"
+
+
+@pytest.mark.asyncio
+async def test_expensive_routes_are_rate_limited_per_user(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from core.config import settings
+
+    monkeypatch.setattr(settings, "RATE_LIMIT_USER_BURST", 2)
+    monkeypatch.setattr(settings, "RATE_LIMIT_USER_PER_MINUTE", 6)
+    headers = await _register_and_login(client, email="rl@e.com")
+    other = await _register_and_login(client, email="rl-other@e.com")
+
+    for _ in range(2):
+        resp = await client.post("/api/v1/resumes", data={"resume_data": "Python"}, headers=headers)
+        assert resp.status_code == 200
+    resp = await client.post("/api/v1/resumes", data={"resume_data": "Python"}, headers=headers)
+    assert resp.status_code == 429
+    assert 1 <= int(resp.headers["Retry-After"]) <= 10
+
+    # Other users keep their own budget, and cheap reads are never limited.
+    resp = await client.post("/api/v1/resumes", data={"resume_data": "Python"}, headers=other)
+    assert resp.status_code == 200
+    assert (await client.get("/api/v1/resumes", headers=headers)).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_batch_match_is_charged_by_pair_count(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from core.config import settings
+
+    monkeypatch.setattr(settings, "RATE_LIMIT_USER_BURST", 3)
+    monkeypatch.setattr(settings, "RATE_LIMIT_USER_PER_MINUTE", 0.1)
+    headers = await _register_and_login(client, email="rl-batch@e.com")
+
+    # More distinct pairs than the bucket holds can never be admitted.
+    pairs = [{"resume_id": 9000 + i, "job_id": 1} for i in range(4)]
+    resp = await client.post("/api/v1/match/batch", json={"pairs": pairs}, headers=headers)
+    assert resp.status_code == 413
+
+    # Three distinct pairs (the duplicate is free) cost three tokens: the whole bucket.
+    pairs = pairs[:3] + pairs[:1]
+    resp = await client.post("/api/v1/match/batch", json={"pairs": pairs}, headers=headers)
+    assert resp.status_code == 200
+    resp = await client.post("/api/v1/match/batch", json={"pairs": pairs[:1]}, headers=headers)
+    assert resp.status_code == 429
+
+
+@pytest.mark.asyncio
+async def test_improvement_panel_misses_are_admitted_and_fallbacks_not_cached(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import ui
+    from core.config import settings
+    from core.ratelimit import rate_limiter
+
+    headers = await _register_and_login(client, email="rl-panel@e.com")
+    resp = await client.post("/api/v1/resumes", data={"resume_data": "Python"}, headers=headers)
+    rid = resp.json()["id"]
+    monkeypatch.setattr(settings, "RATE_LIMIT_USER_BURST", 1)
+    monkeypatch.setattr(settings, "RATE_LIMIT_USER_PER_MINUTE", 0.1)
+    await rate_limiter.store.reset()
+    cache = ui.RESUME_PANELS["improvement"][2]
+    cache.clear()
+
+    # No provider answers here, so the first view is the heuristic fallback, not cached.
+    resp = await client.get(f"/resumes/{rid}/panels/improvement", headers=headers)
+    assert resp.status_code == 200
+    assert "Use consistent section headings" in resp.text
+    assert len(cache) == 0
+
+    # The next miss would reach the provider again, so it is turned away like the API.
+    resp = await client.get(f"/resumes/{rid}/panels/improvement", headers=headers)
+    assert resp.status_code == 200
+    assert "Use consistent section headings" not in resp.text
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_charges_no_bucket_unless_all_admit() -> None:
+    from core.ratelimit import MemoryRateLimitStore
+
+    store = MemoryRateLimitStore()
+    user, ip = ("user:1", 0.001, 2), ("ip:1", 0.001, 1)
+    assert await store.take([user, ip]) == 0
+    # The IP bucket is empty, so the user keeps its last token for another address.
+    assert await store.take([user, ip]) > 0
+    assert await store.take([user]) == 0
+    assert await store.take([user]) > 0
+    # A cost above the bucket size is never admitted and charges nothing.
+    assert await store.take([("user:2", 0.001, 2)], cost=5) == math.inf
+    assert await store.take([("user:2", 0.001, 2)], cost=2) == 0
+
+
+@pytest.mark.asyncio
+async def test_expensive_routes_are_shed_under_load(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from core.ratelimit import load_shedder
+
+    headers = await _register_and_login(client, email="shed@e.com")
+    monkeypatch.setattr(load_shedder, "loop_lag", 5.0)
+    resp = await client.post("/api/v1/resumes", data={"resume_data": "Python"}, headers=headers)
+    assert resp.status_code == 503
+    assert "Retry-After" in resp.headers
+    assert (await client.get("/api/v1/resumes", headers=headers)).status_code == 200
+
+    monkeypatch.setattr(load_shedder, "loop_lag", 0.0)
+    monkeypatch.setattr(load_shedder, "_provider_wait", 0.0)
+    load_shedder.record_provider_wait(60.0)
+    resp = await client.post("/api/v1/resumes", data={"resume_data": "Python"}, headers=headers)
+    assert resp.status_code == 503
+    # The recorded wait fades once no new calls report it.
+    monkeypatch.setattr(load_shedder, "_provider_wait_at", load_shedder._provider_wait_at - 60)
+    resp = await client.post("/api/v1/resumes", data={"resume_data": "Python"}, headers=headers)
+    assert resp.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_page_dropdowns_do_not_load_documents(
+    client: AsyncClient, db_session: AsyncSession
+) -> None:
+    rec_h = await _register_and_login(client, email="dd-rec@e.com", is_recruiter=True)
+    jid = (
+        await client.post(
+            "/api/v1/jobs", json={"title": "Dropdown Dev", "description_text": "D"}, headers=rec_h
+        )
+    ).json()["id"]
+    headers = await _register_and_login(client, email="dd-seek@e.com")
+    rid = (
+        await client.post("/api/v1/resumes", data={"resume_data": "Python"}, headers=headers)
+    ).json()["id"]
+
+    for url in ("/skills-gap", f"/jobs/{jid}"):
+        with _count_queries(db_session) as statements:
+            resp = await client.get(url, headers=headers)
+        assert resp.status_code == 200
+        assert f'value="{rid}"' in resp.text
+        assert "Dropdown Dev" in resp.text
+        assert not any("full_text" in statement for statement in statements)
+
+
+# ---------------------------------------------------------------------------
+# Anonymous page cache
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_anonymous_pages_are_served_from_cache(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import ui
+
+    ui.page_cache.clear()
+    first = await client.get("/login", headers={"Accept-Encoding": "gzip"})
+    assert first.status_code == 200
+    assert first.headers["Content-Encoding"] == "gzip"
+    assert first.headers["Cache-Control"].startswith("public")
+
+    def _no_render(*args, **kwargs):
+        raise AssertionError("cached page was rendered again")
+
+    monkeypatch.setattr(ui.templates, "get_template", _no_render)
+    again = await client.get("/login", headers={"Accept-Encoding": "identity"})
+    assert again.text == first.text
+    assert "Content-Encoding" not in again.headers
+    resp = await client.get("/login", headers={"If-None-Match": again.headers["ETag"]})
+    assert resp.status_code == 304
+    monkeypatch.undo()
+
+    # Each locale is its own entry, and query strings bypass the cache.
+    assert ui.page_cache.get(("http://test/login", "hi")) is None
+    await client.get("/login", headers={"Cookie": "locale=hi"})
+    assert ui.page_cache.get(("http://test/login", "hi")) is not None
+    assert (await client.get("/login?registered=true")).status_code == 200
@@ -0,0 +1,51 @@
+"""Tests for db/database.py – the SQLite connection profile and maintenance."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from core.config import settings
+from db.database import configure_sqlite
+
+
+@pytest_asyncio.fixture
+async def file_engine(tmp_path: Path) -> AsyncIterator[AsyncEngine]:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'tuned.db'}")
+    configure_sqlite(engine)
+    yield engine
+    await engine.dispose()
+
+
+async def _pragma(engine: AsyncEngine, name: str) -> object:
+    async with engine.connect() as conn:
+        return (await conn.execute(text(f"PRAGMA {name}"))).scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_profile_is_applied_on_connect(file_engine: AsyncEngine) -> None:
+    assert await _pragma(file_engine, "journal_mode") == "wal"
+    assert await _pragma(file_engine, "synchronous") == 1  # NORMAL
+    assert await _pragma(file_engine, "busy_timeout") == settings.SQLITE_BUSY_TIMEOUT_MS
+    assert await _pragma(file_engine, "cache_size") == -settings.SQLITE_CACHE_SIZE_KIB
+    assert await _pragma(file_engine, "temp_store") == 2  # MEMORY
+
+
+@pytest.mark.asyncio
+async def test_wal_checkpoint_truncates_log(file_engine: AsyncEngine, tmp_path: Path) -> None:
+    async with file_engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE t (x INTEGER)"))
+        await conn.execute(text("INSERT INTO t VALUES (1)"))
+    wal = tmp_path / "tuned.db-wal"
+    assert wal.stat().st_size > 0
+
+    async with file_engine.connect() as conn:
+        busy, _, _ = (await conn.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))).one()
+        await conn.execute(text("PRAGMA optimize"))
+    assert busy == 0
+    assert wal.stat().st_size == 0
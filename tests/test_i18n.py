@@ -4,13 +4,12 @@ from __future__ import annotations
 
 from core.i18n import (
     BASE_LOCALE,
-    EN_TRANSLATIONS,
-    LOCALE_OVERRIDES,
     SUPPORTED_LOCALES,
     TRANSLATIONS,
     normalize_locale,
     translate,
 )
+from core.locales import EN_TRANSLATIONS, LOCALE_OVERRIDES
 
 # ---------------------------------------------------------------------------
 # normalize_locale
@@ -107,3 +106,51 @@ class TestTranslationsStructure:
 
     def test_en_translations_nonempty(self) -> None:
         assert len(EN_TRANSLATIONS) > 100
+
+
+# ---------------------------------------------------------------------------
+# Compiled catalogs and template folding
+# ---------------------------------------------------------------------------
+
+
+class TestCompiledCatalogs:
+    def test_round_trip(self) -> None:
+        from core.i18n import Catalog, compile_catalog
+
+        entries = {"b.key": "Two", "a.key": "One", "ü.key": "Ünïcode"}
+        catalog = Catalog(compile_catalog(entries))
+        assert dict(catalog) == entries
+        assert "a.key" in catalog
+        assert catalog.translate("missing.key") == "missing.key"
+
+    def test_catalog_is_written_once_and_then_memory_mapped(self, tmp_path, monkeypatch) -> None:
+        import mmap
+
+        from core.config import settings
+        from core.i18n import get_catalog
+
+        monkeypatch.setattr(settings, "I18N_CATALOG_DIR", str(tmp_path))
+        get_catalog.cache_clear()
+        try:
+            assert get_catalog("fr").translate("nav.home") == translate("fr", "nav.home")
+            assert (tmp_path / "fr.cat").exists()
+            get_catalog.cache_clear()
+            reloaded = get_catalog("fr")
+            assert isinstance(reloaded._buffer, mmap.mmap)
+            assert dict(reloaded) == {**EN_TRANSLATIONS, **LOCALE_OVERRIDES["fr"]}
+        finally:
+            get_catalog.cache_clear()
+
+    def test_literal_keys_are_resolved_when_templates_compile(self, tmp_path) -> None:
+        from core.templating import LocalizedTemplates
+
+        (tmp_path / "page.html").write_text("{{ t('nav.home') }}|{{ t(key) }}", encoding="utf-8")
+        templates = LocalizedTemplates(directory=str(tmp_path))
+
+        def _runtime_t(key: str) -> str:
+            return f"runtime:{key}"
+
+        rendered = templates.get_template("page.html", "hi").render(t=_runtime_t, key="nav.jobs")
+        assert rendered == "होम|runtime:nav.jobs"
+        english = templates.get_template("page.html").render(t=_runtime_t, key="nav.jobs")
+        assert english == "Home|runtime:nav.jobs"
@@ -0,0 +1,202 @@
+"""Tests for db/migrations.py – versioned schema upgrades and hot-path query plans."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, func, inspect, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from core.pagination import encode_cursor
+from db.database import Base
+from db.migrations import LATEST_VERSION, current_version, run_migrations, schema_version
+from models import Job
+from services import _has_skill, job_service, matching_service, resume_service
+
+HOT_PATH_INDEXES = {
+    "resumes": "ix_resumes_user_id_created_at",
+    "jobs": "ix_jobs_company_id_created_at",
+    "applications": "ix_applications_job_id_status",
+}
+
+ENGINE_URLS = [pytest.param("sqlite+aiosqlite:///:memory:", id="sqlite")]
+if os.environ.get("TEST_POSTGRES_URL"):
+    ENGINE_URLS.append(pytest.param(os.environ["TEST_POSTGRES_URL"], id="postgresql"))
+
+
+@pytest_asyncio.fixture
+async def sqlite_engine() -> AsyncIterator[AsyncEngine]:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(params=ENGINE_URLS)
+async def migrated_engine(request: pytest.FixtureRequest) -> AsyncIterator[AsyncEngine]:
+    if request.param.startswith("sqlite"):
+        engine = create_async_engine(request.param, poolclass=StaticPool)
+    else:
+        engine = create_async_engine(request.param)
+    await run_migrations(engine)
+    yield engine
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(schema_version.drop)
+    await engine.dispose()
+
+
+def _index_names(conn: Any, table: str) -> set[str]:
+    return {index["name"] for index in inspect(conn).get_indexes(table)}
+
+
+@pytest.mark.asyncio
+async def test_upgrade_brings_legacy_database_to_latest(sqlite_engine: AsyncEngine) -> None:
+    async with sqlite_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        for name in HOT_PATH_INDEXES.values():
+            await conn.execute(text(f"DROP INDEX {name}"))
+        await conn.execute(text("DROP INDEX ix_applications_resume_id_status"))
+        await conn.execute(text("ALTER TABLE applications DROP COLUMN scoring_status"))
+        await conn.execute(text("ALTER TABLE users DROP COLUMN auth_version"))
+        await conn.execute(
+            text(
+                "INSERT INTO jobs (company_id, title, is_remote, created_at) "
+                "VALUES (1, 'legacy', 0, '2025-01-02 03:04:05')"
+            )
+        )
+
+    assert await current_version(sqlite_engine) is None
+    assert await run_migrations(sqlite_engine) == list(range(1, LATEST_VERSION + 1))
+    assert await current_version(sqlite_engine) == LATEST_VERSION
+
+    async with sqlite_engine.connect() as conn:
+        columns = await conn.run_sync(
+            lambda sync: {c["name"] for c in inspect(sync).get_columns("applications")}
+        )
+        assert "scoring_status" in columns
+        user_columns = await conn.run_sync(
+            lambda sync: {c["name"] for c in inspect(sync).get_columns("users")}
+        )
+        assert "auth_version" in user_columns
+        for table, name in HOT_PATH_INDEXES.items():
+            assert name in await conn.run_sync(_index_names, table)
+        # Server-default timestamps are rewritten to the format bound parameters use.
+        created_at = await conn.scalar(text("SELECT created_at FROM jobs"))
+        assert created_at == "2025-01-02 03:04:05.000000"
+
+    assert await run_migrations(sqlite_engine) == []
+
+
+@pytest.mark.asyncio
+async def test_upgrade_respects_target(sqlite_engine: AsyncEngine) -> None:
+    assert await run_migrations(sqlite_engine, target=1) == [1]
+    assert await current_version(sqlite_engine) == 1
+    assert await run_migrations(sqlite_engine) == list(range(2, LATEST_VERSION + 1))
+
+
+@contextmanager
+def _capture(engine: AsyncEngine) -> Iterator[list[tuple[str, Any]]]:
+    statements: list[tuple[str, Any]] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _record)
+
+
+async def _plan(engine: AsyncEngine, call: Callable[[Any], Awaitable[Any]]) -> str:
+    """Run a service read and return the database's plan for the SQL it issued."""
+    async with async_sessionmaker(engine)() as db:
+        with _capture(engine) as statements:
+            await call(db)
+    (statement, parameters), *_ = statements
+
+    async with engine.connect() as conn:
+        if engine.dialect.name == "postgresql":
+            await conn.exec_driver_sql("SET enable_seqscan = off")
+            result = await conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+        else:
+            result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return "\n".join(" ".join(str(value) for value in row) for row in result)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("call", "expected"),
+    [
+        pytest.param(
+            lambda db: resume_service.get_resumes(db, 1, False),
+            ["ix_resumes_user_id_created_at"],
+            id="resumes-by-owner",
+        ),
+        pytest.param(
+            lambda db: job_service.get_jobs(db, 1, True),
+            ["ix_jobs_company_id_created_at"],
+            id="jobs-by-company",
+        ),
+        pytest.param(
+            lambda db: matching_service.get_applications(db, 1, True, status="New"),
+            ["ix_applications_job_id_status", "ix_jobs_company_id_created_at"],
+            id="applications-for-recruiter",
+        ),
+        pytest.param(
+            lambda db: matching_service.get_applications(db, 1, False, status="New"),
+            ["ix_applications_resume_id_status", "ix_resumes_user_id_created_at"],
+            id="applications-for-seeker",
+        ),
+    ],
+)
+async def test_hot_path_queries_use_indexes(
+    migrated_engine: AsyncEngine,
+    call: Callable[[Any], Awaitable[Any]],
+    expected: list[str],
+) -> None:
+    plan = await _plan(migrated_engine, call)
+    for name in expected:
+        assert name in plan, plan
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "call",
+    [
+        pytest.param(lambda db, cursor: job_service.get_jobs(db, 1, True, cursor, 20), id="jobs"),
+        pytest.param(
+            lambda db, cursor: job_service.get_jobs(db, 1, False, cursor, 20), id="all-jobs"
+        ),
+        pytest.param(
+            lambda db, cursor: resume_service.get_resumes(db, 1, False, cursor, 20), id="resumes"
+        ),
+    ],
+)
+async def test_keyset_pages_are_index_range_scans(
+    migrated_engine: AsyncEngine, call: Callable[[Any, str], Awaitable[Any]]
+) -> None:
+    cursor = encode_cursor(datetime(2025, 1, 1), 10_000)
+    plan = await _plan(migrated_engine, lambda db: call(db, cursor))
+    assert "_created_at" in plan, plan
+    assert "TEMP B-TREE" not in plan.upper() and "Sort" not in plan, plan
+
+
+@pytest.mark.asyncio
+async def test_skill_containment_uses_gin_index(migrated_engine: AsyncEngine) -> None:
+    if migrated_engine.dialect.name != "postgresql":
+        pytest.skip("GIN indexes are PostgreSQL-only")
+
+    def _count(db: Any) -> Awaitable[Any]:
+        stmt = select(func.count()).where(_has_skill(db, Job.required_skills, "Kubernetes"))
+        return db.execute(stmt)
+
+    plan = await _plan(migrated_engine, _count)
+    assert "ix_jobs_required_skills_gin" in plan, plan
@@ -11,6 +11,7 @@ from schemas import (
     ApplicationCreate,
     Job,
     JobCreate,
+    MatchBatchRequest,
     MatchDetails,
     MatchResponse,
     MatchSections,
@@ -205,3 +206,47 @@ class TestMatchSchemas:
         assert ms.skills.required.match_rate == 0.0
         assert ms.experience.score == 0.0
         assert ms.education.highest_education is None
+
+    def test_match_batch_size_is_bounded(self) -> None:
+        from core.config import settings
+
+        pair = {"resume_id": 1, "job_id": 2}
+        assert MatchBatchRequest(pairs=[pair] * settings.MATCH_BATCH_MAX_PAIRS)
+        with pytest.raises(ValidationError):
+            MatchBatchRequest(pairs=[pair] * (settings.MATCH_BATCH_MAX_PAIRS + 1))
+
+
+# ---------------------------------------------------------------------------
+# Response serialization
+# ---------------------------------------------------------------------------
+
+
+class TestJsonSerialization:
+    def test_orm_objects_match_the_response_model_output(self) -> None:
+        import json
+
+        from core.serialization import dump_json
+        from models import User as UserModel
+
+        user = UserModel(
+            id=7,
+            email="a@b.com",
+            hashed_password="secret",
+            full_name="Ünïcode Name",
+            is_recruiter=False,
+            is_active=True,
+            created_at=datetime(2025, 1, 2, 3, 4, 5),
+        )
+        encoded = json.loads(dump_json([user], list[User]))
+        expected = User.model_validate(user, from_attributes=True).model_dump(mode="json")
+        assert encoded == [expected]
+        assert "hashed_password" not in encoded[0]
+
+    def test_built_models_and_documents_are_encoded_without_validation(self) -> None:
+        from core.serialization import dump_json
+
+        token = Token.model_construct(access_token="abc", token_type="bearer")
+        assert dump_json(token, Token) == b'{"access_token":"abc","token_type":"bearer"}'
+        assert dump_json({"when": datetime(2025, 1, 2), "n": [1]}) == (
+            b'{"when":"2025-01-02T00:00:00","n":[1]}'
+        )
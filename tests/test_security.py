@@ -10,8 +10,11 @@ from core.security import (
     create_csrf_token,
     decode_access_token,
     get_password_hash,
+    get_password_hash_async,
+    password_needs_rehash,
     verify_csrf_token,
     verify_password,
+    verify_password_async,
 )
 
 # ---------------------------------------------------------------------------
@@ -67,6 +70,22 @@ class TestPasswordHashing:
         h2 = get_password_hash("same-password")
         assert h1 != h2  # bcrypt uses random salt
 
+    def test_needs_rehash_when_cost_changes(self, monkeypatch) -> None:
+        from core.config import settings
+
+        monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 4)
+        hashed = get_password_hash("cost-change")
+        assert hashed.startswith("$2b$04$")
+        assert password_needs_rehash(hashed) is False
+        monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 5)
+        assert password_needs_rehash(hashed) is True
+        assert password_needs_rehash("not-a-bcrypt-hash") is True
+
+    async def test_async_variants_run_on_the_pool(self) -> None:
+        hashed = await get_password_hash_async("pooled")
+        assert await verify_password_async("pooled", hashed)
+        assert await verify_password_async("other", hashed) is False
+
 
 # ---------------------------------------------------------------------------
 # CSRF tokens
@@ -327,3 +327,448 @@ async def test_generate_resume_feedback_fallback(
     assert "missing_skills" in feedback
     assert "keyword_recommendations" in feedback
     assert isinstance(feedback["strengths"], list)
+
+
+# ---------------------------------------------------------------------------
+# RecommendationService (materialized top-K lists)
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_recommendation_lists_keep_top_k(db_session, monkeypatch) -> None:
+    from sqlalchemy import func, select
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    from core.config import settings
+    from models import Job, JobRecommendation, Resume, User
+    from services import recommendation_service
+
+    monkeypatch.setattr(settings, "RECOMMENDATIONS_TOP_K", 2)
+    session_factory = async_sessionmaker(db_session.bind, expire_on_commit=False)
+
+    user = User(email="topk@example.com", hashed_password="x")
+    db_session.add(user)
+    await db_session.flush()
+    resume = Resume(user_id=user.id, skills=[{"name": "Python"}, {"name": "SQL"}])
+    db_session.add(resume)
+    await db_session.commit()
+
+    jobs = []
+    for skills in (["Python", "SQL"], ["Go"], ["Python", "Rust"]):
+        job = Job(
+            company_id=user.id,
+            title="/".join(skills),
+            required_skills=[{"name": name} for name in skills],
+        )
+        db_session.add(job)
+        await db_session.commit()
+        await recommendation_service.refresh_job(session_factory, job.id)
+        jobs.append(job)
+
+    recommended = await recommendation_service.get_recommendations(db_session, resume.id)
+    assert [job.id for job in recommended] == [jobs[0].id, jobs[2].id]
+
+    # Stats read before a concurrent writer filled the list still end at K rows.
+    async def _stale_stats(db, resume_ids):
+        return {}
+
+    monkeypatch.setattr(recommendation_service, "_list_stats", _stale_stats)
+    job = Job(company_id=user.id, title="Go", required_skills=[{"name": "Go"}])
+    db_session.add(job)
+    await db_session.commit()
+    await recommendation_service.refresh_job(session_factory, job.id)
+    count = await db_session.scalar(
+        select(func.count())
+        .select_from(JobRecommendation)
+        .where(JobRecommendation.resume_id == resume.id)
+    )
+    assert count == 2
+
+
+# ---------------------------------------------------------------------------
+# JobService skill demand aggregates
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_ensure_skill_demand_backfills_existing_jobs(db_session) -> None:
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    from models import Job, User
+    from services import job_service
+
+    session_factory = async_sessionmaker(db_session.bind, expire_on_commit=False)
+    user = User(email="backfill@example.com", hashed_password="x", is_recruiter=True)
+    db_session.add(user)
+    await db_session.flush()
+    for skills in (["Python", "SQL"], ["Python", "Python"], []):
+        db_session.add(
+            Job(
+                company_id=user.id,
+                title="job",
+                required_skills=[{"name": name} for name in skills],
+            )
+        )
+    await db_session.commit()
+
+    await job_service.ensure_skill_demand(session_factory)
+
+    analysis = await job_service.get_market_analysis(db_session, user)
+    assert analysis["total_jobs_analyzed"] == 3
+    assert analysis["top_required_skills"] == [
+        {"name": "python", "count": 2},
+        {"name": "sql", "count": 1},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_sql_skill_counts_match_incremental_counters(db_session) -> None:
+    from models import Job, User
+    from services import job_service
+
+    owner = User(email="agg@example.com", hashed_password="x", is_recruiter=True)
+    other = User(email="agg-other@example.com", hashed_password="x", is_recruiter=True)
+    db_session.add_all([owner, other])
+    await db_session.flush()
+    documents = [
+        (owner, [{"name": "Python"}, {"name": " python "}, "SQL"], ["Docker"]),
+        (owner, ["Go", {"importance": 1.0}, {"name": ""}, 42], None),
+        (other, {"name": "Python"}, [{"name": "Docker"}]),
+        (other, [{"name": "Python"}, "go"], []),
+    ]
+    for company, required, preferred in documents:
+        db_session.add(
+            Job(
+                company_id=company.id,
+                title="job",
+                required_skills=required,
+                preferred_skills=preferred,
+            )
+        )
+    await db_session.commit()
+
+    assert await job_service.count_skills(db_session, "required") == [
+        {"name": "go", "count": 2},
+        {"name": "python", "count": 2},
+        {"name": "sql", "count": 1},
+    ]
+    assert await job_service.count_skills(db_session, "required", owner.id, limit=1) == [
+        {"name": "go", "count": 1}
+    ]
+
+    await job_service.rebuild_skill_demand(db_session)
+    for user in (owner, other):
+        analysis = await job_service.get_market_analysis(db_session, user)
+        for kind in ("required", "preferred"):
+            assert analysis[f"top_{kind}_skills"] == await job_service.count_skills(
+                db_session, kind, user.id
+            )
+
+
+# ---------------------------------------------------------------------------
+# TrendService rollups
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_trend_rollup_is_incremental(db_session) -> None:
+    from datetime import date, datetime
+
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    from models import Job, User
+    from services import trend_service
+
+    session_factory = async_sessionmaker(db_session.bind, expire_on_commit=False)
+    user = User(email="trends@example.com", hashed_password="x", is_recruiter=True)
+    db_session.add(user)
+    await db_session.flush()
+
+    def _job(day: int, location: str, is_remote: bool) -> Job:
+        return Job(
+            company_id=user.id,
+            title="job",
+            location=location,
+            is_remote=is_remote,
+            required_skills=[{"name": "Python"}],
+            created_at=datetime(2025, 3, day, 12),
+        )
+
+    # 2025-03-03 is a Monday, so days 3-5 share a week bucket and day 10 starts the next.
+    db_session.add_all([_job(3, "Pune", False), _job(5, "pune ", True)])
+    await db_session.commit()
+    assert await trend_service.roll_up(session_factory, until=datetime(2025, 4, 1)) == 2
+
+    db_session.add(_job(10, "Delhi", False))
+    await db_session.commit()
+    assert await trend_service.roll_up(session_factory, until=datetime(2025, 4, 1)) == 1
+    assert await trend_service.roll_up(session_factory, until=datetime(2025, 4, 1)) == 0
+
+    # A job still inside the lag window holds back the watermark, and every later id with it.
+    db_session.add(_job(31, "Delhi", False))
+    await db_session.commit()
+    db_session.add(_job(20, "Delhi", False))
+    await db_session.commit()
+    assert await trend_service.roll_up(session_factory, until=datetime(2025, 3, 25)) == 0
+    assert await trend_service.roll_up(session_factory, until=datetime(2025, 4, 1)) == 2
+
+    window = {"start": date(2025, 3, 1), "end": date(2025, 3, 31)}
+    weekly = await trend_service.get_trends(db_session, ["Python"], **window)
+    assert weekly["series"][0]["points"] == [
+        {"bucket": date(2025, 3, 3), "count": 2},
+        {"bucket": date(2025, 3, 10), "count": 1},
+        {"bucket": date(2025, 3, 17), "count": 1},
+        {"bucket": date(2025, 3, 31), "count": 1},
+    ]
+
+    daily = await trend_service.get_trends(
+        db_session, ["python"], grain="day", location="Pune", **window
+    )
+    assert [p["bucket"] for p in daily["series"][0]["points"]] == [
+        date(2025, 3, 3),
+        date(2025, 3, 5),
+    ]
+
+    remote = await trend_service.get_trends(db_session, ["python"], is_remote=True, **window)
+    assert remote["series"][0]["points"] == [{"bucket": date(2025, 3, 3), "count": 1}]
+
+
+# ---------------------------------------------------------------------------
+# Keyset pagination
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_keyset_pages_break_created_at_ties_by_id(db_session) -> None:
+    from datetime import datetime
+
+    from core.pagination import next_cursor
+    from models import Job, User
+    from services import job_service
+
+    user = User(email="ties@example.com", hashed_password="x", is_recruiter=True)
+    db_session.add(user)
+    await db_session.flush()
+    same_instant = datetime(2025, 6, 1, 9, 30)
+    jobs = [Job(company_id=user.id, title=f"t{i}", created_at=same_instant) for i in range(5)]
+    db_session.add_all(jobs)
+    await db_session.commit()
+
+    seen, cursor = [], None
+    while True:
+        page = await job_service.get_jobs(db_session, user.id, True, cursor, 2)
+        seen.extend(job.id for job in page)
+        cursor = next_cursor(page, 2)
+        if cursor is None:
+            break
+    assert seen == sorted((job.id for job in jobs), reverse=True)
+
+
+# ---------------------------------------------------------------------------
+# List read models
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_list_summaries_project_only_listed_columns(db_session) -> None:
+    from sqlalchemy import event
+
+    from models import Application, Job, Resume, User
+    from services import job_service, matching_service, resume_service
+
+    recruiter = User(email="slim-rec@example.com", hashed_password="x", is_recruiter=True)
+    seeker = User(email="slim-js@example.com", hashed_password="x")
+    db_session.add_all([recruiter, seeker])
+    await db_session.flush()
+    resume = Resume(
+        user_id=seeker.id,
+        full_text="x" * 10_000,
+        parsed_sections={"contact": {"name": "Jane Doe"}},
+        skills=[{"name": "Python"}, {"name": "SQL"}],
+        experience=None,
+    )
+    job = Job(company_id=recruiter.id, title="Engineer", description_text="y" * 10_000)
+    db_session.add_all([resume, job])
+    await db_session.flush()
+    db_session.add(
+        Application(job_id=job.id, resume_id=resume.id, full_name="Jane", email="j@example.com")
+    )
+    await db_session.commit()
+
+    statements: list[str] = []
+    engine = db_session.bind.sync_engine
+
+    def _record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        (resume_row,) = await resume_service.list_resume_summaries(db_session, seeker.id, False)
+        (job_row,) = await job_service.list_job_summaries(db_session, recruiter.id, True)
+        (app_row,) = await matching_service.list_application_summaries(
+            db_session, recruiter.id, True
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert (resume_row.name, resume_row.skills_count, resume_row.experience_count) == (
+        "Jane Doe",
+        2,
+        0,
+    )
+    assert job_row.title == "Engineer"
+    assert job_row.description_preview == "y" * 150
+    assert (app_row.job_title, app_row.resume_name) == ("Engineer", "Jane Doe")
+    for statement in statements:
+        assert "full_text" not in statement
+        assert statement.count("description_text") == statement.count(
+            "substr(jobs.description_text"
+        )
+
+
+@pytest.mark.asyncio
+async def test_jobs_filter_by_required_skill(db_session) -> None:
+    from models import Job, User
+    from services import job_service
+
+    recruiter = User(email="skill-rec@example.com", hashed_password="x", is_recruiter=True)
+    db_session.add(recruiter)
+    await db_session.flush()
+    db_session.add_all(
+        [
+            Job(
+                company_id=recruiter.id,
+                title="Platform",
+                required_skills=[{"name": "Kubernetes"}, {"name": "Go"}],
+            ),
+            Job(company_id=recruiter.id, title="SRE", required_skills=["Kubernetes", "Python"]),
+            Job(
+                company_id=recruiter.id,
+                title="Backend",
+                required_skills=[{"name": "Python"}],
+                preferred_skills=[{"name": "Kubernetes"}],
+            ),
+            Job(company_id=recruiter.id, title="Empty", required_skills=None),
+        ]
+    )
+    await db_session.commit()
+
+    async def _titles(*skills: str) -> set[str]:
+        jobs = await job_service.get_jobs(db_session, 0, False, required_skills=skills)
+        return {job.title for job in jobs}
+
+    assert await _titles("Kubernetes") == {"Platform", "SRE"}
+    assert await _titles("Kubernetes", "Python") == {"SRE"}
+    assert await _titles("Rust") == set()
+    summaries = await job_service.list_job_summaries(
+        db_session, recruiter.id, True, required_skills=["Go"]
+    )
+    assert [job.title for job in summaries] == ["Platform"]
+
+
+@pytest.mark.asyncio
+async def test_entity_loaders_batch_and_cache_by_id_lookups(db_session) -> None:
+    import asyncio
+
+    from sqlalchemy import event
+
+    from models import Job, User
+    from services import job_service
+
+    recruiter = User(email="loader-rec@example.com", hashed_password="x", is_recruiter=True)
+    db_session.add(recruiter)
+    await db_session.flush()
+    jobs = [Job(company_id=recruiter.id, title=f"Job {i}") for i in range(3)]
+    db_session.add_all(jobs)
+    await db_session.commit()
+    ids = [job.id for job in jobs]
+
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        loaded = await asyncio.gather(
+            *(job_service.get_job(db_session, job_id) for job_id in [*ids, ids[0], 10_000])
+        )
+        assert [job.title if job else None for job in loaded] == [
+            "Job 0",
+            "Job 1",
+            "Job 2",
+            "Job 0",
+            None,
+        ]
+        assert len(statements) == 1
+        assert await job_service.get_job(db_session, ids[1]) is loaded[1]
+        assert len(statements) == 1
+
+        await db_session.commit()
+        await job_service.get_job(db_session, ids[1])
+        assert len(statements) == 2
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+
+@pytest.mark.asyncio
+async def test_resume_artifacts_are_computed_once_and_backfilled(
+    db_session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from datetime import UTC, datetime
+
+    from sqlalchemy import select
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    from models import Resume, Skill, User
+    from services import job_service, resume_artifact_service
+
+    user = User(email="artifact@example.com", hashed_password="x")
+    db_session.add(user)
+    await db_session.flush()
+    resume = Resume(
+        user_id=user.id,
+        full_text="Jane",
+        skills=[{"name": "Python "}, "sql", {"name": "python"}],
+        experience=[
+            {"start_date": "Jan 2015", "end_date": "2018", "achievements": ["Cut costs 20%"]},
+            {"start_date": "2017", "end_date": "Present"},
+        ],
+    )
+    db_session.add(resume)
+    await db_session.commit()
+    resume_id = resume.id
+    factory = async_sessionmaker(db_session.bind, expire_on_commit=False)
+
+    # No AI provider is configured, so only the improvement is left for later.
+    await resume_artifact_service.refresh(factory, resume_id)
+    artifact = await resume_artifact_service.get(db_session, resume_id)
+    assert artifact is not None
+    assert artifact.skill_names == ["python", "sql"]
+    skills = dict((await db_session.execute(select(Skill.name, Skill.id))).tuples().all())
+    assert artifact.skill_ids == sorted(skills[name] for name in ("python", "sql"))
+    assert artifact.years_experience == datetime.now(UTC).year - 2015
+    assert artifact.quality_score["sections"]["experience"] == 10
+    assert artifact.improvement is None
+    quality = await job_service.get_resume_quality_score(resume_id, db_session, user)
+    assert quality == artifact.quality_score
+
+    async def _suggest(_resume):
+        return {"format": ["Tighten the summary."]}
+
+    monkeypatch.setattr(resume_artifact_service, "suggest_improvements", _suggest)
+    assert await resume_artifact_service.backfill(factory) == 1
+    assert await resume_artifact_service.backfill(factory) == 0
+    db_session.expire_all()
+    improvement = await job_service.get_resume_improvement(resume_id, db_session, user)
+    assert improvement == {"format": ["Tighten the summary."]}
+
+    monkeypatch.setattr(type(resume_artifact_service), "VERSION", 3)
+    assert await resume_artifact_service.get(db_session, resume_id) is None
+    # A view that had to ask the provider keeps the answer for later views and backfill.
+    improvement = await job_service.get_resume_improvement(resume_id, db_session, user)
+    assert improvement == {"format": ["Tighten the summary."]}
+    db_session.expire_all()
+    assert await resume_artifact_service.get(db_session, resume_id) is not None
+    assert await resume_artifact_service.backfill(factory) == 0
@@ -0,0 +1,116 @@
+"""Tests for db/writer.py – group commits through the single-writer coordinator."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from db.database import Base, configure_sqlite
+from db.writer import WriteCoordinator
+from models import User
+from services import user_service
+
+
+@pytest_asyncio.fixture
+async def file_engine(tmp_path: Path) -> AsyncIterator[AsyncEngine]:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'writer.db'}")
+    configure_sqlite(engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def coordinator(file_engine: AsyncEngine) -> AsyncIterator[WriteCoordinator]:
+    writer = WriteCoordinator(async_sessionmaker(file_engine, expire_on_commit=False))
+    writer.start()
+    yield writer
+    await writer.stop()
+
+
+def _add_user(email: str):
+    async def _op(session: AsyncSession) -> User:
+        user = User(email=email, hashed_password="x", full_name=email)
+        session.add(user)
+        await session.flush()
+        return user
+
+    return _op
+
+
+async def _user_count(engine: AsyncEngine) -> int:
+    async with engine.connect() as conn:
+        return (await conn.execute(select(func.count()).select_from(User))).scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writes_share_commits(
+    coordinator: WriteCoordinator, file_engine: AsyncEngine
+) -> None:
+    commits = 0
+
+    def _count_commit(_conn: object) -> None:
+        nonlocal commits
+        commits += 1
+
+    event.listen(file_engine.sync_engine, "commit", _count_commit)
+    users = await asyncio.gather(
+        *(coordinator.execute(None, _add_user(f"u{i}@example.com")) for i in range(50))
+    )
+
+    assert [user.email for user in users] == [f"u{i}@example.com" for i in range(50)]
+    assert len({user.id for user in users}) == 50
+    assert await _user_count(file_engine) == 50
+    assert commits < 50
+
+
+@pytest.mark.asyncio
+async def test_failed_write_only_fails_its_caller(
+    coordinator: WriteCoordinator, file_engine: AsyncEngine
+) -> None:
+    results = await asyncio.gather(
+        coordinator.execute(None, _add_user("a@example.com")),
+        coordinator.execute(None, _add_user("dup@example.com")),
+        coordinator.execute(None, _add_user("dup@example.com")),
+        coordinator.execute(None, _add_user("b@example.com")),
+        return_exceptions=True,
+    )
+
+    assert [isinstance(result, Exception) for result in results] == [False, False, True, False]
+    assert await _user_count(file_engine) == 3
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_queued_writes(file_engine: AsyncEngine) -> None:
+    writer = WriteCoordinator(async_sessionmaker(file_engine, expire_on_commit=False))
+    writer.start()
+    pending = [
+        asyncio.create_task(writer.execute(None, _add_user(f"s{i}@example.com"))) for i in range(5)
+    ]
+    await asyncio.sleep(0)
+    await writer.stop()
+
+    assert all(task.done() for task in pending)
+    assert await _user_count(file_engine) == 5
+    assert not writer.running
+
+
+@pytest.mark.asyncio
+async def test_execute_commits_on_caller_session_when_stopped(db_session: AsyncSession) -> None:
+    writer = WriteCoordinator(async_sessionmaker())
+    user = await writer.execute(db_session, _add_user("direct@example.com"))
+
+    assert user.id is not None
+    assert await user_service.get_user_by_email(db_session, "direct@example.com") is not None
@@ -1,36 +1,86 @@
+import asyncio
+from collections.abc import Awaitable
 from datetime import UTC, datetime, timedelta
-from typing import Annotated, Any
-
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile, status
-from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
-from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Annotated, Any, Literal
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Request,
+    UploadFile,
+    status,
+)
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from api import get_current_user
+from api import admit_expensive_request, get_current_user
+from core.cache import TTLCache
 from core.config import settings
-from core.i18n import normalize_locale, translate
+from core.i18n import normalize_locale, translator
+from core.pagecache import PageCache
+from core.pagination import next_cursor
 from core.security import (
     create_access_token,
     create_csrf_token,
     decode_access_token,
-    get_password_hash,
+    get_password_hash_async,
+    password_needs_rehash,
     verify_csrf_token,
-    verify_password,
+    verify_password_async,
 )
-from db.database import get_db
-from models import User
+from core.templating import LocalizedTemplates
+from db.database import get_db, get_read_db, get_session_factory
 from schemas import TokenPayload
-from services import job_service, matching_service, resume_service, user_service
+from services import (
+    Principal,
+    job_service,
+    matching_service,
+    recommendation_service,
+    resume_artifact_service,
+    resume_service,
+    user_service,
+)
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
+templates = LocalizedTemplates(directory="templates")
 
+PAGE_SIZE = 24
 
-# Helper for template context
-async def get_user_context(request: Request, current_user: User | None = None):
+page_cache = PageCache(
+    "templates",
+    settings.BUILD_ID,
+    maxsize=settings.PAGE_CACHE_MAX_SIZE,
+    ttl=settings.PAGE_CACHE_TTL_SECONDS,
+)
+
+# Resume detail side panels: template variable, load timeout in seconds, and a per-panel
+# cache keyed by resume version.
+RESUME_PANELS: dict[
+    str, tuple[str, float, TTLCache[tuple[int, datetime, datetime | None], Any]]
+] = {
+    "quality": ("quality_score", 5, TTLCache(1024, 600)),
+    "improvement": (
+        "improvement",
+        settings.RESUME_IMPROVEMENT_TIMEOUT_SECONDS,
+        TTLCache(1024, 3600),
+    ),
+    "recommendations": ("recommendations", 5, TTLCache(1024, 60)),
+}
+
+
+def request_locale(request: Request) -> str:
     locale_cookie = request.cookies.get("locale")
     locale_header = request.headers.get("accept-language")
-    locale = normalize_locale(locale_cookie or locale_header or settings.DEFAULT_LOCALE)
+    return normalize_locale(locale_cookie or locale_header or settings.DEFAULT_LOCALE)
+
+
+# Helper for template context
+async def get_user_context(request: Request, current_user: Principal | None = None):
+    locale = request_locale(request)
 
     csrf_token = create_csrf_token(current_user.id) if current_user else ""
 
@@ -42,18 +92,59 @@ async def get_user_context(request: Request, current_user: User | None = None):
         "locale": locale,
         "supported_locales": settings.SUPPORTED_LOCALES,
         "csrf_token": csrf_token,
-        "t": lambda key: translate(locale, key),
+        "t": translator(locale),
     }
 
 
-def validate_csrf_or_400(current_user: User, csrf_token: str):
+async def fetch_page(rows: Awaitable[list[Any]]) -> list[Any]:
+    try:
+        return await rows
+    except ValueError as err:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        ) from err
+
+
+def render_list(
+    template: str, context: dict[str, Any], name: str, rows: list[Any], partial: bool
+) -> HTMLResponse:
+    """Render a list page, or only its rows plus the next "load more" slot when ``partial``."""
+    context[name] = rows
+    context["next_cursor"] = next_cursor(rows, PAGE_SIZE)
+    if partial:
+        template = template.replace("index.html", "_page.html")
+    return templates.TemplateResponse(template, context)
+
+
+async def render_anonymous_page(request: Request, template: str, active_page: str) -> Response:
+    """Render a page that every anonymous visitor sees alike, via ``page_cache``.
+
+    Requests with a query string can change the page (e.g. ``/login?registered=true``),
+    so they are always rendered.
+    """
+    if request.url.query:
+        context = await get_user_context(request)
+        context["active_page"] = active_page
+        return templates.TemplateResponse(template, context)
+
+    locale = request_locale(request)
+    key = (str(request.url), locale)
+    page = page_cache.get(key)
+    if page is None:
+        context = await get_user_context(request)
+        context["active_page"] = active_page
+        page = page_cache.put(key, templates.get_template(template, locale).render(context))
+    return page_cache.respond(request, page)
+
+
+def validate_csrf_or_400(current_user: Principal, csrf_token: str):
     if not verify_csrf_token(csrf_token, current_user.id):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid CSRF token")
 
 
 async def get_optional_user(
     request: Request, db: Annotated[AsyncSession, Depends(get_db)]
-) -> User | None:
+) -> Principal | None:
     token = request.cookies.get(settings.AUTH_COOKIE_NAME)
     if not token:
         return None
@@ -64,8 +155,8 @@ async def get_optional_user(
     try:
         payload = decode_access_token(token)
         token_data = TokenPayload(**payload)
-        user = await user_service.get_user_by_id(db, token_data.sub)
-        if not user or not user.is_active:
+        user = await user_service.get_principal(db, int(token_data.sub))
+        if not user or not user.is_active or not user.issued(token_data.ver):
             return None
         return user
     except Exception:
@@ -74,7 +165,11 @@ async def get_optional_user(
 
 # Home page
 @router.get("/", response_class=HTMLResponse)
-async def home(request: Request, current_user: Annotated[User | None, Depends(get_optional_user)]):
+async def home(
+    request: Request, current_user: Annotated[Principal | None, Depends(get_optional_user)]
+):
+    if current_user is None:
+        return await render_anonymous_page(request, "index.html", "home")
     context = await get_user_context(request, current_user)
     context["active_page"] = "home"
     return templates.TemplateResponse("index.html", context)
@@ -83,9 +178,7 @@ async def home(request: Request, current_user: Annotated[User | None, Depends(ge
 # Auth routes
 @router.get("/login", response_class=HTMLResponse)
 async def login_page(request: Request):
-    context = await get_user_context(request)
-    context["active_page"] = "login"
-    return templates.TemplateResponse("auth/login.html", context)
+    return await render_anonymous_page(request, "auth/login.html", "login")
 
 
 @router.post("/login")
@@ -96,13 +189,22 @@ async def login_submit(
     password: str = Form(...),
 ):
     user = await user_service.get_user_by_email(db, email)
-    if not user or not user.is_active or not verify_password(password, user.hashed_password):
+    if (
+        not user
+        or not user.is_active
+        or not await verify_password_async(password, user.hashed_password)
+    ):
         context = await get_user_context(request)
         context["error"] = "Invalid email or password"
         return templates.TemplateResponse("auth/login.html", context, status_code=400)
+    if password_needs_rehash(user.hashed_password):
+        hashed_password = await get_password_hash_async(password)
+        await user_service.update_password_hash(db, user.id, hashed_password)
 
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(user.id, expires_delta=access_token_expires)
+    access_token = create_access_token(
+        user.id, expires_delta=access_token_expires, version=user.auth_version
+    )
 
     response = RedirectResponse(url="/dashboard", status_code=status.HTTP_303_SEE_OTHER)
     response.set_cookie(
@@ -118,9 +220,7 @@ async def login_submit(
 
 @router.get("/register", response_class=HTMLResponse)
 async def register_page(request: Request):
-    context = await get_user_context(request)
-    context["active_page"] = "register"
-    return templates.TemplateResponse("auth/register.html", context)
+    return await render_anonymous_page(request, "auth/register.html", "register")
 
 
 @router.post("/register")
@@ -140,7 +240,7 @@ async def register_submit(
 
     user_data = {"email": email, "full_name": full_name, "is_recruiter": is_recruiter}
 
-    hashed_password = get_password_hash(password)
+    hashed_password = await get_password_hash_async(password)
     await user_service.create_user(db, user_data, hashed_password)
 
     return RedirectResponse(url="/login?registered=true", status_code=status.HTTP_303_SEE_OTHER)
@@ -173,15 +273,17 @@ async def set_locale(locale: str = Form(...), redirect_to: str = Form("/")):
 async def dashboard(
     request: Request,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     context = await get_user_context(request, current_user)
     context["active_page"] = "dashboard"
 
     if current_user.is_recruiter:
         # Recruiter dashboard
-        jobs = await job_service.get_jobs(db, current_user.id, current_user.is_recruiter, limit=5)
-        applications = await matching_service.get_applications(
+        jobs = await job_service.list_job_summaries(
+            db, current_user.id, current_user.is_recruiter, limit=5
+        )
+        applications = await matching_service.list_application_summaries(
             db, current_user.id, current_user.is_recruiter, limit=10
         )
 
@@ -196,13 +298,15 @@ async def dashboard(
         return templates.TemplateResponse("dashboard/recruiter.html", context)
     else:
         # Job seeker dashboard
-        resumes = await resume_service.get_resumes(
+        resumes = await resume_service.list_resume_summaries(
             db, current_user.id, current_user.is_recruiter, limit=5
         )
-        applications = await matching_service.get_applications(
+        applications = await matching_service.list_application_summaries(
             db, current_user.id, current_user.is_recruiter, limit=10
         )
-        jobs = await job_service.get_jobs(db, current_user.id, current_user.is_recruiter, limit=5)
+        jobs = await job_service.list_job_summaries(
+            db, current_user.id, current_user.is_recruiter, limit=5
+        )
 
         context["resumes"] = resumes
         context["applications"] = applications
@@ -214,9 +318,9 @@ async def dashboard(
         }
 
         if resumes:
-            # Get job recommendations for the first resume
-            recommendations = await job_service.get_jobs(
-                db, current_user.id, current_user.is_recruiter, limit=3
+            # Precomputed job recommendations for the first resume
+            recommendations = await recommendation_service.get_recommendation_summaries(
+                db, resumes[0].id, limit=3
             )
             context["recommendations"] = recommendations
 
@@ -227,28 +331,35 @@ async def dashboard(
 @router.get("/resumes", response_class=HTMLResponse)
 async def resumes(
     request: Request,
+    cursor: str | None = None,
+    partial: bool = False,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     context = await get_user_context(request, current_user)
     context["active_page"] = "resumes"
-    resumes = await resume_service.get_resumes(db, current_user.id, current_user.is_recruiter)
-    context["resumes"] = resumes
-    return templates.TemplateResponse("resumes/index.html", context)
+    resumes = await fetch_page(
+        resume_service.list_resume_summaries(
+            db, current_user.id, current_user.is_recruiter, cursor, PAGE_SIZE
+        )
+    )
+    return render_list("resumes/index.html", context, "resumes", resumes, partial)
 
 
 @router.get("/resumes/create", response_class=HTMLResponse)
-async def create_resume_page(request: Request, current_user: User = Depends(get_current_user)):
+async def create_resume_page(request: Request, current_user: Principal = Depends(get_current_user)):
     context = await get_user_context(request, current_user)
     context["active_page"] = "resumes"
     return templates.TemplateResponse("resumes/create.html", context)
 
 
-@router.post("/resumes/create")
+@router.post("/resumes/create", dependencies=[Depends(admit_expensive_request)])
 async def create_resume_submit(
     request: Request,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+    current_user: Principal = Depends(get_current_user),
     resume_text: str | None = Form(None),
     resume_file: UploadFile | None = File(None),
     csrf_token: str = Form(...),
@@ -267,6 +378,8 @@ async def create_resume_submit(
             result = await resume_service.process_resume_text(resume_text)
 
         resume = await resume_service.create_resume(db, current_user.id, result)
+        background_tasks.add_task(recommendation_service.rebuild_resume, session_factory, resume.id)
+        background_tasks.add_task(resume_artifact_service.refresh, session_factory, resume.id)
         return RedirectResponse(url=f"/resumes/{resume.id}", status_code=status.HTTP_303_SEE_OTHER)
     except Exception as e:
         context = await get_user_context(request, current_user)
@@ -279,7 +392,7 @@ async def resume_detail(
     request: Request,
     id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     resume = await resume_service.get_resume(db, id)
     if not resume:
@@ -291,40 +404,92 @@ async def resume_detail(
     context = await get_user_context(request, current_user)
     context["active_page"] = "resumes"
     context["resume"] = resume
+    # The side panels load as separate fragments so the page itself costs one DB read.
+    context["panels"] = [
+        panel
+        for panel in RESUME_PANELS
+        if panel != "recommendations" or not current_user.is_recruiter
+    ]
+    return templates.TemplateResponse("resumes/detail.html", context)
 
-    # Get improvement suggestions
-    improvement = await job_service.get_resume_improvement(id, db, current_user)
-    context["improvement"] = improvement
 
-    # Get quality score
-    quality_score = await job_service.get_resume_quality_score(id, db, current_user)
-    context["quality_score"] = quality_score
+async def _load_improvement(
+    request: Request, resume_id: int, db: AsyncSession, current_user: Principal
+) -> tuple[dict[str, Any], bool]:
+    """The improvement panel's suggestions and whether they may be cached.
 
-    # Get job recommendations if not recruiter
-    if not current_user.is_recruiter:
-        recommendations = await job_service.get_recommendations(resume.id, db, current_user)
-        context["recommendations"] = recommendations
+    Only a miss reaches the AI provider, so only a miss goes through the admission control
+    of the matching API route. The heuristic fallback is never cached, so a provider error
+    does not pin it for the panel's whole TTL.
+    """
+    stored = await job_service.stored_resume_improvement(db, resume_id)
+    if stored is not None:
+        return stored, True
+    await admit_expensive_request(request, current_user)
+    return await job_service.suggest_resume_improvement(db, resume_id)
 
-    return templates.TemplateResponse("resumes/detail.html", context)
+
+@router.get("/resumes/{id}/panels/{panel}", response_class=HTMLResponse)
+async def resume_panel(
+    request: Request,
+    id: int,
+    panel: Literal["quality", "improvement", "recommendations"],
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    resume = await resume_service.get_resume(db, id)
+    if not resume or (not current_user.is_recruiter and resume.user_id != current_user.id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resume not found")
+    if panel == "recommendations" and current_user.is_recruiter:
+        return HTMLResponse("")
+
+    context = await get_user_context(request, current_user)
+    name, timeout, cache = RESUME_PANELS[panel]
+    # Editing a resume bumps updated_at, which retires its cached panels.
+    key = (resume.id, resume.created_at, resume.updated_at)
+    value = cache.get(key)
+    if value is None:
+        cacheable = True
+        try:
+            if panel == "quality":
+                value = await asyncio.wait_for(
+                    job_service.get_resume_quality_score(id, db, current_user), timeout
+                )
+            elif panel == "improvement":
+                value, cacheable = await asyncio.wait_for(
+                    _load_improvement(request, id, db, current_user), timeout
+                )
+            else:
+                value = await asyncio.wait_for(
+                    recommendation_service.get_recommendation_summaries(db, resume.id), timeout
+                )
+        except TimeoutError:
+            return templates.TemplateResponse("resumes/_panel_unavailable.html", context)
+        except HTTPException as exc:
+            # Admission control turned the provider call away; the page around it still works.
+            if exc.status_code not in (
+                status.HTTP_429_TOO_MANY_REQUESTS,
+                status.HTTP_503_SERVICE_UNAVAILABLE,
+            ):
+                raise
+            return templates.TemplateResponse("resumes/_panel_unavailable.html", context)
+        if cacheable:
+            cache.set(key, value)
+    context[name] = value
+    return templates.TemplateResponse(f"resumes/_panel_{panel}.html", context)
 
 
 @router.post("/resumes/{id}/delete")
 async def delete_resume_submit(
     id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     csrf_token: str = Form(...),
 ):
     validate_csrf_or_400(current_user, csrf_token)
 
-    resume = await resume_service.get_resume(db, id)
-    if not resume:
-        return RedirectResponse(url="/resumes", status_code=status.HTTP_303_SEE_OTHER)
-
-    if resume.user_id != current_user.id and not current_user.is_recruiter:
-        return RedirectResponse(url="/resumes", status_code=status.HTTP_303_SEE_OTHER)
-
-    await resume_service.delete_resume(db, id)
+    owner_id = None if current_user.is_recruiter else current_user.id
+    await resume_service.delete_resume(db, id, owner_id)
     return RedirectResponse(url="/resumes", status_code=status.HTTP_303_SEE_OTHER)
 
 
@@ -332,18 +497,26 @@ async def delete_resume_submit(
 @router.get("/jobs", response_class=HTMLResponse)
 async def jobs(
     request: Request,
+    cursor: str | None = None,
+    partial: bool = False,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    read_db: AsyncSession = Depends(get_read_db),
+    current_user: Principal = Depends(get_current_user),
 ):
     context = await get_user_context(request, current_user)
     context["active_page"] = "jobs"
-    jobs = await job_service.get_jobs(db, current_user.id, current_user.is_recruiter)
-    context["jobs"] = jobs
-    return templates.TemplateResponse("jobs/index.html", context)
+    # Recruiters list their own postings, so they read from the primary.
+    source = db if current_user.is_recruiter else read_db
+    jobs = await fetch_page(
+        job_service.list_job_summaries(
+            source, current_user.id, current_user.is_recruiter, cursor, PAGE_SIZE
+        )
+    )
+    return render_list("jobs/index.html", context, "jobs", jobs, partial)
 
 
 @router.get("/jobs/create", response_class=HTMLResponse)
-async def create_job_page(request: Request, current_user: User = Depends(get_current_user)):
+async def create_job_page(request: Request, current_user: Principal = Depends(get_current_user)):
     if not current_user.is_recruiter:
         return RedirectResponse(url="/jobs", status_code=status.HTTP_303_SEE_OTHER)
 
@@ -355,8 +528,10 @@ async def create_job_page(request: Request, current_user: User = Depends(get_cur
 @router.post("/jobs/create")
 async def create_job_submit(
     request: Request,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+    current_user: Principal = Depends(get_current_user),
     title: str = Form(...),
     description_text: str = Form(...),
     csrf_token: str = Form(...),
@@ -371,6 +546,7 @@ async def create_job_submit(
         job = await job_service.create_job(
             db, current_user.id, result, {"title": title, "description_text": description_text}
         )
+        background_tasks.add_task(recommendation_service.refresh_job, session_factory, job.id)
         return RedirectResponse(url=f"/jobs/{job.id}", status_code=status.HTTP_303_SEE_OTHER)
     except Exception as e:
         context = await get_user_context(request, current_user)
@@ -385,7 +561,7 @@ async def job_detail(
     request: Request,
     id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     job = await job_service.get_job(db, id)
     if not job:
@@ -402,7 +578,8 @@ async def job_detail(
 
     # Get resumes if job seeker for applying
     if not current_user.is_recruiter:
-        resumes = await resume_service.get_resumes(db, current_user.id, False)
+        # The apply form's dropdown only needs ids and dates, not the resume documents.
+        resumes = await resume_service.list_resume_summaries(db, current_user.id, False)
         context["resumes"] = resumes
 
         # Check if user already applied
@@ -417,7 +594,7 @@ async def edit_job_page(
     request: Request,
     id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     if not current_user.is_recruiter:
         return RedirectResponse(url="/jobs", status_code=status.HTTP_303_SEE_OTHER)
@@ -436,8 +613,10 @@ async def edit_job_page(
 async def edit_job_submit(
     request: Request,
     id: int,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+    current_user: Principal = Depends(get_current_user),
     title: str = Form(...),
     description_text: str = Form(...),
     csrf_token: str = Form(...),
@@ -462,6 +641,7 @@ async def edit_job_submit(
             "qualifications": result.get("qualifications", []),
         }
         await job_service.update_job(db, id, update_data)
+        background_tasks.add_task(recommendation_service.refresh_job, session_factory, id)
         return RedirectResponse(url=f"/jobs/{id}", status_code=status.HTTP_303_SEE_OTHER)
     except Exception as e:
         context = await get_user_context(request, current_user)
@@ -475,8 +655,10 @@ async def edit_job_submit(
 @router.post("/jobs/{id}/delete")
 async def delete_job_submit(
     id: int,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+    current_user: Principal = Depends(get_current_user),
     csrf_token: str = Form(...),
 ):
     validate_csrf_or_400(current_user, csrf_token)
@@ -484,11 +666,11 @@ async def delete_job_submit(
     if not current_user.is_recruiter:
         return RedirectResponse(url="/jobs", status_code=status.HTTP_303_SEE_OTHER)
 
-    job = await job_service.get_job(db, id)
-    if not job or job.company_id != current_user.id:
-        return RedirectResponse(url="/jobs", status_code=status.HTTP_303_SEE_OTHER)
-
-    await job_service.delete_job(db, id)
+    listed_in = await job_service.delete_job(db, id, current_user.id)
+    if listed_in is not None:
+        background_tasks.add_task(
+            recommendation_service.rebuild_resumes, session_factory, listed_in
+        )
     return RedirectResponse(url="/jobs", status_code=status.HTTP_303_SEE_OTHER)
 
 
@@ -496,49 +678,28 @@ async def delete_job_submit(
 @router.get("/applications", response_class=HTMLResponse)
 async def applications(
     request: Request,
+    cursor: str | None = None,
+    partial: bool = False,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     context = await get_user_context(request, current_user)
     context["active_page"] = "applications"
-    applications = await matching_service.get_applications(
-        db, current_user.id, current_user.is_recruiter
-    )
-
-    # Batch-fetch jobs and resumes to avoid N+1 queries
-    job_ids = {app.job_id for app in applications}
-    resume_ids = {app.resume_id for app in applications}
-
-    jobs_map: dict[int, Any] = {}
-    resumes_map: dict[int, Any] = {}
-    for jid in job_ids:
-        j = await job_service.get_job(db, jid)
-        if j:
-            jobs_map[jid] = j
-    for rid in resume_ids:
-        r = await resume_service.get_resume(db, rid)
-        if r:
-            resumes_map[rid] = r
-
-    for app in applications:
-        job = jobs_map.get(app.job_id)
-        resume = resumes_map.get(app.resume_id)
-        app.job_title = job.title if job else "Unknown Job"
-        app.resume_name = (
-            resume.parsed_sections.get("contact", {}).get("name", "Unnamed Resume")
-            if resume
-            else "Unknown Resume"
+    applications = await fetch_page(
+        matching_service.list_application_summaries(
+            db, current_user.id, current_user.is_recruiter, cursor=cursor, limit=PAGE_SIZE
         )
-
-    context["applications"] = applications
-    return templates.TemplateResponse("applications/index.html", context)
+    )
+    return render_list("applications/index.html", context, "applications", applications, partial)
 
 
 @router.post("/applications/create")
 async def create_application(
     request: Request,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+    current_user: Principal = Depends(get_current_user),
     job_id: int = Form(...),
     resume_id: int = Form(...),
     csrf_token: str = Form(...),
@@ -578,21 +739,12 @@ async def create_application(
         "phone": contact_info.get("phone", ""),
     }
 
-    # Match resume to job
-    score, match_details, feedback = await matching_service.match_resume_to_job(
-        resume.parsed_sections,
-        {
-            "title": job.title,
-            "required_skills": job.required_skills,
-            "preferred_skills": job.preferred_skills,
-            "responsibilities": job.responsibilities,
-            "qualifications": job.qualifications,
-        },
-    )
-
-    application = await matching_service.create_application(
-        db, application_data, score, match_details, feedback
-    )
+    # Score now, or store a provisional score and finish scoring in the background
+    application = await matching_service.apply(db, application_data, resume, job)
+    if application.scoring_status == "pending":
+        background_tasks.add_task(
+            matching_service.score_application, session_factory, application.id
+        )
     return RedirectResponse(
         url=f"/applications/{application.id}", status_code=status.HTTP_303_SEE_OTHER
     )
@@ -603,7 +755,7 @@ async def application_detail(
     request: Request,
     id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     application_data = await matching_service.get_application(db, id)
     if not application_data:
@@ -634,7 +786,7 @@ async def update_application_status(
     id: int,
     status_value: str = Form(..., alias="status"),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     csrf_token: str = Form(...),
 ):
     validate_csrf_or_400(current_user, csrf_token)
@@ -642,20 +794,14 @@ async def update_application_status(
     if not current_user.is_recruiter:
         return RedirectResponse(url="/applications", status_code=status.HTTP_303_SEE_OTHER)
 
-    application_data = await matching_service.get_application(db, id)
-    if not application_data:
-        return RedirectResponse(url="/applications", status_code=status.HTTP_303_SEE_OTHER)
-
-    application, job, _ = application_data
-
-    if job.company_id != current_user.id:
-        return RedirectResponse(url="/applications", status_code=status.HTTP_303_SEE_OTHER)
-
     valid_statuses = ["New", "Reviewed", "Shortlisted", "Rejected"]
     if status_value not in valid_statuses:
         return RedirectResponse(url=f"/applications/{id}", status_code=status.HTTP_303_SEE_OTHER)
 
-    await matching_service.update_application_status(db, id, status_value)
+    if not await matching_service.update_application_status(
+        db, id, status_value, company_id=current_user.id
+    ):
+        return RedirectResponse(url="/applications", status_code=status.HTTP_303_SEE_OTHER)
     return RedirectResponse(url=f"/applications/{id}", status_code=status.HTTP_303_SEE_OTHER)
 
 
@@ -663,8 +809,8 @@ async def update_application_status(
 @router.get("/analysis", response_class=HTMLResponse)
 async def market_analysis(
     request: Request,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: Principal = Depends(get_current_user),
 ):
     if not current_user.is_recruiter:
         return RedirectResponse(url="/dashboard", status_code=status.HTTP_303_SEE_OTHER)
@@ -683,7 +829,7 @@ async def market_analysis(
 async def skills_gap(
     request: Request,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     if current_user.is_recruiter:
         return RedirectResponse(url="/dashboard", status_code=status.HTTP_303_SEE_OTHER)
@@ -691,8 +837,9 @@ async def skills_gap(
     context = await get_user_context(request, current_user)
     context["active_page"] = "skills_gap"
 
-    resumes = await resume_service.get_resumes(db, current_user.id, False)
-    jobs = await job_service.get_jobs(db, current_user.id, False)
+    # The dropdowns render names and titles only; summaries skip the full texts.
+    resumes = await resume_service.list_resume_summaries(db, current_user.id, False)
+    jobs = await job_service.list_job_summaries(db, current_user.id, False)
     context["resumes"] = resumes
     context["jobs"] = jobs
 